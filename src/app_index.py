@@ -0,0 +1,335 @@
+import json
+import logging
+import os
+import re
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional
+from config_manager import get_config_manager
+
+# Kayıt defterinde kurulu uygulamaların bulunduğu anahtarlar
+REGISTRY_PATHS = [
+    r"SOFTWARE\Microsoft\Windows\CurrentVersion\App Paths",
+    r"SOFTWARE\Microsoft\Windows\CurrentVersion\Uninstall",
+    r"SOFTWARE\WOW6432Node\Microsoft\Windows\CurrentVersion\Uninstall"
+]
+
+# Sesli komutlarda sık kullanılan takma adlar
+DEFAULT_ALIASES = {
+    "chrome": "chrome.exe",
+    "google chrome": "chrome.exe",
+    "cursor": "cursor.exe",
+    "cursor editör": "cursor.exe",
+    "cursor editor": "cursor.exe",
+    "vscode": "code.exe",
+    "visual studio code": "code.exe",
+    "notepad": "notepad.exe"
+}
+
+INDEX_FORMAT_VERSION = 1
+
+# Süreç genelinde paylaşılan örnek
+_shared_instance = None
+_shared_lock = threading.Lock()
+
+def get_app_index() -> "AppIndex":
+    """Süreç genelinde paylaşılan uygulama indeksini getir"""
+    global _shared_instance
+    if _shared_instance is None:
+        with _shared_lock:
+            if _shared_instance is None:
+                _shared_instance = AppIndex()
+                # Diskteki indeks hemen kullanılabilir, tazeleme arka planda yapılır
+                _shared_instance.refresh_async()
+    return _shared_instance
+
+class AppIndex:
+    """Kurulu uygulamaların diskte saklanan, artımlı olarak tazelenen indeksi"""
+
+    def __init__(self, index_config: Optional[dict] = None):
+        self.logger = logging.getLogger("AICodeEditor.AppIndex")
+        if index_config is None:
+            index_config = get_config_manager().get_config("system", {}).get("app_index", {})
+
+        self.index_file = Path(index_config.get("index_file", "data/app_index.json"))
+        self.scan_roots = self._resolve_roots(index_config.get("scan_roots") or self._default_scan_roots())
+        self.extensions = tuple(ext.lower() for ext in index_config.get("extensions", [".exe"]))
+        self.scan_registry = index_config.get("scan_registry", True)
+        self.aliases = {**DEFAULT_ALIASES, **index_config.get("aliases", {})}
+
+        self._lock = threading.RLock()
+        self._refresh_thread = None
+
+        # Dizin önbelleği: yol -> {"mtime": ns, "apps": [...], "subdirs": [...]}
+        self._dirs: Dict[str, dict] = {}
+        # Kayıt defteri önbelleği: anahtar yolu -> {"mtime": int, "apps": {...}}
+        self._registry: Dict[str, dict] = {}
+
+        self.apps: Dict[str, dict] = {}
+        self.version = 0
+        self.last_refresh = None
+        self.last_refresh_stats = {}
+
+        self._load()
+        self._rebuild_apps()
+
+    def _default_scan_roots(self) -> List[str]:
+        """Windows için varsayılan Program Files dizinleri"""
+        local_app_data = os.environ.get("LocalAppData", "")
+        return [
+            os.environ.get("ProgramFiles", "C:/Program Files"),
+            os.environ.get("ProgramFiles(x86)", "C:/Program Files (x86)"),
+            local_app_data,
+            os.path.join(local_app_data, "Programs") if local_app_data else "",
+            os.environ.get("AppData", "")
+        ]
+
+    def _resolve_roots(self, roots: List[str]) -> List[str]:
+        """Ortam değişkenlerini aç ve boş/tekrarlanan kökleri ele"""
+        resolved = []
+        for root in roots:
+            if not root:
+                continue
+            path = os.path.normpath(os.path.expandvars(os.path.expanduser(root)))
+            if path not in resolved:
+                resolved.append(path)
+        return resolved
+
+    def _load(self):
+        """Diskteki indeksi yükle"""
+        try:
+            if not self.index_file.exists():
+                return
+
+            with open(self.index_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+
+            if data.get("format") != INDEX_FORMAT_VERSION:
+                self.logger.info("Uygulama indeksi biçimi eski, yeniden oluşturulacak")
+                return
+
+            self._dirs = data.get("dirs", {})
+            self._registry = data.get("registry", {})
+            self.last_refresh = data.get("updated_at")
+
+        except Exception as e:
+            self.logger.error(f"Uygulama indeksi yükleme hatası: {str(e)}")
+            self._dirs = {}
+            self._registry = {}
+
+    def _save(self):
+        """İndeksi diske kaydet"""
+        try:
+            self.index_file.parent.mkdir(parents=True, exist_ok=True)
+            data = {
+                "format": INDEX_FORMAT_VERSION,
+                "updated_at": self.last_refresh,
+                "roots": self.scan_roots,
+                "dirs": self._dirs,
+                "registry": self._registry
+            }
+
+            # Yarım yazılmış dosya bırakmamak için önce geçici dosyaya yaz
+            temp_file = self.index_file.with_suffix(".tmp")
+            with open(temp_file, 'w', encoding='utf-8') as f:
+                json.dump(data, f, ensure_ascii=False)
+            os.replace(temp_file, self.index_file)
+
+        except Exception as e:
+            self.logger.error(f"Uygulama indeksi kaydetme hatası: {str(e)}")
+
+    def _scan_directories(self, stats: dict) -> Dict[str, dict]:
+        """Kök dizinleri tara, mtime'ı değişmeyen dizinlerin önbelleğini kullan"""
+        new_dirs = {}
+        stack = [root for root in reversed(self.scan_roots)]
+
+        while stack:
+            path = stack.pop()
+            if path in new_dirs:
+                continue
+
+            try:
+                mtime = os.stat(path).st_mtime_ns
+            except OSError:
+                continue
+
+            cached = self._dirs.get(path)
+            if cached and cached.get("mtime") == mtime:
+                # Dizin içeriği değişmedi; dosya listesini yeniden okuma
+                entry = cached
+                stats["reused"] += 1
+            else:
+                apps = []
+                subdirs = []
+                try:
+                    with os.scandir(path) as it:
+                        for item in it:
+                            try:
+                                if item.is_dir(follow_symlinks=False):
+                                    subdirs.append(item.path)
+                                elif item.name.lower().endswith(self.extensions):
+                                    apps.append(item.name)
+                            except OSError:
+                                continue
+                except OSError:
+                    continue
+                entry = {"mtime": mtime, "apps": apps, "subdirs": subdirs}
+                stats["scanned"] += 1
+
+            new_dirs[path] = entry
+            # Alt dizinlerin kendi mtime değerleri ayrıca kontrol edilir
+            stack.extend(reversed(entry["subdirs"]))
+
+        return new_dirs
+
+    def _scan_registry(self, stats: dict) -> Dict[str, dict]:
+        """Windows kayıt defterini tara, değişmeyen anahtarları atla"""
+        if not self.scan_registry:
+            return {}
+
+        try:
+            import winreg
+        except ImportError:
+            return {}
+
+        new_registry = {}
+        for reg_path in REGISTRY_PATHS:
+            try:
+                with winreg.OpenKey(winreg.HKEY_LOCAL_MACHINE, reg_path) as key:
+                    subkey_count, _, modified = winreg.QueryInfoKey(key)
+                    cached = self._registry.get(reg_path)
+                    if cached and cached.get("mtime") == modified:
+                        new_registry[reg_path] = cached
+                        stats["reused"] += 1
+                        continue
+
+                    apps = {}
+                    for i in range(subkey_count):
+                        try:
+                            app_key = winreg.EnumKey(key, i)
+                            with winreg.OpenKey(key, app_key) as app:
+                                path = winreg.QueryValue(app, None)
+                                if path and path.lower().endswith('.exe'):
+                                    name = os.path.splitext(os.path.basename(path))[0].lower()
+                                    apps[name] = path
+                        except OSError:
+                            continue
+
+                    new_registry[reg_path] = {"mtime": modified, "apps": apps}
+                    stats["scanned"] += 1
+            except OSError:
+                continue
+
+        return new_registry
+
+    def _rebuild_apps(self):
+        """Dizin ve kayıt defteri önbelleğinden uygulama tablosunu oluştur"""
+        apps = {}
+
+        for dir_path, entry in self._dirs.items():
+            for file_name in entry.get("apps", []):
+                app_name = os.path.splitext(file_name)[0].lower()
+                apps[app_name] = {
+                    "exe": file_name,
+                    "path": os.path.join(dir_path, file_name),
+                    "name": app_name.title(),
+                    "source": "scan"
+                }
+
+        for entry in self._registry.values():
+            for app_name, path in entry.get("apps", {}).items():
+                apps.setdefault(app_name, {
+                    "exe": os.path.basename(path),
+                    "path": path,
+                    "name": app_name.title(),
+                    "source": "registry"
+                })
+
+        # Takma adları bilinen yürütülebilir dosyalara bağla
+        for alias, exe in self.aliases.items():
+            target = apps.get(os.path.splitext(exe)[0].lower())
+            apps.setdefault(alias, {
+                "exe": exe,
+                "path": target["path"] if target else None,
+                "name": alias.title(),
+                "source": "alias"
+            })
+
+        with self._lock:
+            self.apps = apps
+            self.version += 1
+
+    def refresh(self) -> dict:
+        """İndeksi artımlı olarak tazele ve istatistikleri döndür"""
+        with self._lock:
+            start = time.perf_counter()
+            stats = {"scanned": 0, "reused": 0}
+
+            new_dirs = self._scan_directories(stats)
+            new_registry = self._scan_registry(stats)
+
+            changed = new_dirs != self._dirs or new_registry != self._registry
+            self._dirs = new_dirs
+            self._registry = new_registry
+            self.last_refresh = datetime.now().isoformat()
+
+            if changed:
+                self._rebuild_apps()
+            self._save()
+
+            stats["apps"] = len(self.apps)
+            stats["changed"] = changed
+            stats["duration_ms"] = round((time.perf_counter() - start) * 1000, 2)
+            self.last_refresh_stats = stats
+
+        self.logger.info(
+            f"Uygulama indeksi tazelendi: {stats['apps']} uygulama, "
+            f"{stats['scanned']} dizin tarandı, {stats['reused']} önbellekten "
+            f"({stats['duration_ms']} ms)"
+        )
+        return stats
+
+    def refresh_async(self):
+        """İndeksi başlangıcı bekletmeden arka planda tazele"""
+        if self._refresh_thread and self._refresh_thread.is_alive():
+            return
+
+        def refresh_task():
+            try:
+                self.refresh()
+            except Exception as e:
+                self.logger.error(f"Uygulama indeksi tazeleme hatası: {str(e)}")
+
+        self._refresh_thread = threading.Thread(target=refresh_task, daemon=True)
+        self._refresh_thread.start()
+
+    def wait_for_refresh(self, timeout: Optional[float] = None) -> bool:
+        """Devam eden arka plan tazelemesinin bitmesini bekle"""
+        thread = self._refresh_thread
+        if thread:
+            thread.join(timeout)
+            return not thread.is_alive()
+        return True
+
+    def lookup(self, name: str) -> Optional[dict]:
+        """Uygulama adına göre indeks kaydını getir"""
+        if not name:
+            return None
+        return self.apps.get(name.lower().strip())
+
+    def find_in_text(self, text: str) -> Optional[str]:
+        """Metinde tam kelime olarak geçen en uzun uygulama adını bul ("digit" içindeki "git" sayılmaz)"""
+        text = text.lower()
+        best = None
+        for app_name in self.apps:
+            if best is not None and len(app_name) <= len(best):
+                continue
+            if re.search(rf"(?<!\w){re.escape(app_name)}(?!\w)", text):
+                best = app_name
+        return best
+
+    def names(self) -> List[str]:
+        """İndeksteki tüm uygulama adlarını getir"""
+        return list(self.apps.keys())
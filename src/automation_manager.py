@@ -1,21 +1,23 @@
 import schedule
 import time
 import threading
-import psutil
 from datetime import datetime
 from pathlib import Path
 import shutil
 import logging
 from typing import Dict, List, Optional
-from config_manager import ConfigManager
+from config_manager import get_config_manager
 from language_manager import LanguageManager
 from notification_manager import NotificationManager
+from app_index import get_app_index
+from metrics_collector import get_metrics_collector
+from janitor import get_janitor
 import os
 import subprocess
 
 class AutomationManager:
     def __init__(self):
-        self.config_manager = ConfigManager()
+        self.config_manager = get_config_manager()
         self.language_manager = LanguageManager()
         self.notification_manager = NotificationManager()
         self.logger = logging.getLogger("AICodeEditor.Automation")
@@ -29,8 +31,8 @@ class AutomationManager:
         # Tetikleyicileri başlat
         self._setup_triggers()
         
-        # Uygulama listesini hazırla
-        self.installed_apps = self._scan_installed_apps()
+        # Uygulama listesi paylaşılan indeksten okunur (tarama arka planda yapılır)
+        self.app_index = get_app_index()
         self.common_apps = {
             "chrome": {
                 "exe": "chrome.exe",
@@ -208,13 +210,12 @@ class AutomationManager:
     def _evaluate_condition(self, condition: str) -> bool:
         """Koşulu değerlendir"""
         try:
+            snapshot = get_metrics_collector().latest
             if "battery_level" in condition:
-                battery = psutil.sensors_battery()
-                if battery:
-                    return eval(condition.replace("battery_level", str(battery.percent)))
+                if snapshot.battery_percent is not None:
+                    return eval(condition.replace("battery_level", str(snapshot.battery_percent)))
             elif "cpu_usage" in condition:
-                cpu_percent = psutil.cpu_percent()
-                return eval(condition.replace("cpu_usage", str(cpu_percent)))
+                return eval(condition.replace("cpu_usage", str(snapshot.cpu_percent)))
             return False
         except:
             return False
@@ -235,10 +236,14 @@ class AutomationManager:
             
     def _action_clear_temp_files(self, params: dict):
         """Geçici dosyaları temizle"""
-        temp_dir = Path(params.get("temp_dir", "temp/"))
-        if temp_dir.exists():
-            shutil.rmtree(temp_dir)
-            temp_dir.mkdir(exist_ok=True)
+        janitor = get_janitor()
+        if "temp_dir" in params:
+            # Belirtilen dizin: varsayılan olarak tüm içerik silinir, dizin korunur
+            janitor.clean_directory(
+                Path(params["temp_dir"]), params.get("max_age_hours", 0), params.get("max_bytes")
+            )
+        else:
+            janitor.clean_temp()
             
     def _action_enable_power_save(self, params: dict):
         """Güç tasarrufu modunu etkinleştir"""
@@ -250,44 +255,14 @@ class AutomationManager:
         # Bildirim gönderme işlemi
         pass
 
-    def _scan_installed_apps(self) -> dict:
-        """Sistemde yüklü uygulamaları tara"""
-        installed_apps = {}
-        try:
-            # Windows için Program Files dizinlerini tara
-            program_dirs = [
-                os.environ.get("ProgramFiles", "C:/Program Files"),
-                os.environ.get("ProgramFiles(x86)", "C:/Program Files (x86)"),
-                os.environ.get("LocalAppData", ""),
-                os.path.join(os.environ.get("LocalAppData", ""), "Programs"),
-                os.environ.get("AppData", "")
-            ]
-
-            for program_dir in program_dirs:
-                if os.path.exists(program_dir):
-                    for root, dirs, files in os.walk(program_dir):
-                        for file in files:
-                            if file.endswith('.exe'):
-                                app_name = os.path.splitext(file)[0].lower()
-                                installed_apps[app_name] = {
-                                    "exe": file,
-                                    "path": os.path.join(root, file),
-                                    "name": app_name.title()
-                                }
-
-            self.logger.info(f"Bulunan uygulamalar: {list(installed_apps.keys())}")
-            return installed_apps
-
-        except Exception as e:
-            self.logger.error(f"Uygulama tarama hatası: {str(e)}")
-            return {}
+    @property
+    def installed_apps(self) -> dict:
+        """Sistemde yüklü uygulamalar (paylaşılan indeksten)"""
+        return self.app_index.apps
 
     def open_application(self, app_name: str) -> bool:
         """Uygulamayı aç"""
         try:
-            # Uygulama listesini yenile
-            self.refresh_installed_apps()
-            
             # Uygulama adını küçük harfe çevir
             app_name = app_name.lower()
             
@@ -309,11 +284,11 @@ class AutomationManager:
                         pass
                 return False
                 
-            # Uygulama adını bul
-            if app_name in self.installed_apps:
-                executable = self.installed_apps[app_name]
+            # Uygulamayı indeksten bul
+            app = self.app_index.lookup(app_name)
+            if app:
+                executable = app.get("path") or app["exe"]
                 try:
-                    import subprocess
                     subprocess.Popen([executable])
                     return True
                 except Exception as e:
@@ -327,5 +302,5 @@ class AutomationManager:
             return False
 
     def refresh_installed_apps(self):
-        """Yüklü uygulama listesini yenile"""
-        self.installed_apps = self._scan_installed_apps() 
\ No newline at end of file
+        """Yüklü uygulama listesini arka planda artımlı olarak yenile"""
+        self.app_index.refresh_async()
\ No newline at end of file
@@ -0,0 +1,200 @@
+import asyncio
+import glob
+import logging
+import os
+import re
+import time
+from pathlib import Path
+from typing import AsyncIterator, Awaitable, Callable, Dict, List, Optional
+from edit_engine import EditEngine
+
+DEFAULT_CONCURRENCY = 2
+DEFAULT_MAX_CHUNK_LINES = 300
+DEFAULT_MAX_FILES = 200
+DEFAULT_EXTENSIONS = [".py"]
+
+# Taramada atlanan dizinler
+SKIP_DIRS = {"__pycache__", "node_modules", "venv", ".venv", "env", "build", "dist"}
+
+# Bulgu satırı: "[YÜKSEK] açıklama"
+FINDING_PATTERN = re.compile(r'^\s*[-*]?\s*\[(YÜKSEK|ORTA|DÜŞÜK)\]\s*(.+)$', re.IGNORECASE | re.MULTILINE)
+SEVERITIES = ("YÜKSEK", "ORTA", "DÜŞÜK")
+
+REVIEW_PROMPT = """Lütfen bu kodu incele: {path} ({part})
+
+{code}
+
+Şu kriterlere göre değerlendir:
+1. Kod kalitesi
+2. Olası hatalar
+3. İyileştirme önerileri
+
+Her bulguyu ayrı satırda "[YÜKSEK] ...", "[ORTA] ..." veya "[DÜŞÜK] ..." biçiminde yaz.
+Sorun yoksa "Bulgu yok" yaz.
+"""
+
+class FileReview:
+    """Tek dosyanın inceleme sonucu"""
+
+    def __init__(self, path: str):
+        self.path = path
+        self.parts: List[str] = []
+        self.findings: List[Dict] = []
+        self.error: Optional[str] = None
+        self.duration = 0.0
+
+    @property
+    def text(self) -> str:
+        return "\n".join(self.parts)
+
+class BatchReviewer:
+    """Dizin/glob içindeki dosyaları sınırlı eşzamanlılıkla inceleyen ve raporlayan işlem hattı"""
+
+    def __init__(self, ask: Callable[[str], Awaitable[str]], review_config: Optional[dict] = None):
+        self.logger = logging.getLogger("AICodeEditor.BatchReview")
+        review_config = review_config or {}
+        self.ask = ask
+        self.concurrency = max(review_config.get("concurrency", DEFAULT_CONCURRENCY), 1)
+        self.max_chunk_lines = review_config.get("max_chunk_lines", DEFAULT_MAX_CHUNK_LINES)
+        self.max_files = review_config.get("max_files", DEFAULT_MAX_FILES)
+        self.extensions = tuple(ext.lower() for ext in review_config.get("extensions", DEFAULT_EXTENSIONS))
+        self._engine = EditEngine(max_region_lines=self.max_chunk_lines)
+
+    def collect_files(self, target: str) -> List[str]:
+        """Dizin ya da glob ifadesinden incelenecek dosyaları topla"""
+        if any(char in target for char in "*?["):
+            files = [path for path in glob.glob(target, recursive=True) if os.path.isfile(path)]
+        elif os.path.isdir(target):
+            files = []
+            stack = [target]
+            while stack:
+                current = stack.pop()
+                try:
+                    with os.scandir(current) as it:
+                        for entry in it:
+                            if entry.is_dir(follow_symlinks=False):
+                                if not entry.name.startswith(".") and entry.name not in SKIP_DIRS:
+                                    stack.append(entry.path)
+                            elif entry.name.lower().endswith(self.extensions):
+                                files.append(entry.path)
+                except OSError:
+                    continue
+        elif os.path.isfile(target):
+            files = [target]
+        else:
+            files = []
+
+        files.sort()
+        if len(files) > self.max_files:
+            self.logger.warning(f"{len(files)} dosya bulundu, ilk {self.max_files} tanesi incelenecek")
+            files = files[:self.max_files]
+        return files
+
+    def chunk_file(self, content: str) -> List[str]:
+        """Dosyayı fonksiyon/sınıf sınırlarından parça sınırına sığan bölümlere ayır"""
+        lines = content.splitlines(keepends=True)
+        if len(lines) <= self.max_chunk_lines:
+            return [content]
+
+        chunks = []
+        current = []
+        for region in self._engine.split_regions(lines):
+            region_lines = lines[region.start:region.end]
+            if current and len(current) + len(region_lines) > self.max_chunk_lines:
+                chunks.append("".join(current))
+                current = []
+            current.extend(region_lines)
+        if current:
+            chunks.append("".join(current))
+        return chunks
+
+    def parse_findings(self, text: str) -> List[Dict]:
+        """Yanıttaki önem derecesi etiketli bulguları ayrıştır"""
+        return [
+            {"severity": severity.upper(), "message": message.strip()}
+            for severity, message in FINDING_PATTERN.findall(text)
+        ]
+
+    async def _review_file(self, path: str, semaphore: asyncio.Semaphore) -> FileReview:
+        result = FileReview(path)
+        start = time.perf_counter()
+        try:
+            content = Path(path).read_text(encoding="utf-8", errors="replace")
+            chunks = self.chunk_file(content)
+            for index, chunk in enumerate(chunks, 1):
+                prompt = REVIEW_PROMPT.format(path=path, part=f"bölüm {index}/{len(chunks)}", code=chunk)
+                # Eşzamanlılık sınırı parça (model isteği) başına uygulanır
+                async with semaphore:
+                    response = await self.ask(prompt)
+                result.parts.append(response)
+                result.findings.extend(self.parse_findings(response))
+        except Exception as e:
+            result.error = str(e)
+            self.logger.error(f"Dosya inceleme hatası ({path}): {str(e)}")
+        result.duration = time.perf_counter() - start
+        return result
+
+    def format_file_result(self, review: FileReview, index: int, total: int) -> str:
+        """Tek dosya sonucunu sohbet için biçimlendir"""
+        header = f"📄 [{index}/{total}] {review.path} ({review.duration:.1f} sn)"
+        if review.error:
+            return f"{header}\n❌ {review.error}\n\n"
+        return f"{header}\n{review.text.strip()}\n\n"
+
+    def build_report(self, reviews: List[FileReview], duration: float) -> str:
+        """Tüm bulguları tek raporda topla"""
+        counts = {severity: 0 for severity in SEVERITIES}
+        for review in reviews:
+            for finding in review.findings:
+                counts[finding["severity"]] = counts.get(finding["severity"], 0) + 1
+        failed = [review for review in reviews if review.error]
+
+        lines = [
+            "📊 Toplu İnceleme Raporu:",
+            f"- İncelenen dosya: {len(reviews) - len(failed)}/{len(reviews)} ({duration:.1f} sn)",
+            f"- Bulgular: " + ", ".join(f"{severity} {count}" for severity, count in counts.items())
+        ]
+
+        ranked = sorted(
+            (review for review in reviews if review.findings),
+            key=lambda review: (
+                -sum(1 for f in review.findings if f["severity"] == "YÜKSEK"),
+                -len(review.findings)
+            )
+        )
+        if ranked:
+            lines.append("- En çok bulgu olan dosyalar:")
+            for review in ranked[:10]:
+                high = [f for f in review.findings if f["severity"] == "YÜKSEK"]
+                lines.append(f"  • {review.path}: {len(review.findings)} bulgu ({len(high)} yüksek)")
+                for finding in high[:3]:
+                    lines.append(f"      - {finding['message']}")
+
+        if failed:
+            lines.append("- İncelenemeyen dosyalar:")
+            lines.extend(f"  • {review.path}: {review.error}" for review in failed)
+        return "\n".join(lines)
+
+    async def review(self, target: str) -> AsyncIterator[str]:
+        """Dosyaları paralel incele; her dosya bittikçe sonucunu, en sonda raporu üret"""
+        files = self.collect_files(target)
+        if not files:
+            yield f"❌ İncelenecek dosya bulunamadı: {target}"
+            return
+
+        yield f"🔍 {len(files)} dosya inceleniyor (eşzamanlılık: {self.concurrency})...\n\n"
+        start = time.perf_counter()
+        semaphore = asyncio.Semaphore(self.concurrency)
+        tasks = [asyncio.ensure_future(self._review_file(path, semaphore)) for path in files]
+
+        reviews = []
+        try:
+            for index, finished in enumerate(asyncio.as_completed(tasks), 1):
+                review = await finished
+                reviews.append(review)
+                yield self.format_file_result(review, index, len(files))
+        finally:
+            for task in tasks:
+                task.cancel()
+
+        yield self.build_report(reviews, time.perf_counter() - start)
@@ -0,0 +1,155 @@
+import logging
+import sys
+import threading
+import weakref
+from collections import deque
+from typing import Callable, Dict, List, Optional
+
+# Öncelik: düşük olan önce boşaltılır
+PRIORITY_LOW = 10
+PRIORITY_NORMAL = 50
+PRIORITY_HIGH = 80
+
+# Boyut tahmininde gezilecek en fazla nesne sayısı
+ESTIMATE_MAX_OBJECTS = 100000
+
+# Süreç genelinde tek kayıt defteri
+_registry = None
+_registry_lock = threading.Lock()
+
+def get_cache_registry() -> "CacheRegistry":
+    """Paylaşılan boşaltılabilir önbellek kayıt defterini getir"""
+    global _registry
+    if _registry is None:
+        with _registry_lock:
+            if _registry is None:
+                _registry = CacheRegistry()
+    return _registry
+
+def estimate_size(obj, max_objects: int = ESTIMATE_MAX_OBJECTS) -> int:
+    """Nesnenin ve içerdiği dict/list/tuple/set/deque öğelerinin yaklaşık bellek boyutu (bayt)"""
+    seen = set()
+    stack = [obj]
+    total = 0
+    while stack and len(seen) < max_objects:
+        item = stack.pop()
+        if id(item) in seen:
+            continue
+        seen.add(id(item))
+        total += sys.getsizeof(item)
+        if isinstance(item, dict):
+            stack.extend(item.keys())
+            stack.extend(item.values())
+        elif isinstance(item, (list, tuple, set, frozenset, deque)):
+            stack.extend(item)
+    return total
+
+def _reference(func: Callable) -> Callable[[], Optional[Callable]]:
+    """Bağlı metodları zayıf referansla tut (kayıt, sahibini canlı tutmasın)"""
+    if hasattr(func, "__self__") and hasattr(func, "__func__"):
+        return weakref.WeakMethod(func)
+    return lambda: func
+
+class CacheEntry:
+    """Kayıtlı bir önbellek: boyut tahmincisi, boşaltıcı ve öncelik"""
+
+    def __init__(self, name: str, size: Callable[[], int], evict: Callable[[], None], priority: int):
+        self.name = name
+        self.priority = priority
+        self._size = _reference(size)
+        self._evict = _reference(evict)
+
+    @property
+    def alive(self) -> bool:
+        return self._size() is not None and self._evict() is not None
+
+    def size(self) -> int:
+        size = self._size()
+        return size() if size is not None else 0
+
+    def evict(self):
+        evict = self._evict()
+        if evict is not None:
+            evict()
+
+class CacheRegistry:
+    """Alt sistemlerin bellekteki önbelleklerini kaydettiği, bellek baskısında boşaltan kayıt defteri
+
+    Boşaltma sırası: önce düşük öncelik, aynı öncelikte önce büyük önbellek.
+    İstenen bayt hedefine ulaşılınca durulur.
+    """
+
+    def __init__(self):
+        self.logger = logging.getLogger("AICodeEditor.CacheRegistry")
+        self._entries: Dict[str, CacheEntry] = {}
+        self._lock = threading.Lock()
+        self.total_reclaimed = 0
+
+    def register(self, name: str, size: Callable[[], int], evict: Callable[[], None],
+                 priority: int = PRIORITY_NORMAL):
+        """Önbelleği kaydet; aynı adla yeniden kayıt öncekinin yerine geçer"""
+        with self._lock:
+            self._entries[name] = CacheEntry(name, size, evict, priority)
+
+    def unregister(self, name: str):
+        with self._lock:
+            self._entries.pop(name, None)
+
+    def _live_entries(self) -> List[CacheEntry]:
+        with self._lock:
+            dead = [name for name, entry in self._entries.items() if not entry.alive]
+            for name in dead:
+                del self._entries[name]
+            return list(self._entries.values())
+
+    def sizes(self) -> List[Dict]:
+        """Kayıtlı önbelleklerin tahmini boyutları"""
+        result = []
+        for entry in self._live_entries():
+            try:
+                size = entry.size()
+            except Exception as e:
+                self.logger.error(f"Önbellek boyutu hesaplama hatası ({entry.name}): {str(e)}")
+                size = 0
+            result.append({"name": entry.name, "bytes": size, "priority": entry.priority})
+        return result
+
+    def evict(self, target_bytes: Optional[int] = None, max_priority: Optional[int] = None) -> Dict:
+        """Önbellekleri boşalt ve geri kazanılan baytları raporla
+
+        `target_bytes` verilirse bu kadar bayt geri kazanılınca durulur; `max_priority`
+        verilirse daha yüksek öncelikli önbelleklere dokunulmaz.
+        """
+        candidates = [
+            item for item in self.sizes()
+            if item["bytes"] > 0 and (max_priority is None or item["priority"] <= max_priority)
+        ]
+        candidates.sort(key=lambda item: (item["priority"], -item["bytes"]))
+
+        with self._lock:
+            entries = dict(self._entries)
+
+        reclaimed = 0
+        evicted = []
+        for item in candidates:
+            if target_bytes is not None and reclaimed >= target_bytes:
+                break
+            entry = entries.get(item["name"])
+            if entry is None:
+                continue
+            try:
+                entry.evict()
+                freed = max(item["bytes"] - entry.size(), 0)
+            except Exception as e:
+                self.logger.error(f"Önbellek boşaltma hatası ({entry.name}): {str(e)}")
+                continue
+            reclaimed += freed
+            evicted.append({"name": entry.name, "priority": entry.priority, "bytes": freed})
+
+        self.total_reclaimed += reclaimed
+        if evicted:
+            self.logger.info(
+                f"Bellek baskısı: {reclaimed / 1024:.0f} KB geri kazanıldı ("
+                + ", ".join(f"{item['name']} {item['bytes'] / 1024:.0f} KB" for item in evicted) + ")"
+            )
+        return {"reclaimed_bytes": reclaimed, "evicted": evicted}
@@ -1,80 +1,167 @@
-import ollama_python as ollama
 from pathlib import Path
 import sys
 from colorama import init, Fore, Style
 import json
-from cursor_integration import CursorIntegration
-from PyQt6.QtWidgets import QApplication
-from PyQt6.QtGui import QKeyEvent
-from PyQt6.QtCore import Qt
-import pyautogui
 import time
-import win32gui  # Windows için
-import win32con  # Windows için
-import win32com.client  # Windows COM API'si için
+import inspect
+import contextvars
+import threading
+import queue
 import os
 import subprocess
 import webbrowser
 import psutil
-import keyboard  # Klavye kontrolü için
-import screen_brightness_control as sbc  # Ekran parlaklığı kontrolü
-import sounddevice as sd  # Ses kontrolü
-import numpy as np
 from datetime import datetime, timedelta
-import winreg  # Windows kayıt defteri işlemleri için
 import re
-import cv2
-import pytesseract
-from PIL import ImageGrab, ImageDraw
-import pygetwindow as gw
-import pyttsx3  # TTS için
-from screen_scraper import ScreenScraper
-from src.system_controller import SystemController
 from src.reminder_manager import ReminderManager
 from src.context_reminder import ContextReminder
 from src.code_todo_manager import CodeTodoManager
 from src.task_manager import TaskBoard, TaskStatus, TaskPriority
-from src.error_handler import ErrorHandler
 import random
 from src.language_manager import LanguageManager
 from base_agent import BaseAgent
 import logging
 from typing import Dict, Optional, Tuple
-from selenium import webdriver
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from src.config_manager import ConfigManager
-from media_manager import MediaManager
-from automation_manager import AutomationManager
-from notification_manager import NotificationManager
-from window_manager import WindowManager
-from security_manager import SecurityManager
-from performance_manager import PerformanceManager
-from error_manager import ErrorManager
+from contextlib import ExitStack, aclosing
+from config_manager import get_config_manager
+from lazy_import import lazy_import, lazy_attr, ensure_loaded
+from tracer import get_tracer
+from sampling_profiler import get_profiler
+from slow_command_recorder import get_slow_command_recorder
+from conversation_context import ConversationContext
+from cache_registry import PRIORITY_HIGH, get_cache_registry
+from edit_engine import EditEngine, PatchError
+import command_patterns
+from command_patterns import COMMAND_PATTERNS, PATTERNS
 import shutil
 import ctypes
 
+def _configure_tesseract(module):
+    """OCR için Tesseract yolunu ayarla (Windows için)"""
+    module.pytesseract.tesseract_cmd = r'C:\Program Files\Tesseract-OCR\tesseract.exe'
+
+# Ağır bağımlılıklar yalnızca ilgili işleyici ilk kez çalıştığında yüklenir
+pyautogui = lazy_import("pyautogui")
+win32com_client = lazy_import("win32com.client")  # Windows COM API'si için
+keyboard = lazy_import("keyboard")  # Klavye kontrolü için
+sbc = lazy_import("screen_brightness_control")  # Ekran parlaklığı kontrolü
+np = lazy_import("numpy")
+cv2 = lazy_import("cv2")
+pytesseract = lazy_import("pytesseract", on_load=_configure_tesseract)
+ImageGrab = lazy_import("PIL.ImageGrab")
+ImageDraw = lazy_import("PIL.ImageDraw")
+gw = lazy_import("pygetwindow")
+pyttsx3 = lazy_import("pyttsx3")  # TTS için
+By = lazy_attr("selenium.webdriver.common.by", "By")
+WebDriverWait = lazy_attr("selenium.webdriver.support.ui", "WebDriverWait")
+EC = lazy_import("selenium.webdriver.support.expected_conditions")
+
+# Alt sistem modülleri de ilk kullanımda yüklenir
+CursorIntegration = lazy_attr("cursor_integration", "CursorIntegration")
+ScreenScraper = lazy_attr("screen_scraper", "ScreenScraper")
+SystemController = lazy_attr("src.system_controller", "SystemController")
+MediaManager = lazy_attr("media_manager", "MediaManager")
+AutomationManager = lazy_attr("automation_manager", "AutomationManager")
+NotificationManager = lazy_attr("notification_manager", "NotificationManager")
+WindowManager = lazy_attr("window_manager", "WindowManager")
+SecurityManager = lazy_attr("security_manager", "SecurityManager")
+PerformanceManager = lazy_attr("performance_manager", "PerformanceManager")
+ErrorManager = lazy_attr("error_manager", "ErrorManager")
+AppIndex = lazy_attr("app_index", "AppIndex")
+get_app_index = lazy_attr("app_index", "get_app_index")
+IntentRouter = lazy_attr("intent_router", "IntentRouter")
+ModelClient = lazy_attr("model_client", "ModelClient")
+SentenceBuffer = lazy_attr("model_client", "SentenceBuffer")
+ResponseCache = lazy_attr("response_cache", "ResponseCache")
+BatchReviewer = lazy_attr("batch_review", "BatchReviewer")
+
 # Colorama'yı başlat
 init()
 
 class CodeEditorAgent(BaseAgent):
+    # İlk kullanımda oluşturulan alt sistemler (başlangıç raporu sırası)
+    LAZY_SUBSYSTEMS = (
+        "tts_engine",
+        "app_index",
+        "cursor",
+        "shell",
+        "security_manager",
+        "performance_manager",
+        "error_manager",
+        "notification_manager",
+        "automation_manager",
+        "media_manager",
+        "window_manager",
+        "system_controller",
+        "scraper",
+        "reminder_manager",
+        "context_reminder",
+        "todo_manager",
+        "task_board",
+        "intent_router",
+        "model_client",
+        "response_cache",
+        "edit_engine",
+    )
+    
+    # Niyet anahtar kelimeleri; sıra eşleşme önceliğini belirler
+    INTENT_KEYWORDS = (
+        ("startup_report", ["başlangıç raporu"]),
+        ("explain_route", ["yönlendirmeyi açıkla"]),
+        ("latency_report", ["gecikme raporu"]),
+        ("profile", ["profil"]),
+        ("slow_commands", ["yavaş komut"]),
+        ("web_search", ["google", "web'de", "internette"]),
+        ("youtube", ["youtube"]),
+        ("open_app", ["aç"]),
+        ("window", ["pencere", "ekran", "uygulama"]),
+        ("media", ["ses", "parlaklık", "müzik", "video"]),
+        ("notification", ["bildirim"]),
+        ("development", ["geliştir", "düzenle", "ekle", "yaz", "oluştur"]),
+        ("review", ["incele", "kontrol et", "review", "gözden geçir"]),
+        ("task", ["görev", "task", "todo"]),
+        ("system", ["sistem", "bilgisayar", "pc"]),
+        ("type_text", ["yaz", "yazdır", "metin gir"]),
+    )
+
     def __init__(self):
+        init_start = time.perf_counter()
         super().__init__()
-        self.config_manager = ConfigManager()
+        self.logger = logging.getLogger('AICodeEditor.CodeAgent')
+        
+        # Tembel (lazy) alt sistem kaydı
+        self._subsystems = {}
+        self._subsystem_timings = {}
+        self._subsystem_lock = threading.RLock()
+        
+        self.config_manager = get_config_manager()
+        self.tracer = get_tracer()
+        self.profiler = get_profiler()
+        self.slow_commands = get_slow_command_recorder()
         # Model ayarlarını config'den al
         model_config = self.config_manager.get_model_config()
         self.model = self.config_manager.config["ai"]["default_model"]
         self.temperature = model_config.get("temperature", 0.7)
         self.max_tokens = model_config.get("max_tokens", 2048)
+        self.context_window = model_config.get("context_window", 4096)
         self.system_prompt = model_config.get("system_prompt", "")
-        self.context = []
-        self.cursor = CursorIntegration()
-        self.shell = win32com.client.Dispatch("WScript.Shell")
+        # Bağlam, modelin bağlam penceresiyle sınırlanır; yanıt için max_tokens kadar yer
+        # ayrılır (istem her durumda pencerenin en az yarısını kullanabilir)
+        self.context = ConversationContext(
+            self.system_prompt,
+            budget=self.context_window,
+            response_reserve=min(self.max_tokens, self.context_window // 2)
+        )
+        get_cache_registry().register("conversation_context", self.context.memory_size, self.context.shrink, PRIORITY_HIGH)
+        
+        # Akışlı yanıt ve cümle cümle seslendirme ayarları
+        streaming_config = self.config_manager.get_config("ai", {}).get("streaming", {})
+        self.streaming_enabled = streaming_config.get("enabled", True)
+        self.speak_streamed = streaming_config.get("speak", True)
+        self._speech_queue = queue.Queue()
+        self._speech_thread = None
         self.show_welcome_message()
         self.language_manager = LanguageManager()
-        self.logger = logging.getLogger('AICodeEditor.CodeAgent')
-        self.common_apps = self._get_installed_apps()
         
         self.keyboard_shortcuts = {
             "kopyala": ["ctrl", "c"],
@@ -99,32 +186,6 @@ class CodeEditorAgent(BaseAgent):
             "geri": "previous_track",
         }
         
-        # OCR için Tesseract yolunu ayarla (Windows için)
-        pytesseract.pytesseract.tesseract_cmd = r'C:\Program Files\Tesseract-OCR\tesseract.exe'
-        
-        # TTS motorunu başlat
-        try:
-            # Önce Windows SAPI5'i dene
-            self.tts_engine = win32com.client.Dispatch("SAPI.SpVoice")
-            # Türkçe ses varsa onu seç
-            voices = self.tts_engine.GetVoices()
-            for voice in voices:
-                if "Turkish" in voice.GetDescription():
-                    self.tts_engine.Voice = voice
-                    break
-        except:
-            # Windows değilse pyttsx3 kullan
-            self.tts_engine = pyttsx3.init()
-            # Türkçe ses varsa onu seç
-            voices = self.tts_engine.getProperty('voices')
-            for voice in voices:
-                if "turkish" in voice.name.lower():
-                    self.tts_engine.setProperty('voice', voice.id)
-                    break
-            # Konuşma hızını ayarla
-            self.tts_engine.setProperty('rate', 150)
-        
-        self.error_handler = ErrorHandler()
         self.language = "tr"  # Varsayılan dil Türkçe
         self.responses = {
             "tr": {
@@ -147,94 +208,223 @@ class CodeEditorAgent(BaseAgent):
             }
         }
         
-        # Uygulama listesini güncelle
-        self.apps = self._get_installed_apps()
-        self.logger.info(f"Bulunan uygulamalar: {self.apps}")
-        
-        # Komut kalıpları
-        self.command_patterns = {
-            'youtube_search': [
-                r'youtube(?:\'da)?\s+(.*?)(?:dinle|izle|aç|arat|bul|ara)',
-                r'(.*?)(?:dinle|izle|aç)\s+youtube(?:\'da)?',
-            ],
-            'youtube_video': [
-                r'youtube(?:\'da)?\s+(.*?)(?:videosunu|şarkısını|müziğini)?\s+(?:aç|oynat|başlat|dinle)',
-                r'(.*?)(?:videosunu|şarkısını|müziğini)?\s+(?:youtube(?:\'da)?\s+)?(?:aç|oynat|başlat|dinle)',
-            ],
-            'web_open': [
-                r'(?:aç|git|ziyaret et)\s+((?:https?://)?(?:[\w-]+\.)+[\w-]+(?:/[^\s]*)?)',
-                r'((?:https?://)?(?:[\w-]+\.)+[\w-]+(?:/[^\s]*)?)(?:\s+(?:aç|git|ziyaret et))',
-            ],
-            'close_app': [
-                r'(.*?)(?:\s+)?(?:kapat|sonlandır|çık)',
-                r'(?:kapat|sonlandır|çık)\s+(.*)',
-            ]
-        }
+        # Komut kalıpları (derlenmiş, command_patterns modülünde)
+        self.command_patterns = COMMAND_PATTERNS
         
         self.driver = None
         self.default_browser = None
         
-        # Alt sistemleri başlat
-        self.media_manager = MediaManager()
-        self.automation_manager = AutomationManager()
-        self.notification_manager = NotificationManager()
-        self.window_manager = WindowManager()
-        self.security_manager = SecurityManager()
-        self.performance_manager = PerformanceManager()
-        self.error_manager = ErrorManager()
+        # Alt sistemler (medya, pencere, TTS vb.) ilk kullanımda oluşturulur.
+        # Performans yöneticisi istisnadır: iz dinleyicisi, metrik aboneliği, kaynak
+        # kontrolleri ve temizlik ilk komuttan önce kurulmalı
+        self._get_subsystem("performance_manager", PerformanceManager)
+        # Otomasyon da zamanlanmış görevler ve tetikleyiciler için hemen başlamalı;
+        # başlangıcı bekletmemek için arka planda oluşturulur
+        threading.Thread(target=self._start_automation, name="automation-start", daemon=True).start()
+        self.init_duration = time.perf_counter() - init_start
+        self.logger.info(f"CodeEditorAgent {self.init_duration * 1000:.1f} ms içinde başlatıldı")
         
-        # Otomasyon sistemini başlat
-        self.automation_manager.start()
+    def _get_subsystem(self, name: str, factory):
+        """Alt sistemi ilk kullanımda oluştur ve oluşturma süresini kaydet"""
+        subsystem = self._subsystems.get(name)
+        if subsystem is not None:
+            return subsystem
+            
+        with self._subsystem_lock:
+            subsystem = self._subsystems.get(name)
+            if subsystem is None:
+                start = time.perf_counter()
+                subsystem = factory()
+                duration = time.perf_counter() - start
+                self._subsystems[name] = subsystem
+                self._subsystem_timings[name] = {
+                    "duration_ms": round(duration * 1000, 2),
+                    "created_at": datetime.now().isoformat()
+                }
+                self.logger.info(f"Alt sistem oluşturuldu: {name} ({duration * 1000:.1f} ms)")
+        return subsystem
         
-    def _get_installed_apps(self) -> Dict[str, str]:
-        """Sistemde kurulu uygulamaları bul"""
-        apps = {
-            "chrome": "chrome.exe",
-            "google chrome": "chrome.exe",
-            "cursor": "cursor.exe",
-            "cursor editör": "cursor.exe",
-            "cursor editor": "cursor.exe",
-            "vscode": "code.exe",
-            "visual studio code": "code.exe",
-            "notepad": "notepad.exe"
+    def get_startup_report(self) -> Dict:
+        """Hangi alt sistemlerin oluşturulduğunu ve ne kadar sürdüğünü raporla"""
+        subsystems = []
+        for name in self.LAZY_SUBSYSTEMS:
+            timing = self._subsystem_timings.get(name)
+            subsystems.append({
+                "name": name,
+                "created": timing is not None,
+                "duration_ms": timing["duration_ms"] if timing else None,
+                "created_at": timing["created_at"] if timing else None
+            })
+            
+        return {
+            "init_ms": round(self.init_duration * 1000, 2),
+            "created_count": len(self._subsystem_timings),
+            "total_subsystem_ms": round(sum(t["duration_ms"] for t in self._subsystem_timings.values()), 2),
+            "subsystems": subsystems
         }
         
+    def format_startup_report(self) -> str:
+        """Başlangıç raporunu okunabilir metne çevir"""
+        report = self.get_startup_report()
+        lines = [
+            "🚀 Başlangıç Raporu:",
+            f"- Ajan başlatma: {report['init_ms']} ms",
+            f"- Oluşturulan alt sistemler: {report['created_count']}/{len(report['subsystems'])} "
+            f"({report['total_subsystem_ms']} ms)"
+        ]
+        for item in report["subsystems"]:
+            if item["created"]:
+                lines.append(f"  ✅ {item['name']}: {item['duration_ms']} ms")
+            else:
+                lines.append(f"  ⏸️ {item['name']}: henüz kullanılmadı")
+        return "\n".join(lines)
+        
+    # Tembel alt sistemler
+    @property
+    def tts_engine(self):
+        return self._get_subsystem("tts_engine", self._create_tts_engine)
+        
+    @property
+    def app_index(self) -> AppIndex:
+        return self._get_subsystem("app_index", get_app_index)
+        
+    @property
+    def cursor(self) -> CursorIntegration:
+        return self._get_subsystem("cursor", CursorIntegration)
+        
+    @property
+    def shell(self):
+        return self._get_subsystem("shell", lambda: win32com_client.Dispatch("WScript.Shell"))
+        
+    @property
+    def security_manager(self) -> SecurityManager:
+        return self._get_subsystem("security_manager", SecurityManager)
+        
+    @property
+    def performance_manager(self) -> PerformanceManager:
+        return self._get_subsystem("performance_manager", PerformanceManager)
+        
+    @property
+    def error_manager(self) -> ErrorManager:
+        return self._get_subsystem("error_manager", ErrorManager)
+        
+    @property
+    def notification_manager(self) -> NotificationManager:
+        return self._get_subsystem("notification_manager", NotificationManager)
+        
+    @property
+    def automation_manager(self) -> AutomationManager:
+        return self._get_subsystem("automation_manager", self._create_automation_manager)
+        
+    @property
+    def media_manager(self) -> MediaManager:
+        return self._get_subsystem("media_manager", MediaManager)
+        
+    @property
+    def window_manager(self) -> WindowManager:
+        return self._get_subsystem("window_manager", WindowManager)
+        
+    @property
+    def system_controller(self) -> SystemController:
+        return self._get_subsystem("system_controller", SystemController)
+        
+    @property
+    def scraper(self) -> ScreenScraper:
+        return self._get_subsystem("scraper", self._create_scraper)
+        
+    @property
+    def reminder_manager(self) -> ReminderManager:
+        return self._get_subsystem("reminder_manager", ReminderManager)
+        
+    @property
+    def context_reminder(self) -> ContextReminder:
+        return self._get_subsystem("context_reminder", ContextReminder)
+        
+    @property
+    def todo_manager(self) -> CodeTodoManager:
+        return self._get_subsystem("todo_manager", CodeTodoManager)
+        
+    @property
+    def task_board(self) -> TaskBoard:
+        return self._get_subsystem("task_board", TaskBoard)
+        
+    @property
+    def model_client(self) -> ModelClient:
+        return self._get_subsystem("model_client", ModelClient)
+        
+    @property
+    def response_cache(self) -> ResponseCache:
+        return self._get_subsystem("response_cache", ResponseCache)
+        
+    @property
+    def edit_engine(self) -> EditEngine:
+        return self._get_subsystem("edit_engine", self._create_edit_engine)
+        
+    @property
+    def intent_router(self) -> IntentRouter:
+        return self._get_subsystem("intent_router", self._create_intent_router)
+        
+    def _create_automation_manager(self) -> AutomationManager:
+        """Otomasyon yöneticisini oluştur ve başlat"""
+        automation_manager = AutomationManager()
+        automation_manager.start()
+        return automation_manager
+        
+    def _start_automation(self):
+        """Otomasyon yöneticisini arka planda oluşturup başlat"""
         try:
-            # Windows kayıt defterinden kurulu uygulamaları al
-            paths = [
-                r"SOFTWARE\Microsoft\Windows\CurrentVersion\App Paths",
-                r"SOFTWARE\Microsoft\Windows\CurrentVersion\Uninstall",
-                r"SOFTWARE\WOW6432Node\Microsoft\Windows\CurrentVersion\Uninstall"
-            ]
-            
-            for reg_path in paths:
-                try:
-                    with winreg.OpenKey(winreg.HKEY_LOCAL_MACHINE, reg_path) as key:
-                        i = 0
-                        while True:
-                            try:
-                                app_key = winreg.EnumKey(key, i)
-                                with winreg.OpenKey(key, app_key) as app:
-                                    try:
-                                        path = winreg.QueryValue(app, None)
-                                        if path and path.endswith('.exe'):
-                                            name = os.path.splitext(os.path.basename(path))[0].lower()
-                                            exe = os.path.basename(path)
-                                            apps[name] = exe
-                                    except:
-                                        pass
-                                i += 1
-                            except WindowsError:
-                                break
-                except WindowsError:
-                    continue
-
-            self.logger.info(f"Bulunan uygulamalar: {list(apps.keys())}")
-            return apps
-
+            self._get_subsystem("automation_manager", self._create_automation_manager)
         except Exception as e:
-            self.logger.error(f"Uygulama listesi alınırken hata: {str(e)}")
-            return apps
+            self.logger.error(f"Otomasyon başlatma hatası: {str(e)}")
+            
+    def _create_intent_router(self) -> IntentRouter:
+        """Komut tablolarından ve uygulama indeksinden niyet yönlendiricisini derle"""
+        commands_config = self.config_manager.get_config("commands", {})
+        return IntentRouter(
+            self.INTENT_KEYWORDS,
+            config_actions=commands_config.get("actions", {}),
+            app_index=self.app_index,
+            debug=commands_config.get("router", {}).get("debug", False)
+        )
+        
+    def _create_edit_engine(self) -> EditEngine:
+        """Düzenleme motorunu config'deki bölge sınırları ve modelin istem bütçesiyle oluştur"""
+        editing_config = self.config_manager.get_config("ai", {}).get("editing", {})
+        return EditEngine(
+            max_region_lines=editing_config.get("max_region_lines", 200),
+            max_prompt_lines=editing_config.get("max_prompt_lines", 400),
+            # Düzenleme istemi geçmiş olmadan gönderilir; system prompt ve yanıt payı dışındaki her şeyi kullanabilir
+            max_prompt_tokens=self.context.available
+        )
+        
+    def _create_scraper(self) -> ScreenScraper:
+        """Ekran kazıyıcıyı oluştur (Tesseract yolu yüklemede ayarlanır)"""
+        ensure_loaded(pytesseract)
+        return ScreenScraper()
+        
+    def _create_tts_engine(self):
+        """TTS motorunu başlat"""
+        try:
+            # Önce Windows SAPI5'i dene
+            tts_engine = win32com_client.Dispatch("SAPI.SpVoice")
+            # Türkçe ses varsa onu seç
+            voices = tts_engine.GetVoices()
+            for voice in voices:
+                if "Turkish" in voice.GetDescription():
+                    tts_engine.Voice = voice
+                    break
+        except:
+            # Windows değilse pyttsx3 kullan
+            tts_engine = pyttsx3.init()
+            # Türkçe ses varsa onu seç
+            voices = tts_engine.getProperty('voices')
+            for voice in voices:
+                if "turkish" in voice.name.lower():
+                    tts_engine.setProperty('voice', voice.id)
+                    break
+            # Konuşma hızını ayarla
+            tts_engine.setProperty('rate', 150)
+        return tts_engine
         
     def show_welcome_message(self):
         """Hoş geldin mesajını göster"""
@@ -248,62 +438,185 @@ class CodeEditorAgent(BaseAgent):
         print(f"4. Çıkmak için: 'Hey Alimer dur' veya 'dur'")
         print(f"{Fore.CYAN}{'='*50}{Style.RESET_ALL}\n")
         
-    async def get_response(self, prompt: str) -> str:
+    def _build_messages(self, prompt: str) -> list:
+        """System prompt, bütçeye sığan bağlam ve yeni istemden mesaj listesini oluştur"""
+        return self.context.build_messages(prompt)
+        
+    def _remember(self, prompt: str, content: str):
+        """Bağlamı güncelle (bütçe aşılırsa eski turlar özetlenerek çıkarılır)"""
+        self.context.add("user", prompt)
+        self.context.add("assistant", content)
+        
+    async def get_response(self, prompt: str, on_complete=None, temperature: Optional[float] = None) -> str:
         try:
-            # System prompt'u config'den al
-            system_prompt = self.system_prompt
-            
-            messages = [
-                {"role": "system", "content": system_prompt},
-                *self.context,
-                {"role": "user", "content": prompt}
-            ]
-            
             # Model parametrelerini config'den kullan
-            response = await ollama.chat(
+            content = await self.model_client.chat(
                 model=self.model,
-                messages=messages,
-                temperature=self.temperature,
-                max_tokens=self.max_tokens
+                messages=self._build_messages(prompt),
+                temperature=self.temperature if temperature is None else temperature,
+                max_tokens=self.max_tokens,
+                context_window=self.context_window
             )
-            content = response['message']['content']
-            
-            # Bağlamı güncelle
-            self.context.append({"role": "user", "content": prompt})
-            self.context.append({"role": "assistant", "content": content})
-            if len(self.context) > 10:  # Son 10 mesajı tut
-                self.context = self.context[-10:]
             
+            self._remember(prompt, content)
+            if on_complete:
+                on_complete(content)
             return content
             
         except Exception as e:
             return f"❌ Hata oluştu: {str(e)}"
             
+    async def stream_response(self, prompt: str, speak: Optional[bool] = None, on_complete=None,
+                              temperature: Optional[float] = None):
+        """Yanıtı parça parça üret; tamamlanan cümleleri seslendirme kuyruğuna gönder"""
+        if speak is None:
+            speak = self.speak_streamed
+        sentences = SentenceBuffer() if speak else None
+        parts = []
+        failed = False
+        
+        # Komut içinden çağrıldıysa komut izinin alt aralığıdır, değilse kendi kök izini açar
+        with self.tracer.span("llm_stream", model=self.model) as trace:
+            start = time.perf_counter()
+            try:
+                stream = self.model_client.stream_chat(
+                    model=self.model,
+                    messages=self._build_messages(prompt),
+                    temperature=self.temperature if temperature is None else temperature,
+                    max_tokens=self.max_tokens,
+                    context_window=self.context_window
+                )
+                # Akış yarıda bırakılsa da bağlantı ve iz hemen kapanır
+                async with aclosing(stream) as chunks:
+                    async for chunk in chunks:
+                        if not parts:
+                            # Kullanıcının algıladığı gecikme: ilk parçaya kadar geçen süre
+                            trace.add_child("first_token", time.perf_counter() - start)
+                        parts.append(chunk)
+                    
+                        if sentences is not None:
+                            for sentence in sentences.feed(chunk):
+                                self._speak_async(sentence)
+                        yield chunk
+                    
+            except Exception as e:
+                failed = True
+                trace.error = str(e)
+                self.logger.error(f"Akışlı yanıt hatası: {str(e)}")
+                yield f"\n❌ Hata oluştu: {str(e)}"
+                
+            if sentences is not None:
+                rest = sentences.flush()
+                if rest:
+                    self._speak_async(rest)
+                    
+        if parts:
+            content = "".join(parts)
+            self._remember(prompt, content)
+            if on_complete and not failed:
+                on_complete(content)
+            
+    def _ask_model(self, prompt: str, cache: bool = False, refresh: bool = False):
+        """Ayara göre akışlı (async üreteç) ya da tam (coroutine) yanıt iste
+        
+        cache=True ise istek önbelleğin (düşük) sıcaklığıyla gönderilir ve aynı
+        model/sıcaklık/system prompt/istem için diskteki yanıt doğrudan (str olarak)
+        döner; refresh=True önbelleği atlayıp yanıtı yeniler.
+        """
+        on_complete = None
+        temperature = None
+        if cache:
+            temperature = self.response_cache.temperature_for(self.temperature)
+        if cache and self.response_cache.is_cacheable(temperature):
+            key = self.response_cache.make_key(self.model, temperature, self.system_prompt, prompt)
+            if not refresh:
+                cached = self.response_cache.get(key)
+                if cached is not None:
+                    self._remember(prompt, cached)
+                    return cached
+                    
+            def on_complete(content: str):
+                self.response_cache.put(key, content, {
+                    "model": self.model,
+                    "temperature": temperature,
+                    "created_at": datetime.now().isoformat()
+                })
+                
+        if self.streaming_enabled:
+            return self.stream_response(prompt, on_complete=on_complete, temperature=temperature)
+        return self.get_response(prompt, on_complete=on_complete, temperature=temperature)
+        
+    async def _ask_isolated(self, prompt: str) -> str:
+        """Konuşma bağlamına eklemeden, önbellek destekli tek seferlik istek gönder"""
+        temperature = self.response_cache.temperature_for(self.temperature)
+        cacheable = self.response_cache.is_cacheable(temperature)
+        if cacheable:
+            key = self.response_cache.make_key(self.model, temperature, self.system_prompt, prompt)
+            cached = self.response_cache.get(key)
+            if cached is not None:
+                return cached
+                
+        content = await self.model_client.chat(
+            model=self.model,
+            messages=[
+                {"role": "system", "content": self.system_prompt},
+                {"role": "user", "content": prompt}
+            ],
+            temperature=temperature,
+            max_tokens=self.max_tokens,
+            context_window=self.context_window
+        )
+        
+        if cacheable:
+            self.response_cache.put(key, content, {
+                "model": self.model,
+                "temperature": temperature,
+                "created_at": datetime.now().isoformat()
+            })
+        return content
+        
+    def _speak_async(self, text: str):
+        """Metni arka plandaki seslendirme kuyruğuna ekle"""
+        self._speech_queue.put((text, self.tracer.current_span()))
+        if self._speech_thread is None:
+            with self._subsystem_lock:
+                if self._speech_thread is None:
+                    self._speech_thread = threading.Thread(target=self._speech_worker, daemon=True)
+                    self._speech_thread.start()
+            
+    def _speech_worker(self):
+        """Kuyruktaki cümleleri sırayla seslendir"""
+        while True:
+            text, parent = self._speech_queue.get()
+            # Cümle, onu kuyruğa ekleyen komutun altında ölçülür; komut bittiyse ölçülmez
+            if parent is not None and parent.root.duration is not None:
+                parent = None
+            with self.tracer.attach(parent):
+                self.speak(self._clean_text_for_speech(text))
+            
     async def edit_file(self, file_path: str, instruction: str):
         try:
             print(f"{Fore.CYAN}📂 Dosya okunuyor: {file_path}{Style.RESET_ALL}")
-            content = Path(file_path).read_text()
-            
-            prompt = f"""
-            Dosya içeriği:
-            {content}
+            content = self.edit_engine.read(file_path)
             
-            Yapılacak değişiklik:
-            {instruction}
+            # Yalnızca talimatla ilgili fonksiyon/sınıf bölgeleri gönderilir
+            prompt, regions = self.edit_engine.build_prompt(file_path, content, instruction)
+            print(f"{Fore.CYAN}🔎 Gönderilen bölümler: {', '.join(region.name for region in regions)}{Style.RESET_ALL}")
             
-            Lütfen güncellenmiş dosya içeriğini döndür.
-            """
-            
-            updated_content = await self.get_response(prompt)
+            # Düzenleme istemi ve diff konuşma geçmişine eklenmez
+            diff_text = await self._ask_isolated(prompt)
             
             # Değişiklikleri göster
             print(f"\n{Fore.YELLOW}📝 Önerilen değişiklikler:{Style.RESET_ALL}")
-            print(updated_content)
+            print(diff_text)
             
-            # Dosyayı güncelle
-            Path(file_path).write_text(updated_content)
-            return f"{Fore.GREEN}✅ Dosya başarıyla güncellendi.{Style.RESET_ALL}"
+            # Diff doğrulanarak uygulanır; eşleşmezse dosyaya dokunulmaz
+            stats = self.edit_engine.apply(file_path, content, diff_text)
+            return (f"{Fore.GREEN}✅ Dosya başarıyla güncellendi: {stats['hunks']} parça "
+                    f"(+{stats['added']}/-{stats['removed']}){Style.RESET_ALL}")
             
+        except PatchError as e:
+            return f"{Fore.RED}❌ Değişiklik uygulanamadı, dosya değiştirilmedi: {str(e)}{Style.RESET_ALL}"
         except Exception as e:
             return f"{Fore.RED}❌ Dosya düzenlenirken hata oluştu: {str(e)}{Style.RESET_ALL}"
     
@@ -328,129 +641,200 @@ class CodeEditorAgent(BaseAgent):
         return dialog.exec() == QMessageBox.StandardButton.Yes
 
     def process_command(self, command: str) -> str:
-        """Komutu işle ve yanıt döndür"""
-        try:
-            # Performans ölçümünü başlat
-            self.performance_manager.start_command_timing(command)
-            
-            # Güvenlik kontrolü
-            if not self.security_manager.verify_command(command):
-                return "Bu komut için yetkiniz yok."
-            
-            # Komut türünü belirle ve ilgili yöneticiye yönlendir
-            command = command.lower().strip()
-            
-            # Web komutları
-            if "google" in command or "web'de" in command or "internette" in command:
-                search_term = command.replace("google'da", "").replace("google", "").replace("web'de", "").replace("internette", "").strip()
-                url = f"https://www.google.com/search?q={search_term}"
-                self._open_url(url)
-                return f"✅ Google'da '{search_term}' araması yapılıyor..."
+        """Komutu işle ve yanıt döndür
+        
+        Model yanıtı bekleyen niyetlerde coroutine ya da async üreteç döner; komut izi
+        yanıt tüketilene kadar açık kalır.
+        """
+        # İz bağlamı kopyada açılır; yanıt başka bağlamda tüketilse de çağırana sızmaz
+        return contextvars.copy_context().run(self._process_command, command)
+        
+    def _process_command(self, command: str):
+        # Her çağrı kendi kimliğiyle izlenir; iz her çıkış yolunda kapanır
+        # Eşiği aşan komut sürerken profilleyici otomatik başlar, bütçeyi aşan komut raporlanır
+        with ExitStack() as held:
+            trace = held.enter_context(self.tracer.trace("command", command=command))
+            # Profil ve bütçe izlemesi de model yanıtı tüketilene kadar sürer
+            held.enter_context(self.profiler.watch("command"))
+            held.enter_context(self.slow_commands.watch(trace))
+            try:
+                # Güvenlik kontrolü
+                with self.tracer.span("security"):
+                    allowed = self.security_manager.verify_command(command)
+                if not allowed:
+                    trace.set_intent("denied")
+                    return "Bu komut için yetkiniz yok."
+            
+                # Komut türünü tek geçişte belirle ve ilgili yöneticiye yönlendir
+                # Yol gibi büyük/küçük harf duyarlı argümanlar için özgün metin saklanır
+                original = command.strip()
+                command = command.lower().strip()
+                with self.tracer.span("routing"):
+                    route = self.intent_router.route(command)
+                trace.set_intent(route.intent)
+            
+                with self.tracer.span("handler", intent=route.intent):
+                    result = self._dispatch_intent(command, route, original)
+                if inspect.iscoroutine(result) or inspect.isasyncgen(result):
+                    return self._hold_trace(result, trace, held.pop_all())
+                return result
+            
+            except Exception as e:
+                trace.error = str(e)
+            
+                # Hatayı kaydet ve çözüm öner
+                self.error_manager.log_error(e, "command_processing")
+                solutions = self.error_manager.suggest_solutions(str(e))
+            
+                # Kullanıcıyı bilgilendir
+                error_message = f"Hata oluştu: {str(e)}"
+                if solutions:
+                    error_message += f"\nÖnerilen çözümler:\n" + "\n".join(
+                        [s["message"] for s in solutions]
+                    )
+            
+                # Bildirimi göster
+                self.notification_manager.show_notification(
+                    title=self.language_manager.get_message("command_error_title"),
+                    message=error_message,
+                    notification_type="error"
+                )
+            
+                return error_message
+            
+    def _hold_trace(self, result, trace, held: ExitStack):
+        """Model yanıtını, tüketimi bitene kadar komut izini açık tutan sarmalayıcıyla döndür"""
+        if inspect.isasyncgen(result):
+            async def stream():
+                with held, self.tracer.attach(trace), self.tracer.span("response"):
+                    async with aclosing(result) as chunks:
+                        async for chunk in chunks:
+                            yield chunk
+            return stream()
+            
+        async def wait():
+            with held, self.tracer.attach(trace), self.tracer.span("response"):
+                return await result
+        return wait()
+            
+    def handle_profile_command(self, command: str) -> str:
+        """Profilleme komutlarını işle (başlat / durdur / rapor)"""
+        if any(word in command for word in ["başlat", "aç"]):
+            if not self.performance_manager.start_profiling():
+                return "Profilleme zaten çalışıyor."
+            return "✅ Profilleme başladı. Bitirmek için 'profili durdur' deyin."
+        if any(word in command for word in ["durdur", "bitir", "kapat"]):
+            return self.performance_manager.stop_profiling()
+        return self.performance_manager.get_profile_report()
+            
+    def _dispatch_intent(self, command: str, route, original: Optional[str] = None) -> str:
+        """Belirlenen niyete göre ilgili işleyiciyi çalıştır"""
+        intent = route.intent
+        
+        # Başlangıç raporu
+        if intent == "startup_report":
+            return self.format_startup_report()
+            
+        # Yönlendirme açıklaması
+        elif intent == "explain_route":
+            target = command.split("yönlendirmeyi açıkla", 1)[-1].strip()
+            return self.intent_router.explain(target)
+            
+        # Intent başına gecikme raporu
+        elif intent == "latency_report":
+            return self.performance_manager.format_latency_report()
+            
+        # Örnekleyici profilleyici
+        elif intent == "profile":
+            return self.handle_profile_command(command)
+            
+        # Yavaş komut raporları
+        elif intent == "slow_commands":
+            return self.slow_commands.format_report()
+            
+        # Web komutları
+        elif intent == "web_search":
+            search_term = command.replace("google'da", "").replace("google", "").replace("web'de", "").replace("internette", "").strip()
+            url = f"https://www.google.com/search?q={search_term}"
+            self._open_url(url)
+            return f"✅ Google'da '{search_term}' araması yapılıyor..."
+            
+        # YouTube komutları
+        elif intent == "youtube":
+            if any(pattern in command for pattern in ["dinle", "izle", "aç", "oynat", "başlat"]):
+                search_term = command.replace("youtube'da", "").replace("youtube", "")
+                for word in ["dinle", "izle", "aç", "oynat", "başlat"]:
+                    search_term = search_term.replace(word, "")
+                return self._handle_youtube_video(search_term.strip())
+            else:
+                search_term = command.replace("youtube'da ara", "").replace("youtube ara", "").strip()
+                return self._handle_youtube_search(search_term)
                 
-            # YouTube komutları
-            elif "youtube" in command:
-                if any(pattern in command for pattern in ["dinle", "izle", "aç", "oynat", "başlat"]):
-                    search_term = command.replace("youtube'da", "").replace("youtube", "")
-                    for word in ["dinle", "izle", "aç", "oynat", "başlat"]:
-                        search_term = search_term.replace(word, "")
-                    return self._handle_youtube_video(search_term.strip())
-                else:
-                    search_term = command.replace("youtube'da ara", "").replace("youtube ara", "").strip()
-                    return self._handle_youtube_search(search_term)
+        # Uygulama komutları
+        elif intent == "open_app":
+            app_name = route.app
+            success = self.automation_manager.open_application(app_name)
+            if success:
+                time.sleep(1)  # Uygulamanın açılmasını bekle
+                return f"✅ {app_name} açılıyor..."
+            else:
+                return f"❌ {app_name} açılamadı."
                     
-            # Uygulama komutları
-            elif "aç" in command:
-                for app_name in self.common_apps:
-                    if app_name in command:
-                        success = self.automation_manager.open_application(app_name)
-                        if success:
-                            time.sleep(1)  # Uygulamanın açılmasını bekle
-                            return f"✅ {app_name} açılıyor..."
-                        else:
-                            return f"❌ {app_name} açılamadı."
-                        
-            # Pencere komutları
-            elif any(word in command for word in ["pencere", "ekran", "uygulama"]):
-                return self.handle_window_command(command)
-                
-            # Medya komutları
-            elif any(word in command for word in ["ses", "parlaklık", "müzik", "video"]):
-                return self.handle_media_command(command)
-                
-            # Bildirim komutları
-            elif "bildirim" in command:
-                return self.handle_notification_command(command)
-                
-            # Geliştirme komutları
-            elif any(word in command for word in ["geliştir", "düzenle", "ekle", "yaz", "oluştur"]):
-                return self.handle_development(command)
-                
-            # İnceleme komutları
-            elif any(word in command for word in ["incele", "kontrol et", "review", "gözden geçir"]):
-                return self.handle_code_review(command)
-                
-            # Görev yönetimi
-            elif any(word in command for word in ["görev", "task", "todo"]):
-                return self.handle_task_management(command)
-                
-            # Sistem komutları
-            elif any(word in command for word in ["sistem", "bilgisayar", "pc"]):
-                return self.handle_system_operations(command)
-                
-            # Yazı yazma komutları
-            elif any(word in command for word in ["yaz", "yazdır", "metin gir"]):
-                text = command.split("yaz", 1)[-1].strip()
-                if not text:
-                    text = command.split("yazdır", 1)[-1].strip()
-                if not text:
-                    text = command.split("metin gir", 1)[-1].strip()
-                
-                if text:
-                    import pyautogui
-                    import pygetwindow as gw
+        # Pencere komutları
+        elif intent == "window":
+            return self.handle_window_command(command)
+            
+        # Medya komutları
+        elif intent == "media":
+            return self.handle_media_command(command)
+            
+        # Bildirim komutları
+        elif intent == "notification":
+            return self.handle_notification_command(command)
+            
+        # Geliştirme komutları
+        elif intent == "development":
+            return self.handle_development(command)
+            
+        # İnceleme komutları
+        elif intent == "review":
+            return self.handle_code_review(command, original)
+            
+        # Görev yönetimi
+        elif intent == "task":
+            return self.handle_task_management(command)
+            
+        # Sistem komutları
+        elif intent == "system":
+            return self.handle_system_operations(command)
+            
+        # Yazı yazma komutları
+        elif intent == "type_text":
+            text = command.split("yaz", 1)[-1].strip()
+            if not text:
+                text = command.split("yazdır", 1)[-1].strip()
+            if not text:
+                text = command.split("metin gir", 1)[-1].strip()
+            
+            if text:
+                # Aktif pencereyi al
+                active_window = gw.getActiveWindow()
+                if active_window:
+                    # Pencereyi aktif et
+                    active_window.activate()
+                    time.sleep(0.5)  # Pencerenin aktif olmasını bekle
                     
-                    # Aktif pencereyi al
-                    active_window = gw.getActiveWindow()
-                    if active_window:
-                        # Pencereyi aktif et
-                        active_window.activate()
-                        time.sleep(0.5)  # Pencerenin aktif olmasını bekle
-                        
-                        # Metni yaz
-                        pyautogui.write(text)
-                        return f"✅ Metin yazıldı: {text}"
-                    else:
-                        return "❌ Aktif pencere bulunamadı."
+                    # Metni yaz
+                    pyautogui.write(text)
+                    return f"✅ Metin yazıldı: {text}"
                 else:
-                    return "❌ Yazılacak metin bulunamadı."
-                
-            # Bilinmeyen komut
+                    return "❌ Aktif pencere bulunamadı."
             else:
-                return "❌ Komut anlaşılamadı. Lütfen tekrar deneyin."
+                return "❌ Yazılacak metin bulunamadı."
             
-            # Performans ölçümünü bitir
-            self.performance_manager.end_command_timing(command)
-            
-        except Exception as e:
-            # Hatayı kaydet ve çözüm öner
-            self.error_manager.log_error(str(e), "command_processing")
-            solutions = self.error_manager.suggest_solutions(str(e))
-            
-            # Kullanıcıyı bilgilendir
-            error_message = f"Hata oluştu: {str(e)}"
-            if solutions:
-                error_message += f"\nÖnerilen çözümler:\n" + "\n".join(
-                    [s["message"] for s in solutions]
-                )
-            
-            # Bildirimi göster
-            self.notification_manager.show_notification(
-                title=self.language_manager.get_message("command_error_title"),
-                message=error_message,
-                notification_type="error"
-            )
-            
-            return error_message
+        # Bilinmeyen komut
+        else:
+            return "❌ Komut anlaşılamadı. Lütfen tekrar deneyin."
             
     def handle_window_command(self, command: str) -> str:
         """Pencere komutlarını işle"""
@@ -463,7 +847,7 @@ class CodeEditorAgent(BaseAgent):
                 return "Pencereler döşendi"
             # ... diğer pencere komutları
         except Exception as e:
-            self.error_manager.log_error(str(e), "window_command")
+            self.error_manager.log_error(e, "window_command")
             return f"Pencere kontrolü hatası: {str(e)}"
             
     def handle_media_command(self, command: str) -> str:
@@ -481,7 +865,7 @@ class CodeEditorAgent(BaseAgent):
                     return self.media_manager.control_brightness("down")
             # ... diğer medya komutları
         except Exception as e:
-            self.error_manager.log_error(str(e), "media_command")
+            self.error_manager.log_error(e, "media_command")
             return f"Medya kontrolü hatası: {str(e)}"
 
     def handle_notification_command(self, command: str) -> str:
@@ -490,7 +874,7 @@ class CodeEditorAgent(BaseAgent):
             # Bildirim işlemleri burada yapılabilir
             return "Bildirim işlemleri burada yapılabilir"
         except Exception as e:
-            self.error_manager.log_error(str(e), "notification_command")
+            self.error_manager.log_error(e, "notification_command")
             return f"Bildirim işlemleri hatası: {str(e)}"
 
     def _handle_youtube_video(self, search_term: str) -> str:
@@ -530,36 +914,11 @@ class CodeEditorAgent(BaseAgent):
 
     def _extract_url_from_command(self, cmd: str) -> Optional[str]:
         """Komuttan URL çıkar"""
-        # URL kalıplarını kontrol et
-        for pattern in [self.command_patterns['web_open'][0], self.command_patterns['web_open'][1]]:
-            matches = re.findall(pattern, cmd)
-            if matches:
-                url = matches[0]
-                if not url.startswith('http'):
-                    url = 'https://' + url
-                return url
-        
-        # YouTube özel kontrolü
-        if "youtube" in cmd.lower():
-            # Video ID veya playlist ID kontrolü
-            video_id = self._extract_youtube_id(cmd)
-            if video_id:
-                return f"https://www.youtube.com/watch?v={video_id}"
-        
-        return None
+        return command_patterns.extract_url_from_command(cmd)
 
     def _extract_youtube_id(self, text: str) -> Optional[str]:
         """YouTube video/playlist ID çıkar"""
-        patterns = [
-            r'(?:youtube\.com\/watch\?v=|youtu\.be\/|youtube\.com\/embed\/|youtube\.com\/v\/|youtube\.com\/\?v=)([^&\n?]+)',
-            r'(?:youtube\.com\/playlist\?list=)([^&\n?]+)',
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, text)
-            if match:
-                return match.group(1)
-        return None
+        return command_patterns.extract_youtube_id(text)
 
     def _open_url(self, url: str):
         """URL'yi varsayılan tarayıcıda aç"""
@@ -851,55 +1210,22 @@ class CodeEditorAgent(BaseAgent):
             
     def _extract_path(self, cmd: str, type_hint="") -> str:
         """Komuttan dosya/klasör yolunu çıkarır"""
-        # Basit bir implementasyon - geliştirilebilir
-        words = cmd.split()
-        for i, word in enumerate(words):
-            if "." in word or "\\" in word or "/" in word:
-                return word
-        return ""
+        return command_patterns.extract_path(cmd)
         
     def _extract_url(self, cmd: str) -> str:
         """Komuttan URL'yi çıkarır"""
-        words = cmd.split()
-        for word in words:
-            if word.startswith(("http://", "https://", "www.")):
-                return word
-            elif "." in word and " " not in word:
-                return f"https://{word}"
-        return ""
+        return command_patterns.extract_url(cmd)
         
     def _extract_coordinates(self, cmd: str) -> tuple:
         """Komuttan koordinatları çıkarır"""
-        # Örnek: "500,300 koordinatlarına tıkla"
-        for word in cmd.split():
-            if "," in word:
-                try:
-                    x, y = map(int, word.split(","))
-                    return (x, y)
-                except:
-                    pass
-        return pyautogui.position()  # Mevcut fare pozisyonu
+        coordinates = command_patterns.extract_coordinates(cmd)
+        if coordinates is None:
+            return pyautogui.position()  # Mevcut fare pozisyonu
+        return coordinates
         
     def _extract_scroll_amount(self, cmd: str) -> int:
         """Komuttan kaydırma miktarını çıkarır"""
-        # Yukarı/aşağı yönünü ve miktarı belirle
-        amount = 3  # Varsayılan miktar
-        if "yukarı" in cmd:
-            amount *= 1
-        elif "aşağı" in cmd:
-            amount *= -1
-            
-        # Sayısal değer varsa onu kullan
-        words = cmd.split()
-        for word in words:
-            try:
-                num = int(word)
-                amount = num if "yukarı" in cmd else -num
-                break
-            except:
-                continue
-                
-        return amount 
+        return command_patterns.extract_scroll_amount(cmd)
 
     def handle_keyboard_shortcut(self, cmd: str) -> str:
         """Klavye kısayollarını yönetir"""
@@ -937,7 +1263,7 @@ class CodeEditorAgent(BaseAgent):
                 return f"✅ Parlaklık {new_brightness}% yapıldı"
             elif "ayarla" in cmd:
                 # Sayıyı bul
-                numbers = re.findall(r'\d+', cmd)
+                numbers = PATTERNS['number'].findall(cmd)
                 if numbers:
                     brightness = min(max(int(numbers[0]), 0), 100)
                     sbc.set_brightness(brightness)
@@ -950,7 +1276,7 @@ class CodeEditorAgent(BaseAgent):
         """Hatırlatıcı ve zamanlayıcı işlemlerini yönetir"""
         try:
             # Zamanı çıkar (örn: "5 dakika sonra", "2 saat sonra")
-            time_match = re.search(r'(\d+)\s*(dakika|saat|saniye)', cmd)
+            time_match = PATTERNS['timer_amount'].search(cmd)
             if time_match:
                 amount = int(time_match.group(1))
                 unit = time_match.group(2)
@@ -1089,70 +1415,27 @@ class CodeEditorAgent(BaseAgent):
             
     def _extract_target_text(self, cmd: str) -> str:
         """Komuttan hedef metni çıkarır"""
-        # Tırnak içindeki metni ara
-        quoted = re.findall(r'"([^"]*)"', cmd)
-        if quoted:
-            return quoted[0]
-            
-        # Özel kelimeleri temizle
-        words = cmd.replace("tıkla", "").replace("bas", "").replace("seç", "")
-        words = words.replace("yazı", "").replace("metin", "").replace("buton", "")
-        words = words.replace("tab", "").replace("sekme", "").replace("pencere", "")
-        
-        # Son kelimeyi al
-        words = words.strip().split()
-        if words:
-            return words[-1]
-            
-        return ""
+        return command_patterns.extract_target_text(cmd)
 
     def speak(self, text: str):
         """Metni seslendir"""
         try:
             # Emoji ve özel karakterleri temizle
-            text = re.sub(r'[^\w\s.,?!]', '', text)
-            self.tts_engine.say(text)
-            self.tts_engine.runAndWait()
+            text = PATTERNS['speech_unsafe'].sub('', text)
+            # Komut dışında (ör. arka planda) seslendirme kök iz açmaz
+            with self.tracer.child_span("tts"):
+                self.tts_engine.say(text)
+                self.tts_engine.runAndWait()
         except Exception as e:
             self.logger.error(f"Konuşma hatası: {str(e)}")
             
     def _clean_text_for_speech(self, text: str) -> str:
         """Metni seslendirme için temizle"""
-        # Emoji ve özel karakterleri temizle
-        emoji_pattern = re.compile("["
-            u"\U0001F600-\U0001F64F"  # emoticons
-            u"\U0001F300-\U0001F5FF"  # symbols & pictographs
-            u"\U0001F680-\U0001F6FF"  # transport & map symbols
-            u"\U0001F1E0-\U0001F1FF"  # flags (iOS)
-            u"\U00002702-\U000027B0"
-            u"\U000024C2-\U0001F251"
-            "]+", flags=re.UNICODE)
-        
-        text = emoji_pattern.sub(r'', text)
-        
-        # Özel karakterleri düzelt
-        replacements = {
-            "✅": "tamam",
-            "❌": "hata",
-            "→": "ok",
-            "•": "",
-            "|": "",
-            "*": "",
-            "#": "",
-            "`": "",
-        }
-        
-        for old, new in replacements.items():
-            text = text.replace(old, new)
-            
-        return text
+        return command_patterns.clean_text_for_speech(text)
 
     def handle_screen_scraping(self, cmd: str) -> str:
         """Ekran üzerinden veri çekme işlemlerini yönet"""
         try:
-            if not hasattr(self, 'scraper'):
-                self.scraper = ScreenScraper()
-            
             if "seç" in cmd.lower() or "alan" in cmd.lower():
                 self.speak("Lütfen veri çekmek istediğiniz alanı fare ile seçin")
                 screenshot = self.scraper.capture_area()
@@ -1186,9 +1469,6 @@ class CodeEditorAgent(BaseAgent):
     def handle_system_control(self, cmd: str) -> str:
         """Sistem kontrol komutlarını işle"""
         try:
-            if not hasattr(self, 'system_controller'):
-                self.system_controller = SystemController()
-            
             if "parlaklık" in cmd:
                 if "artır" in cmd:
                     return self.system_controller.control_brightness(increase=True)
@@ -1216,13 +1496,10 @@ class CodeEditorAgent(BaseAgent):
     def handle_reminders(self, cmd: str) -> str:
         """Hatırlatıcı komutlarını işle"""
         try:
-            if not hasattr(self, 'reminder_manager'):
-                self.reminder_manager = ReminderManager()
-            
             if "hatırlat" in cmd:
                 # Basit NLP ile zamanı ve metni ayır
-                text = re.search(r"hatırlat\s+(.+?)\s+(?:saat|gün|dakika)", cmd)
-                when = re.search(r"(\d+)\s+(saat|gün|dakika)", cmd)
+                text = PATTERNS['reminder_text'].search(cmd)
+                when = PATTERNS['reminder_when'].search(cmd)
                 
                 if text and when:
                     text = text.group(1)
@@ -1247,13 +1524,10 @@ class CodeEditorAgent(BaseAgent):
     def handle_context_reminder(self, cmd: str) -> str:
         """Bağlamsal hatırlatıcıları yönet"""
         try:
-            if not hasattr(self, 'context_reminder'):
-                self.context_reminder = ContextReminder()
-            
             # Hatırlatıcı ekleme
             if "daha sonra" in cmd or "hatırlat" in cmd:
                 # Bağlamı ve hatırlatıcı metnini ayır
-                context_match = re.search(r"(?:yaparken|ederken|için)\s+(.+?)\s+(?:hatırlat|daha sonra)", cmd)
+                context_match = PATTERNS['reminder_context'].search(cmd)
                 text = cmd.split("hatırlat")[-1].strip() if "hatırlat" in cmd else cmd.split("daha sonra")[-1].strip()
                 
                 context = context_match.group(1) if context_match else None
@@ -1278,11 +1552,8 @@ class CodeEditorAgent(BaseAgent):
     def handle_code_todo(self, cmd: str) -> str:
         """Kod TODO notlarını yönet"""
         try:
-            if not hasattr(self, 'todo_manager'):
-                self.todo_manager = CodeTodoManager()
-            
             # Dosya adını ve mesajı ayıkla
-            file_match = re.search(r'(?:dosyasına|dosyaya|burada)\s+(.+?)\s+(?:için|diye)', cmd)
+            file_match = PATTERNS['todo_file'].search(cmd)
             message = cmd.split("not ekle")[-1].strip() if "not ekle" in cmd else None
             
             if file_match and message:
@@ -1311,13 +1582,10 @@ class CodeEditorAgent(BaseAgent):
     def handle_task_management(self, cmd: str) -> str:
         """Görev yönetimi komutlarını işle"""
         try:
-            if not hasattr(self, 'task_board'):
-                self.task_board = TaskBoard()
-            
             # Yeni görev ekleme
             if "yeni görev" in cmd or "task ekle" in cmd:
-                title = re.search(r"(?:görev|task)\s+(.+?)(?:\s+öncelik|$)", cmd)
-                priority_match = re.search(r"öncelik\s+(yüksek|orta|düşük)", cmd, re.IGNORECASE)
+                title = PATTERNS['task_title'].search(cmd)
+                priority_match = PATTERNS['task_priority'].search(cmd)
                 
                 if title:
                     priority = "HIGH" if priority_match and "yüksek" in priority_match.group(1).lower() else \
@@ -1328,7 +1596,7 @@ class CodeEditorAgent(BaseAgent):
                 
             # Görev durumu güncelleme
             elif any(status in cmd.lower() for status in ["başla", "tamamla", "iptal et"]):
-                task_id = re.search(r"görev\s+(\d+)", cmd)
+                task_id = PATTERNS['task_id'].search(cmd)
                 if task_id:
                     status = TaskStatus.IN_PROGRESS if "başla" in cmd else \
                              TaskStatus.COMPLETED if "tamamla" in cmd else \
@@ -1356,7 +1624,7 @@ class CodeEditorAgent(BaseAgent):
                 
             # Görev detayları
             elif "görev detay" in cmd:
-                task_id = re.search(r"görev\s+(\d+)", cmd)
+                task_id = PATTERNS['task_id'].search(cmd)
                 if task_id:
                     details = self.task_board.get_task_details(task_id.group(1))
                     if details:
@@ -1388,7 +1656,7 @@ class CodeEditorAgent(BaseAgent):
         try:
             # Geliştirme komutlarını işle
             if "yeni dosya" in cmd or "oluştur" in cmd:
-                file_match = re.search(r'(?:dosya|file)\s+(.+?)(?:\s+|$)', cmd)
+                file_match = PATTERNS['file_name'].search(cmd)
                 if file_match:
                     file_path = file_match.group(1)
                     if not Path(file_path).suffix:
@@ -1413,11 +1681,19 @@ class CodeEditorAgent(BaseAgent):
             )
             return self.language_manager.get_message("failure", reason=str(e))
 
-    def handle_code_review(self, cmd: str) -> str:
-        """Kod inceleme işlemleri"""
+    def handle_code_review(self, cmd: str, original: Optional[str] = None) -> str:
+        """Kod inceleme işlemleri (yollar, küçük harfe çevrilmemiş özgün komuttan alınır)"""
+        original = original or cmd
         try:
+            # Toplu inceleme: dizin ya da glob içindeki tüm dosyalar
+            batch_match = PATTERNS['batch_target'].search(original)
+            if batch_match:
+                review_config = self.config_manager.get_config("ai", {}).get("batch_review", {})
+                reviewer = BatchReviewer(self._ask_isolated, review_config)
+                return reviewer.review(batch_match.group(1).strip())
+                
             # Kod inceleme komutlarını işle
-            if "incele" in cmd or "review" in cmd:
+            elif "incele" in cmd or "review" in cmd:
                 if hasattr(self, 'current_file'):
                     content = Path(self.current_file).read_text()
                     prompt = f"""
@@ -1429,18 +1705,18 @@ class CodeEditorAgent(BaseAgent):
                     2. Olası hatalar
                     3. İyileştirme önerileri
                     """
-                    return self.get_response(prompt)
+                    return self._ask_model(prompt, cache=True, refresh="yeniden" in cmd)
                 else:
                     return "❌ Lütfen önce bir dosya seçin"
                     
             elif "kontrol et" in cmd:
                 # Belirli bir dosyayı kontrol et
-                file_match = re.search(r'(?:dosya|file)\s+(.+?)(?:\s+|$)', cmd)
+                file_match = PATTERNS['file_name'].search(original)
                 if file_match:
                     file_path = file_match.group(1)
                     if Path(file_path).exists():
                         content = Path(file_path).read_text()
-                        return self.get_response(f"Bu dosyayı kontrol et:\n{content}")
+                        return self._ask_model(f"Bu dosyayı kontrol et:\n{content}", cache=True, refresh="yeniden" in cmd)
                     else:
                         return f"❌ Dosya bulunamadı: {file_path}"
                         
@@ -2,6 +2,13 @@ import re
 from pathlib import Path
 from datetime import datetime
 
+# Fonksiyon/sınıf tanımı satırı
+DEFINITION_PATTERN = re.compile(r'^\s*(?:async\s+)?(?:def|class)\s+\w+')
+
+def find_definition_lines(lines: list) -> list:
+    """Fonksiyon ve sınıf tanımlarının satır indekslerini bul"""
+    return [i for i, line in enumerate(lines) if DEFINITION_PATTERN.match(line)]
+
 class CodeTodoManager:
     def __init__(self):
         self.current_file = None
@@ -76,10 +83,7 @@ class CodeTodoManager:
     def _find_suitable_line(self, lines: list) -> int:
         """TODO notu için uygun satırı bul"""
         # Fonksiyon tanımlamalarını bul
-        function_lines = []
-        for i, line in enumerate(lines):
-            if re.match(r'^\s*(?:def|class)\s+\w+', line):
-                function_lines.append(i)
+        function_lines = find_definition_lines(lines)
                 
         if not function_lines:
             return 0  # Dosya boşsa başa ekle
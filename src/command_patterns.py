@@ -0,0 +1,252 @@
+import re
+import time
+from functools import lru_cache
+from typing import Dict, List, Optional, Pattern, Tuple
+
+# Son ifade → çıkarım sonuçları için önbellek boyutu (çıkarıcı başına)
+EXTRACTION_CACHE_SIZE = 256
+
+# Çok kalıplı komut grupları (sırayla denenir)
+COMMAND_PATTERNS: Dict[str, List[Pattern]] = {
+    'youtube_search': [
+        re.compile(r'youtube(?:\'da)?\s+(.*?)(?:dinle|izle|aç|arat|bul|ara)'),
+        re.compile(r'(.*?)(?:dinle|izle|aç)\s+youtube(?:\'da)?'),
+    ],
+    'youtube_video': [
+        re.compile(r'youtube(?:\'da)?\s+(.*?)(?:videosunu|şarkısını|müziğini)?\s+(?:aç|oynat|başlat|dinle)'),
+        re.compile(r'(.*?)(?:videosunu|şarkısını|müziğini)?\s+(?:youtube(?:\'da)?\s+)?(?:aç|oynat|başlat|dinle)'),
+    ],
+    'web_open': [
+        re.compile(r'(?:aç|git|ziyaret et)\s+((?:https?://)?(?:[\w-]+\.)+[\w-]+(?:/[^\s]*)?)'),
+        re.compile(r'((?:https?://)?(?:[\w-]+\.)+[\w-]+(?:/[^\s]*)?)(?:\s+(?:aç|git|ziyaret et))'),
+    ],
+    'close_app': [
+        re.compile(r'(.*?)(?:\s+)?(?:kapat|sonlandır|çık)'),
+        re.compile(r'(?:kapat|sonlandır|çık)\s+(.*)'),
+    ],
+    'youtube_id': [
+        re.compile(r'(?:youtube\.com\/watch\?v=|youtu\.be\/|youtube\.com\/embed\/|youtube\.com\/v\/|youtube\.com\/\?v=)([^&\s?]+)'),
+        re.compile(r'(?:youtube\.com\/playlist\?list=)([^&\s?]+)'),
+    ],
+}
+
+# Tekil kalıplar
+PATTERNS: Dict[str, Pattern] = {
+    'number': re.compile(r'\d+'),
+    'quoted': re.compile(r'"([^"]*)"'),
+    'speech_unsafe': re.compile(r'[^\w\s.,?!]'),
+    'emoji': re.compile("["
+        u"\U0001F600-\U0001F64F"  # emoticons
+        u"\U0001F300-\U0001F5FF"  # symbols & pictographs
+        u"\U0001F680-\U0001F6FF"  # transport & map symbols
+        u"\U0001F1E0-\U0001F1FF"  # flags (iOS)
+        u"\U00002702-\U000027B0"
+        u"\U000024C2-\U0001F251"
+        "]+", flags=re.UNICODE),
+    'timer_amount': re.compile(r'(\d+)\s*(dakika|saat|saniye)'),
+    'reminder_text': re.compile(r"hatırlat\s+(.+?)\s+(?:saat|gün|dakika)"),
+    'reminder_when': re.compile(r"(\d+)\s+(saat|gün|dakika)"),
+    'reminder_context': re.compile(r"(?:yaparken|ederken|için)\s+(.+?)\s+(?:hatırlat|daha sonra)"),
+    'todo_file': re.compile(r'(?:dosyasına|dosyaya|burada)\s+(.+?)\s+(?:için|diye)'),
+    'task_title': re.compile(r"(?:görev|task)\s+(.+?)(?:\s+öncelik|$)"),
+    'task_priority': re.compile(r"öncelik\s+(yüksek|orta|düşük)", re.IGNORECASE),
+    'task_id': re.compile(r"görev\s+(\d+)"),
+    'file_name': re.compile(r'(?:dosya|file)\s+(.+?)(?:\s+|$)', re.IGNORECASE),
+    # Yol özgün (küçük harfe çevrilmemiş) komuttan alınır
+    'batch_target': re.compile(r'(?:toplu|klasör\w*)\s+(?:incele|kontrol et|review)\s+(.+)$', re.IGNORECASE),
+}
+
+# Seslendirmede okunmayacak/okunuşu değişecek karakterler
+SPEECH_REPLACEMENTS = {
+    "✅": "tamam",
+    "❌": "hata",
+    "→": "ok",
+    "•": "",
+    "|": "",
+    "*": "",
+    "#": "",
+    "`": "",
+}
+
+# Hedef metin çıkarımında atılan komut kelimeleri
+TARGET_STOP_WORDS = ("tıkla", "bas", "seç", "yazı", "metin", "buton", "tab", "sekme", "pencere")
+
+def get_pattern(name: str) -> Pattern:
+    """Derlenmiş tekil kalıbı getir"""
+    return PATTERNS[name]
+
+def get_patterns(name: str) -> List[Pattern]:
+    """Derlenmiş kalıp grubunu getir"""
+    return COMMAND_PATTERNS[name]
+
+@lru_cache(maxsize=EXTRACTION_CACHE_SIZE)
+def extract_youtube_id(text: str) -> Optional[str]:
+    """YouTube video/playlist ID çıkar"""
+    for pattern in COMMAND_PATTERNS['youtube_id']:
+        match = pattern.search(text)
+        if match:
+            return match.group(1)
+    return None
+
+@lru_cache(maxsize=EXTRACTION_CACHE_SIZE)
+def extract_url_from_command(cmd: str) -> Optional[str]:
+    """Komuttan URL çıkar"""
+    for pattern in COMMAND_PATTERNS['web_open']:
+        matches = pattern.findall(cmd)
+        if matches:
+            url = matches[0]
+            if not url.startswith('http'):
+                url = 'https://' + url
+            return url
+
+    # YouTube özel kontrolü
+    if "youtube" in cmd.lower():
+        video_id = extract_youtube_id(cmd)
+        if video_id:
+            return f"https://www.youtube.com/watch?v={video_id}"
+
+    return None
+
+@lru_cache(maxsize=EXTRACTION_CACHE_SIZE)
+def extract_path(cmd: str) -> str:
+    """Komuttan dosya/klasör yolunu çıkarır"""
+    for word in cmd.split():
+        if "." in word or "\\" in word or "/" in word:
+            return word
+    return ""
+
+@lru_cache(maxsize=EXTRACTION_CACHE_SIZE)
+def extract_url(cmd: str) -> str:
+    """Komuttan URL'yi çıkarır"""
+    for word in cmd.split():
+        if word.startswith(("http://", "https://", "www.")):
+            return word
+        elif "." in word:
+            return f"https://{word}"
+    return ""
+
+@lru_cache(maxsize=EXTRACTION_CACHE_SIZE)
+def extract_coordinates(cmd: str) -> Optional[Tuple[int, int]]:
+    """Komuttan koordinatları çıkarır (örn: "500,300 koordinatlarına tıkla")"""
+    for word in cmd.split():
+        if "," in word:
+            try:
+                x, y = map(int, word.split(","))
+                return (x, y)
+            except ValueError:
+                pass
+    return None
+
+@lru_cache(maxsize=EXTRACTION_CACHE_SIZE)
+def extract_scroll_amount(cmd: str) -> int:
+    """Komuttan kaydırma miktarını çıkarır"""
+    amount = 3  # Varsayılan miktar
+    if "aşağı" in cmd and "yukarı" not in cmd:
+        amount = -amount
+
+    # Sayısal değer varsa onu kullan
+    for word in cmd.split():
+        try:
+            num = int(word)
+            amount = num if "yukarı" in cmd else -num
+            break
+        except ValueError:
+            continue
+
+    return amount
+
+@lru_cache(maxsize=EXTRACTION_CACHE_SIZE)
+def extract_target_text(cmd: str) -> str:
+    """Komuttan hedef metni çıkarır"""
+    # Tırnak içindeki metni ara
+    quoted = PATTERNS['quoted'].findall(cmd)
+    if quoted:
+        return quoted[0]
+
+    # Özel kelimeleri temizle ve son kelimeyi al
+    words = cmd
+    for stop_word in TARGET_STOP_WORDS:
+        words = words.replace(stop_word, "")
+    words = words.strip().split()
+    if words:
+        return words[-1]
+
+    return ""
+
+@lru_cache(maxsize=EXTRACTION_CACHE_SIZE)
+def clean_text_for_speech(text: str) -> str:
+    """Metni seslendirme için temizle"""
+    text = PATTERNS['emoji'].sub('', text)
+    for old, new in SPEECH_REPLACEMENTS.items():
+        text = text.replace(old, new)
+    return text
+
+EXTRACTORS = {
+    "youtube_id": extract_youtube_id,
+    "url_from_command": extract_url_from_command,
+    "path": extract_path,
+    "url": extract_url,
+    "coordinates": extract_coordinates,
+    "scroll_amount": extract_scroll_amount,
+    "target_text": extract_target_text,
+    "clean_text_for_speech": clean_text_for_speech,
+}
+
+def get_cache_info() -> Dict[str, dict]:
+    """Çıkarıcı önbelleklerinin isabet/ıska istatistiklerini getir"""
+    info = {}
+    for name, extractor in EXTRACTORS.items():
+        stats = extractor.cache_info()
+        info[name] = {
+            "hits": stats.hits,
+            "misses": stats.misses,
+            "size": stats.currsize,
+            "maxsize": stats.maxsize
+        }
+    return info
+
+def clear_caches():
+    """Tüm çıkarım önbelleklerini temizle"""
+    for extractor in EXTRACTORS.values():
+        extractor.cache_clear()
+
+# Mikro kıyaslama için örnek ifadeler
+BENCHMARK_SAMPLES = {
+    "youtube_id": "youtube.com/watch?v=dQw4w9WgXcQ aç",
+    "url_from_command": "aç github.com/user/repo",
+    "path": "C:/projeler/main.py dosyasını aç",
+    "url": "www.google.com adresine git",
+    "coordinates": "500,300 koordinatlarına tıkla",
+    "scroll_amount": "sayfayı 5 aşağı kaydır",
+    "target_text": 'kaydet "Tamam" butonuna tıkla',
+    "clean_text_for_speech": "✅ Görev eklendi 😀 → #1 `yüksek` öncelik",
+}
+
+def benchmark(iterations: int = 10000) -> Dict[str, dict]:
+    """Her çıkarıcı için önbellekli ve önbelleksiz çağrı süresini ölç (µs/çağrı)"""
+    results = {}
+    for name, extractor in EXTRACTORS.items():
+        sample = BENCHMARK_SAMPLES[name]
+
+        start = time.perf_counter()
+        for _ in range(iterations):
+            extractor.__wrapped__(sample)
+        uncached = (time.perf_counter() - start) / iterations
+
+        extractor(sample)
+        start = time.perf_counter()
+        for _ in range(iterations):
+            extractor(sample)
+        cached = (time.perf_counter() - start) / iterations
+
+        results[name] = {
+            "uncached_us": round(uncached * 1e6, 3),
+            "cached_us": round(cached * 1e6, 3),
+            "speedup": round(uncached / cached, 1) if cached else None
+        }
+    return results
+
+if __name__ == "__main__":
+    for name, result in benchmark().items():
+        print(f"{name:24} önbelleksiz {result['uncached_us']:8.3f} µs | "
+              f"önbellekli {result['cached_us']:8.3f} µs | x{result['speedup']}")
@@ -14,7 +14,24 @@ import requests
 import os
 import tempfile
 
+# Süreç genelinde paylaşılan örnek
+_shared_instance = None
+_shared_lock = threading.Lock()
+
+def get_config_manager() -> "ConfigManager":
+    """Süreç genelinde paylaşılan ConfigManager örneğini getir"""
+    global _shared_instance
+    if _shared_instance is None:
+        with _shared_lock:
+            if _shared_instance is None:
+                _shared_instance = ConfigManager()
+    return _shared_instance
+
 class ConfigManager:
+    # Yedekleme/senkronizasyon thread'leri süreç başına bir kez başlatılır
+    _workers_started = False
+    _workers_lock = threading.Lock()
+    
     def __init__(self):
         self.config_dir = Path("config")  # Ana dizindeki config klasörü
         self.backup_dir = Path("data/backups")
@@ -29,7 +46,10 @@ class ConfigManager:
         
         # Değişiklik izleme
         self._last_modified = {}
-        self._config_lock = threading.Lock()
+        self._config_lock = threading.RLock()
+        
+        # Thread-safe yapı için lock
+        self._lock = threading.Lock()
         
         # Şema ve varsayılan yapılandırmayı yükle
         self.schema = self._load_schema()
@@ -41,9 +61,6 @@ class ConfigManager:
         # Kullanıcı yapılandırma şablonunu oluştur
         self._create_user_config_template()
         
-        # Otomatik yedekleme için zamanlayıcı başlat
-        self._start_backup_timer()
-        
         # Şifreleme için
         self.encryption_key = self._load_or_create_encryption_key()
         self.encryption_enabled = self.config.get("security", {}).get("data_privacy", {}).get("encryption_enabled", False)
@@ -51,10 +68,20 @@ class ConfigManager:
         # Senkronizasyon için
         self.sync_interval = 300  # 5 dakika
         self.sync_url = "https://api.example.com/config/sync"  # Örnek URL
-        self._start_sync_timer()
         
-        # Thread-safe yapı için lock eklenmeli
-        self._lock = threading.Lock()
+        # Yedekleme ve senkronizasyon zamanlayıcılarını başlat (süreç başına bir kez)
+        self._start_background_workers()
+        
+    def _start_background_workers(self):
+        """Yedekleme ve senkronizasyon thread'lerini süreçte yalnızca bir kez başlat"""
+        with ConfigManager._workers_lock:
+            if ConfigManager._workers_started:
+                self.logger.debug("Arka plan thread'leri zaten çalışıyor, yeniden başlatılmadı")
+                return
+            ConfigManager._workers_started = True
+            
+        self._start_backup_timer()
+        self._start_sync_timer()
         
     def _start_backup_timer(self):
         """Otomatik yedekleme zamanlayıcısını başlat"""
@@ -265,24 +292,25 @@ class ConfigManager:
     def update_config(self, section: str, key: str, value: Any) -> bool:
         """Yapılandırmayı güncelle ve doğrula"""
         try:
-            # Derin güncelleme yap
-            current = self.config.get(section, {})
-            keys = key.split('.')
-            temp = current
-            for k in keys[:-1]:
-                temp = temp.setdefault(k, {})
-            temp[keys[-1]] = value
-            
-            # Değişiklikleri geçici olarak uygula
-            temp_config = self.config.copy()
-            temp_config[section] = current
-            
-            # Doğrula
-            if self._validate_config(temp_config):
-                self.config = temp_config
-                self._save_config(self.config)
-                return True
-            return False
+            with self._config_lock:
+                # Derin güncelleme yap
+                current = self.config.get(section, {})
+                keys = key.split('.')
+                temp = current
+                for k in keys[:-1]:
+                    temp = temp.setdefault(k, {})
+                temp[keys[-1]] = value
+                
+                # Değişiklikleri geçici olarak uygula
+                temp_config = self.config.copy()
+                temp_config[section] = current
+                
+                # Doğrula
+                if self._validate_config(temp_config):
+                    self.config = temp_config
+                    self._save_config(self.config)
+                    return True
+                return False
             
         except Exception as e:
             self.logger.error(f"Yapılandırma güncelleme hatası: {str(e)}")
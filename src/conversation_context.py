@@ -0,0 +1,178 @@
+import logging
+import math
+import threading
+from collections import deque
+from typing import Deque, Dict, List, Optional, Tuple
+from cache_registry import estimate_size
+
+# Ortalama karakter/token oranı (tokenizer olmadan yaklaşık sayım için)
+CHARS_PER_TOKEN = 4
+# Her mesajın rol/biçim ek yükü (token)
+MESSAGE_OVERHEAD = 4
+# Özetin bütçeden alabileceği en büyük pay
+SUMMARY_SHARE = 0.1
+# Özet satırı başına saklanan karakter sayısı
+SUMMARY_LINE_CHARS = 120
+# Bellek baskısında korunan son tur sayısı
+DEFAULT_SHRINK_TURNS = 4
+
+def estimate_tokens(text: str) -> int:
+    """Metnin token sayısını yaklaşık olarak hesapla"""
+    if not text:
+        return 0
+    return math.ceil(len(text) / CHARS_PER_TOKEN)
+
+class ConversationContext:
+    """Token bütçesiyle sınırlı, system prompt'u sabit tutan konuşma bağlamı"""
+
+    def __init__(self, system_prompt: str = "", budget: int = 2048, response_reserve: int = 0):
+        self.logger = logging.getLogger("AICodeEditor.ConversationContext")
+        self._lock = threading.Lock()
+        self.system_prompt = system_prompt
+        self.budget = budget
+        self.response_reserve = response_reserve
+
+        # (mesaj, token) çiftleri; en eski başta
+        self._turns: Deque[Tuple[Dict, int]] = deque()
+        self._history_tokens = 0
+        # Bağlamdan çıkarılan eski turların kısa özeti
+        self._summary_lines: Deque[str] = deque()
+        self._summary_tokens = 0
+        self.evicted_count = 0
+
+    @property
+    def system_tokens(self) -> int:
+        return estimate_tokens(self.system_prompt) + MESSAGE_OVERHEAD if self.system_prompt else 0
+
+    @property
+    def available(self) -> int:
+        """System prompt ve yanıt payı düşüldükten sonra kalan bütçe"""
+        return max(self.budget - self.response_reserve - self.system_tokens, 0)
+
+    @property
+    def total_tokens(self) -> int:
+        return self.system_tokens + self._summary_tokens + self._history_tokens
+
+    def __len__(self) -> int:
+        return len(self._turns)
+
+    def _message_tokens(self, content: str) -> int:
+        return estimate_tokens(content) + MESSAGE_OVERHEAD
+
+    def _summary_message(self) -> Optional[Dict]:
+        if not self._summary_lines:
+            return None
+        return {
+            "role": "system",
+            "content": "Önceki konuşmanın özeti:\n" + "\n".join(self._summary_lines)
+        }
+
+    def _summarize(self, message: Dict):
+        """Çıkarılan turu tek satırlık özet olarak sakla"""
+        role = "kullanıcı" if message["role"] == "user" else "asistan"
+        text = " ".join(message["content"].split())
+        if len(text) > SUMMARY_LINE_CHARS:
+            text = text[:SUMMARY_LINE_CHARS] + "…"
+        line = f"- {role}: {text}"
+        self._summary_lines.append(line)
+        self._summary_tokens += self._message_tokens(line)
+
+        # Özet de kendi payını aşmamalı; en eski satırlar atılır
+        limit = int(self.available * SUMMARY_SHARE)
+        while self._summary_lines and self._summary_tokens > limit:
+            old = self._summary_lines.popleft()
+            self._summary_tokens -= self._message_tokens(old)
+
+    def _evict(self, limit: int):
+        """Geçmiş bütçeyi aşıyorsa en eski turları özetleyerek çıkar"""
+        while self._turns and self._history_tokens + self._summary_tokens > limit:
+            message, tokens = self._turns.popleft()
+            self._history_tokens -= tokens
+            self.evicted_count += 1
+            self._summarize(message)
+
+    def _fit_prompt(self, prompt: str, limit: int) -> str:
+        """Bütçeye sığmayan istemin ortasını kırp (baş ve son korunur)"""
+        if self._message_tokens(prompt) <= limit:
+            return prompt
+
+        max_chars = max((limit - MESSAGE_OVERHEAD) * CHARS_PER_TOKEN, 0)
+        marker = "\n…[kırpıldı]…\n"
+        keep = max(max_chars - len(marker), 0)
+        head = prompt[:keep // 2]
+        tail = prompt[len(prompt) - (keep - len(head)):] if keep - len(head) > 0 else ""
+        self.logger.warning(f"İstem bütçeyi aşıyor, {len(prompt) - keep} karakter kırpıldı")
+        return head + marker + tail
+
+    def add(self, role: str, content: str):
+        """Bağlama yeni mesaj ekle ve bütçeyi koru"""
+        with self._lock:
+            tokens = self._message_tokens(content)
+            self._turns.append(({"role": role, "content": content}, tokens))
+            self._history_tokens += tokens
+            self._evict(self.available)
+
+    def build_messages(self, prompt: str) -> List[Dict]:
+        """System prompt + özet + sığan geçmiş + yeni istemden mesaj listesi oluştur"""
+        with self._lock:
+            # Özet payı her zaman ayrılır, istem kalan kısma sığdırılır
+            prompt = self._fit_prompt(prompt, self.available - int(self.available * SUMMARY_SHARE))
+            # Yeni istem için yer aç
+            self._evict(self.available - self._message_tokens(prompt))
+
+            messages = []
+            if self.system_prompt:
+                messages.append({"role": "system", "content": self.system_prompt})
+            summary = self._summary_message()
+            if summary:
+                messages.append(summary)
+            messages.extend(dict(message) for message, _ in self._turns)
+            messages.append({"role": "user", "content": prompt})
+            return messages
+
+    def set_budget(self, budget: int, response_reserve: Optional[int] = None):
+        """Model değiştiğinde bütçeyi güncelle"""
+        with self._lock:
+            self.budget = budget
+            if response_reserve is not None:
+                self.response_reserve = response_reserve
+            self._evict(self.available)
+
+    def set_system_prompt(self, system_prompt: str):
+        with self._lock:
+            self.system_prompt = system_prompt
+            self._evict(self.available)
+
+    def memory_size(self) -> int:
+        """Geçmiş ve özetin yaklaşık bellek boyutu (bayt)"""
+        with self._lock:
+            return estimate_size((self._turns, self._summary_lines))
+
+    def shrink(self, keep_turns: int = DEFAULT_SHRINK_TURNS):
+        """Bellek baskısında son `keep_turns` tur dışındakileri özetleyerek çıkar"""
+        with self._lock:
+            while len(self._turns) > keep_turns:
+                message, tokens = self._turns.popleft()
+                self._history_tokens -= tokens
+                self.evicted_count += 1
+                self._summarize(message)
+
+    def clear(self):
+        """Geçmişi ve özeti temizle (system prompt korunur)"""
+        with self._lock:
+            self._turns.clear()
+            self._summary_lines.clear()
+            self._history_tokens = 0
+            self._summary_tokens = 0
+
+    def get_stats(self) -> Dict:
+        """Bütçe kullanımını getir"""
+        return {
+            "budget": self.budget,
+            "response_reserve": self.response_reserve,
+            "system_tokens": self.system_tokens,
+            "summary_tokens": self._summary_tokens,
+            "history_tokens": self._history_tokens,
+            "turns": len(self._turns),
+            "evicted": self.evicted_count
+        }
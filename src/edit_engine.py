@@ -0,0 +1,322 @@
+import logging
+import os
+import re
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+from src.code_todo_manager import find_definition_lines
+from conversation_context import CHARS_PER_TOKEN, MESSAGE_OVERHEAD, estimate_tokens
+
+# Tek bölgede gönderilecek en fazla satır (daha büyük sınıflar metotlarına bölünür)
+DEFAULT_MAX_REGION_LINES = 200
+# İsteme eklenecek toplam kaynak satırı sınırı
+DEFAULT_MAX_PROMPT_LINES = 400
+# İstemin tamamı için token bütçesi (model bağlamı verilmezse)
+DEFAULT_MAX_PROMPT_TOKENS = 2048
+# Satır numarası önekinin ("   12| ") uzunluğu
+LINE_PREFIX_CHARS = 7
+# Düzenleme isteminin sabit metni ve bölüm başlıkları için ayrılan token
+PROMPT_TEMPLATE_TOKENS = 200
+# Dosya yapısı özetinde listelenecek en fazla bölüm
+MAX_OUTLINE_ENTRIES = 50
+
+HUNK_HEADER = re.compile(r'^@@ -(\d+)(?:,(\d+))? \+(\d+)(?:,(\d+))? @@')
+DEFINITION_NAME = re.compile(r'^\s*(?:async\s+)?(?:def|class)\s+(\w+)')
+WORD = re.compile(r'\w{3,}')
+# İstemdeki satır numarası öneki ("   12| "), model diff'e kopyalarsa temizlenir
+LINE_PREFIX = re.compile(r'^\s*\d+\| ')
+
+class PatchError(Exception):
+    """Model çıktısı dosyaya güvenle uygulanamadığında"""
+    pass
+
+class Region:
+    """Dosyanın fonksiyon/sınıf sınırlarına göre ayrılmış bölümü (0 tabanlı, bitiş hariç)"""
+
+    def __init__(self, name: str, start: int, end: int):
+        self.name = name
+        self.start = start
+        self.end = end
+
+    def __len__(self):
+        return self.end - self.start
+
+    def __repr__(self):
+        return f"Region({self.name!r}, {self.start + 1}-{self.end})"
+
+class Hunk:
+    """Birleşik (unified) diff parçası"""
+
+    def __init__(self, old_start: int, new_start: int):
+        self.old_start = old_start
+        self.new_start = new_start
+        self.lines: List[Tuple[str, str]] = []
+
+    @property
+    def old_lines(self) -> List[str]:
+        return [text for tag, text in self.lines if tag in (" ", "-")]
+
+    @property
+    def new_lines(self) -> List[str]:
+        return [text for tag, text in self.lines if tag in (" ", "+")]
+
+class EditEngine:
+    """Büyük dosyaları bölgelere ayırıp yalnızca ilgili kısmı gönderen, diff uygulayan düzenleyici"""
+
+    def __init__(self, max_region_lines: int = DEFAULT_MAX_REGION_LINES,
+                 max_prompt_lines: int = DEFAULT_MAX_PROMPT_LINES,
+                 max_prompt_tokens: int = DEFAULT_MAX_PROMPT_TOKENS):
+        self.logger = logging.getLogger("AICodeEditor.EditEngine")
+        self.max_region_lines = max_region_lines
+        self.max_prompt_lines = max_prompt_lines
+        self.max_prompt_tokens = max_prompt_tokens
+
+    def _tokens(self, lines: List[str], start: int, end: int) -> int:
+        """Satırların satır numaralı haliyle istemde tutacağı yaklaşık token"""
+        return estimate_tokens("".join(lines[start:end])) + (end - start) * LINE_PREFIX_CHARS // CHARS_PER_TOKEN
+
+    def _indent(self, line: str) -> int:
+        return len(line) - len(line.lstrip())
+
+    def _region_start(self, lines: List[str], index: int) -> int:
+        """Tanımın üstündeki dekoratörleri bölgeye dahil et"""
+        indent = self._indent(lines[index])
+        while index > 0 and lines[index - 1].strip().startswith("@") and self._indent(lines[index - 1]) == indent:
+            index -= 1
+        return index
+
+    def split_regions(self, lines: List[str]) -> List[Region]:
+        """Dosyayı üst düzey fonksiyon/sınıf sınırlarından bölgelere ayır"""
+        definitions = find_definition_lines(lines)
+        top_level = [i for i in definitions if self._indent(lines[i]) == 0]
+
+        regions = []
+        boundaries = [self._region_start(lines, i) for i in top_level]
+        if not boundaries or boundaries[0] > 0:
+            boundaries.insert(0, 0)
+        boundaries.append(len(lines))
+
+        for start, end in zip(boundaries, boundaries[1:]):
+            if start >= end:
+                continue
+            name = self._region_name(lines, start, end)
+            region = Region(name, start, end)
+            if len(region) > self.max_region_lines:
+                regions.extend(self._split_large(lines, region, definitions))
+            else:
+                regions.append(region)
+        return regions
+
+    def _region_name(self, lines: List[str], start: int, end: int) -> str:
+        for line in lines[start:end]:
+            match = DEFINITION_NAME.match(line)
+            if match:
+                return match.group(1)
+        return "<modül başı>"
+
+    def _split_large(self, lines: List[str], region: Region, definitions: List[int]) -> List[Region]:
+        """Büyük sınıfı iç tanımlarından (metotlarından) alt bölgelere böl"""
+        inner = [i for i in definitions if region.start < i < region.end and self._indent(lines[i]) > 0]
+        if not inner:
+            return [region]
+
+        inner_indent = min(self._indent(lines[i]) for i in inner)
+        boundaries = [region.start] + [self._region_start(lines, i) for i in inner if self._indent(lines[i]) == inner_indent]
+        boundaries.append(region.end)
+
+        parts = []
+        for start, end in zip(boundaries, boundaries[1:]):
+            if start < end:
+                name = f"{region.name}.{self._region_name(lines, start, end)}" if start != region.start else region.name
+                parts.append(Region(name, start, end))
+        return parts
+
+    def select_regions(self, lines: List[str], regions: List[Region], instruction: str,
+                       max_tokens: Optional[int] = None) -> List[Region]:
+        """Talimatla ilgili bölgeleri satır ve token bütçesine sığacak kadar seç (önce adı geçenler, sonra kelime örtüşmesi)"""
+        if max_tokens is None:
+            max_tokens = self.max_prompt_tokens
+        if len(lines) <= self.max_prompt_lines and self._tokens(lines, 0, len(lines)) <= max_tokens:
+            return [Region("<tüm dosya>", 0, len(lines))] if lines else []
+
+        words = {word.lower() for word in WORD.findall(instruction)}
+        names = {word.lower() for word in re.findall(r'\w+', instruction)}
+        scored = []
+        for region in regions:
+            leaf = region.name.split(".")[-1].lower()
+            if leaf in names:
+                score = 1000
+            else:
+                region_words = {word.lower() for word in WORD.findall("".join(lines[region.start:region.end]))}
+                score = len(words & region_words)
+            scored.append((score, region))
+
+        selected = []
+        total = 0
+        total_tokens = 0
+        for score, region in sorted(scored, key=lambda item: -item[0]):
+            if score <= 0 or total + len(region) > self.max_prompt_lines:
+                continue
+            tokens = self._tokens(lines, region.start, region.end)
+            if total_tokens + tokens > max_tokens:
+                continue
+            selected.append(region)
+            total += len(region)
+            total_tokens += tokens
+
+        if not selected:
+            # İlgili bölge bulunamadı: sığdığı kadar baştan gönder
+            end = 0
+            while (end < min(len(lines), self.max_prompt_lines)
+                   and self._tokens(lines, 0, end + 1) <= max_tokens):
+                end += 1
+            selected = [Region("<dosya başı>", 0, end)] if end else []
+        return sorted(selected, key=lambda region: region.start)
+
+    def build_prompt(self, file_path: str, content: str, instruction: str) -> Tuple[str, List[Region]]:
+        """Yalnızca ilgili bölgeleri içeren, diff isteyen istemi oluştur"""
+        lines = content.splitlines(keepends=True)
+        regions = self.split_regions(lines)
+
+        outline = "\n".join(
+            f"- {region.name} (satır {region.start + 1}-{region.end})" for region in regions[:MAX_OUTLINE_ENTRIES]
+        )
+        if len(regions) > MAX_OUTLINE_ENTRIES:
+            outline += f"\n- … (+{len(regions) - MAX_OUTLINE_ENTRIES} bölüm)"
+
+        # Kaynak bölgelere, istemin sabit kısımları (yapı, talimat, biçim açıklaması) düşüldükten sonra kalan bütçe
+        fixed_tokens = estimate_tokens(outline + instruction) + PROMPT_TEMPLATE_TOKENS + MESSAGE_OVERHEAD
+        selected = self.select_regions(lines, regions, instruction, max(self.max_prompt_tokens - fixed_tokens, 0))
+        sections = []
+        for region in selected:
+            numbered = "".join(
+                f"{number + 1:>5}| {lines[number]}" if lines[number].endswith("\n") else f"{number + 1:>5}| {lines[number]}\n"
+                for number in range(region.start, region.end)
+            )
+            sections.append(f"### {region.name} (satır {region.start + 1}-{region.end})\n{numbered}")
+
+        prompt = f"""Dosya: {file_path} ({len(lines)} satır)
+
+Dosya yapısı:
+{outline}
+
+İlgili bölümler (satır numaralı):
+{chr(10).join(sections)}
+
+Yapılacak değişiklik:
+{instruction}
+
+Yalnızca değişikliği birleşik diff (unified diff) olarak döndür:
+--- a/{Path(file_path).name}
++++ b/{Path(file_path).name}
+@@ -başlangıç,uzunluk +başlangıç,uzunluk @@
+Bağlam satırları boşlukla, silinenler '-' ile, eklenenler '+' ile başlamalı.
+Satır numarası önekini ("  12| ") diff'e yazma. Açıklama ekleme.
+"""
+        return prompt, selected
+
+    def parse_diff(self, diff_text: str) -> List[Hunk]:
+        """Model çıktısındaki birleşik diff parçalarını ayrıştır"""
+        hunks = []
+        current = None
+        for raw in diff_text.splitlines():
+            if raw.startswith("```"):
+                continue
+            header = HUNK_HEADER.match(raw)
+            if header:
+                current = Hunk(int(header.group(1)), int(header.group(3)))
+                hunks.append(current)
+                continue
+            if current is None or raw.startswith(("--- ", "+++ ")):
+                continue
+            if raw.startswith("\\"):
+                # "\ No newline at end of file"
+                continue
+
+            tag, text = (raw[0], raw[1:]) if raw and raw[0] in " +-" else (" ", raw)
+            current.lines.append((tag, LINE_PREFIX.sub("", text, count=1)))
+
+        if not hunks:
+            raise PatchError("Model çıktısında diff bulunamadı")
+        return hunks
+
+    def _locate(self, lines: List[str], hunk: Hunk, min_start: int) -> int:
+        """Parçanın eski satırlarının dosyadaki yerini bul (önce bildirilen satır, sonra en yakın eşleşme)"""
+        old = [line.rstrip("\r\n") for line in hunk.old_lines]
+        stripped = [line.rstrip("\r\n") for line in lines]
+        # Saf eklemede (-N,0) başlangıç, metnin ardına ekleneceği satırdır
+        expected = hunk.old_start if not old else max(hunk.old_start - 1, 0)
+
+        def matches(position: int) -> bool:
+            return stripped[position:position + len(old)] == old
+
+        if not old:
+            return min(max(expected, min_start), len(lines))
+        if expected >= min_start and matches(expected):
+            return expected
+
+        candidates = [position for position in range(min_start, len(lines) - len(old) + 1) if matches(position)]
+        if not candidates:
+            raise PatchError(f"Parça dosyayla eşleşmiyor (satır {hunk.old_start})")
+        return min(candidates, key=lambda position: abs(position - expected))
+
+    def apply_hunks(self, content: str, hunks: List[Hunk]) -> Tuple[str, Dict]:
+        """Parçaları doğrulayarak uygula; herhangi biri eşleşmezse hiçbirini uygulama"""
+        lines = content.splitlines(keepends=True)
+        newline = "\r\n" if "\r\n" in content else "\n"
+
+        placements = []
+        min_start = 0
+        for hunk in sorted(hunks, key=lambda item: item.old_start):
+            position = self._locate(lines, hunk, min_start)
+            placements.append((position, hunk))
+            min_start = position + len(hunk.old_lines)
+
+        result = []
+        cursor = 0
+        added = removed = 0
+        for position, hunk in placements:
+            result.extend(lines[cursor:position])
+            result.extend(text + newline for text in hunk.new_lines)
+            cursor = position + len(hunk.old_lines)
+            added += sum(1 for tag, _ in hunk.lines if tag == "+")
+            removed += sum(1 for tag, _ in hunk.lines if tag == "-")
+        result.extend(lines[cursor:])
+
+        # Son satırın orijinal satır sonu durumunu koru
+        if result and not content.endswith(("\n", "\r")) and cursor >= len(lines):
+            result[-1] = result[-1].rstrip("\r\n")
+
+        return "".join(result), {"hunks": len(placements), "added": added, "removed": removed}
+
+    def verify(self, file_path: str, new_content: str):
+        """Yazmadan önce sonucu doğrula (Python dosyaları derlenebilmeli)"""
+        if file_path.endswith(".py"):
+            try:
+                compile(new_content, file_path, "exec")
+            except SyntaxError as e:
+                raise PatchError(f"Değişiklik sonrası sözdizimi hatası: satır {e.lineno}: {e.msg}")
+
+    def read(self, file_path: str) -> str:
+        """Dosyayı satır sonlarını (CRLF/LF) değiştirmeden oku"""
+        with open(file_path, "r", encoding="utf-8", newline="") as f:
+            return f.read()
+
+    def apply(self, file_path: str, original_content: str, diff_text: str) -> Dict:
+        """Diff'i uygula, doğrula ve dosyaya atomik olarak yaz"""
+        current = self.read(file_path)
+        if current != original_content:
+            raise PatchError("Dosya düzenleme sırasında değişti")
+
+        hunks = self.parse_diff(diff_text)
+        new_content, stats = self.apply_hunks(original_content, hunks)
+        self.verify(file_path, new_content)
+
+        temp_path = f"{file_path}.tmp"
+        with open(temp_path, "w", encoding="utf-8", newline="") as f:
+            f.write(new_content)
+        os.replace(temp_path, file_path)
+
+        self.logger.info(
+            f"{file_path}: {stats['hunks']} parça uygulandı (+{stats['added']}/-{stats['removed']})"
+        )
+        return stats
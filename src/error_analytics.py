@@ -0,0 +1,137 @@
+import math
+import re
+from collections import Counter
+from datetime import timedelta
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+# (ad, kova süresi sn, tutulan kova sayısı); pencereyi kapsayan en ince katman kullanılır
+DEFAULT_TIERS = (
+    ("minute", 60, 180),
+    ("hour", 3600, 168),
+    ("day", 86400, 30),
+)
+
+# Kova anahtarı: (hata tipi, önem, parmak izi)
+BucketKey = Tuple[str, str, str]
+
+TIME_WINDOW = re.compile(r'^\s*(\d+)\s*([smhd])\s*$')
+WINDOW_UNITS = {"s": "seconds", "m": "minutes", "h": "hours", "d": "days"}
+
+def parse_time_window(time_window: str) -> timedelta:
+    """"15m", "24h", "7d" biçimindeki pencereyi süreye çevir"""
+    match = TIME_WINDOW.match(time_window or "")
+    if not match:
+        raise ValueError(f"Geçersiz zaman penceresi: {time_window}")
+    return timedelta(**{WINDOW_UNITS[match.group(2)]: int(match.group(1))})
+
+def slope(values: List[float]) -> float:
+    """En küçük kareler doğrusunun eğimi (kova başına değişim)"""
+    n = len(values)
+    if n < 2:
+        return 0.0
+    mean_x = (n - 1) / 2
+    mean_y = sum(values) / n
+    numerator = sum((x - mean_x) * (y - mean_y) for x, y in enumerate(values))
+    denominator = sum((x - mean_x) ** 2 for x in range(n))
+    return numerator / denominator
+
+class BucketTier:
+    """Tek çözünürlükteki zaman kovaları (kova başlangıcı -> Counter)"""
+
+    def __init__(self, name: str, size: int, slots: int):
+        self.name = name
+        self.size = size
+        self.slots = slots
+        self.buckets: Dict[int, Counter] = {}
+        self.latest = 0
+
+    @property
+    def span(self) -> int:
+        return self.size * self.slots
+
+    def add(self, timestamp: float, key: BucketKey, count: int = 1) -> List[Counter]:
+        """Olayı kovasına ekle; saklama dışına düşen kovaları döndür"""
+        slot = int(timestamp // self.size)
+        if slot <= self.latest - self.slots:
+            # Bu katmanın saklama süresinden eski
+            return []
+
+        bucket = self.buckets.get(slot)
+        if bucket is None:
+            bucket = self.buckets[slot] = Counter()
+        bucket[key] += count
+
+        if slot > self.latest:
+            self.latest = slot
+            # Yeni kova açıldığında eskiler düşülür (en fazla `slots` kova taranır)
+            expired_slots = [old for old in self.buckets if old <= slot - self.slots]
+            return [self.buckets.pop(old) for old in expired_slots]
+        return []
+
+    def series(self, now: float, count: int) -> List[Counter]:
+        """Şu anki kovayla biten son `count` kova (eskiden yeniye)"""
+        current = int(now // self.size)
+        empty = Counter()
+        return [self.buckets.get(slot, empty) for slot in range(current - count + 1, current + 1)]
+
+    def to_dict(self) -> Dict:
+        return {
+            "latest": self.latest,
+            "buckets": {
+                str(slot): [[*key, count] for key, count in bucket.items()]
+                for slot, bucket in self.buckets.items()
+            }
+        }
+
+    def load(self, data: Dict):
+        self.latest = data.get("latest", 0)
+        self.buckets = {
+            int(slot): Counter({tuple(item[:3]): item[3] for item in items})
+            for slot, items in data.get("buckets", {}).items()
+        }
+
+class BucketIndex:
+    """Dakika/saat/gün katmanlı hata sayaç indeksi
+
+    Her olay tüm katmanlara eklenir; sorgu, pencereyi kapsayan en ince katmanın
+    en fazla `slots` kovasını okur. Maliyet geçmişin uzunluğundan bağımsızdır.
+    """
+
+    def __init__(self, tiers: Iterable[Tuple[str, int, int]] = DEFAULT_TIERS,
+                 on_expire: Optional[Callable[[Counter], None]] = None):
+        self.tiers = [BucketTier(name, size, slots) for name, size, slots in tiers]
+        # En kaba katmandan düşen kovalar artık hiçbir katmanda yok
+        self.on_expire = on_expire
+
+    @property
+    def retention(self) -> int:
+        """Verinin tutulduğu en uzun süre (sn)"""
+        return self.tiers[-1].span
+
+    def add(self, timestamp: float, key: BucketKey, count: int = 1):
+        for tier in self.tiers:
+            expired = tier.add(timestamp, key, count)
+            if tier is self.tiers[-1] and self.on_expire:
+                for bucket in expired:
+                    self.on_expire(bucket)
+
+    def select_tier(self, window: float) -> BucketTier:
+        """Pencereyi kapsayan en ince katman"""
+        for tier in self.tiers:
+            if window <= tier.span:
+                return tier
+        return self.tiers[-1]
+
+    def window_series(self, window: float, now: float) -> Tuple[BucketTier, List[Counter]]:
+        """Pencereyi (kova sınırına yuvarlanmış) kaplayan kovalar"""
+        tier = self.select_tier(window)
+        count = min(max(math.ceil(window / tier.size), 1), tier.slots)
+        return tier, tier.series(now, count)
+
+    def to_dict(self) -> Dict:
+        return {tier.name: tier.to_dict() for tier in self.tiers}
+
+    def load(self, data: Dict):
+        for tier in self.tiers:
+            if tier.name in data:
+                tier.load(data[tier.name])
@@ -1,10 +1,81 @@
 import traceback
+from collections import deque
 from datetime import datetime
 from pathlib import Path
 import json
 import logging
 import sys
 import os
+from error_journal import read_tail_lines
+from error_service import get_error_service
+from log_pipeline import LOG_FORMAT, get_log_pipeline
+
+# Analizde dikkate alınan son log satırı sayısı
+LOG_WINDOW_SIZE = 100
+
+class ErrorLogWindow(logging.Handler):
+    """Son log satırları içindeki hataları yazıldıkları anda sınıflandırıp sayan kayan pencere"""
+
+    CATEGORIES = ('speech_errors', 'connection_errors', 'command_errors')
+
+    def __init__(self, size: int = LOG_WINDOW_SIZE):
+        super().__init__(level=logging.DEBUG)
+        self.setFormatter(logging.Formatter(LOG_FORMAT))
+        # Her satır için (hata mı, kategoriler) tutulur; pencereden çıkan satırın sayaçları geri alınır
+        self.lines = deque(maxlen=size)
+        self.counts = {'total_errors': 0, **{category: 0 for category in self.CATEGORIES}}
+        self.last_error = None
+
+    @classmethod
+    def classify(cls, line: str) -> tuple:
+        """Hata satırının kategorilerini bul"""
+        lower = line.lower()
+        categories = []
+        # Konuşma hataları
+        if 'SAPI.SpVoice' in line or 'speak' in lower:
+            categories.append('speech_errors')
+        # Bağlantı hataları
+        if 'connection' in lower or 'could not locate' in lower:
+            categories.append('connection_errors')
+        # Komut hataları
+        if 'command' in lower or 'not understood' in lower:
+            categories.append('command_errors')
+        return tuple(categories)
+
+    def add_line(self, line: str, is_error: bool = None):
+        """Satırı pencereye ekle ve sayaçları güncelle"""
+        if is_error is None:
+            is_error = 'ERROR' in line
+        entry = (is_error, self.classify(line) if is_error else ())
+
+        if len(self.lines) == self.lines.maxlen:
+            evicted_error, evicted_categories = self.lines[0]
+            if evicted_error:
+                self.counts['total_errors'] -= 1
+                for category in evicted_categories:
+                    self.counts[category] -= 1
+
+        self.lines.append(entry)
+        if is_error:
+            self.counts['total_errors'] += 1
+            for category in entry[1]:
+                self.counts[category] += 1
+            self.last_error = line.strip()
+
+    def emit(self, record: logging.LogRecord):
+        try:
+            if record.levelno < logging.ERROR:
+                # Hata olmayan satırlar yalnızca pencerede yer kaplar, biçimlendirilmez
+                self.add_line('', is_error=False)
+            else:
+                # Log dosyasında yalnızca ilk satır seviye bilgisini taşır
+                self.add_line(self.format(record).split('\n', 1)[0], is_error=True)
+        except Exception:
+            self.handleError(record)
+
+    def summary(self) -> dict:
+        with self.lock:
+            return {**self.counts, 'last_error': self.last_error}
 
 class ErrorHandler:
     def __init__(self):
@@ -13,79 +84,49 @@ class ErrorHandler:
         self.log_dir.mkdir(exist_ok=True)
         
         # Log dosyaları
-        self.errors_file = self.log_dir / "errors.json"
         self.crash_file = self.log_dir / "crashes.log"
         self.debug_file = self.log_dir / "debug.log"
         
-        # Logging ayarlarını yapılandır
-        logging.basicConfig(
-            filename=self.debug_file,
-            level=logging.DEBUG,
-            format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-        )
+        # Kuyruk tabanlı günlük hattını kur (dosya/konsol yazımı ayrı thread'de)
+        get_log_pipeline()
         self.logger = logging.getLogger('AICodeEditor')
         
-        # Konsola da log gönder
-        console_handler = logging.StreamHandler()
-        console_handler.setLevel(logging.DEBUG)
-        self.logger.addHandler(console_handler)
+        # Son log satırlarını sondan okuyarak hata penceresini başlat
+        self.log_window = ErrorLogWindow()
+        try:
+            if self.debug_file.exists():
+                for line in read_tail_lines(self.debug_file, LOG_WINDOW_SIZE):
+                    self.log_window.add_line(line)
+        except Exception as e:
+            self.logger.error(f"Debug log okunurken hata: {str(e)}")
+        logging.getLogger().addHandler(self.log_window)
         
-        # Hata listesini başlat/yükle
-        self.load_errors()
+        # Tüm hatalar tek servisten (günlük + parmak izi sayaçları) geçer
+        self.error_service = get_error_service()
         
         # Global exception handler'ı ayarla
         sys.excepthook = self.handle_uncaught_exception
         
-    def load_errors(self):
-        """Kayıtlı hataları yükle"""
-        try:
-            if self.errors_file.exists() and self.errors_file.stat().st_size > 0:
-                with open(self.errors_file, 'r', encoding='utf-8') as f:
-                    self.errors = json.load(f)
-            else:
-                # Dosya yoksa veya boşsa yeni liste oluştur
-                self.errors = []
-                # Boş JSON dosyası oluştur
-                self.save_errors()
-        except json.JSONDecodeError:
-            # JSON dosyası bozuksa yeni liste oluştur
-            self.logger.warning("Hata dosyası bozuk, yeni liste oluşturuluyor")
-            self.errors = []
-            self.save_errors()
-        except Exception as e:
-            self.logger.error(f"Hata dosyası yüklenirken beklenmeyen hata: {str(e)}")
-            self.errors = []
-            
-    def save_errors(self):
-        """Hataları kaydet"""
-        try:
-            with open(self.errors_file, 'w', encoding='utf-8') as f:
-                json.dump(self.errors, f, ensure_ascii=False, indent=2)
-        except Exception as e:
-            self.logger.error(f"Hatalar kaydedilirken hata oluştu: {str(e)}")
-            
+    @property
+    def errors(self) -> deque:
+        """Son kaydedilen hatalar"""
+        return self.error_service.recent
+
     def handle_uncaught_exception(self, exc_type, exc_value, exc_traceback):
         """Yakalanmamış hataları yakala ve logla"""
         try:
-            error_data = {
-                'timestamp': datetime.now().isoformat(),
-                'error_type': exc_type.__name__,
-                'error_message': str(exc_value),
-                'traceback': ''.join(traceback.format_tb(exc_traceback)),
-                'command': 'UNCAUGHT_EXCEPTION',
-                'context': 'Global Exception Handler',
-                'stack_info': ''.join(traceback.format_stack())
-            }
+            trace = ''.join(traceback.format_tb(exc_traceback))
             
-            # Hatayı JSON dosyasına kaydet
-            self.errors.append(error_data)
-            self.save_errors()
+            # Hatayı günlüğe ekle
+            self.error_service.record(
+                exc_value, 'UNCAUGHT_EXCEPTION', 'Global Exception Handler', severity='CRITICAL', trace=trace
+            )
             
             # Debug log'a yaz
             self.logger.error(
                 f"Uncaught Exception:\nType: {exc_type.__name__}\n"
                 f"Message: {str(exc_value)}\nTraceback:\n"
-                f"{''.join(traceback.format_tb(exc_traceback))}"
+                f"{trace}"
             )
             
             # Crash log'a yaz
@@ -95,9 +136,7 @@ class ErrorHandler:
                 f.write(f"Type: {exc_type.__name__}\n")
                 f.write(f"Message: {str(exc_value)}\n")
                 f.write("Traceback:\n")
-                f.write(''.join(traceback.format_tb(exc_traceback)))
-                f.write("Stack Info:\n")
-                f.write(error_data['stack_info'])
+                f.write(trace)
                 f.write('\n' + '='*50 + '\n')
                 
         except Exception as e:
@@ -107,18 +146,10 @@ class ErrorHandler:
     def log_error(self, error: Exception, command: str = None, context: str = None):
         """Hatayı kaydet"""
         try:
-            error_data = {
-                'timestamp': datetime.now().isoformat(),
-                'error_type': type(error).__name__,
-                'error_message': str(error),
-                'traceback': traceback.format_exc(),
-                'command': command or 'Unknown Command',
-                'context': context or 'Unknown Context',
-                'stack_info': ''.join(traceback.format_stack())
-            }
-            
-            self.errors.append(error_data)
-            self.save_errors()
+            trace = traceback.format_exc()
+            error_data = self.error_service.record(
+                error, command or 'Unknown Command', context or 'Unknown Context', trace=trace
+            )
             
             # Debug log'a yaz
             self.logger.error(
@@ -126,7 +157,7 @@ class ErrorHandler:
                 f"Command: {command or 'Unknown Command'}\n"
                 f"Type: {type(error).__name__}\n"
                 f"Message: {str(error)}\n"
-                f"Traceback:\n{traceback.format_exc()}"
+                f"Traceback:\n{trace}"
             )
             
             # Kritik hataları crash log'a da yaz
@@ -139,9 +170,7 @@ class ErrorHandler:
                     f.write(f"Type: {type(error).__name__}\n")
                     f.write(f"Message: {str(error)}\n")
                     f.write("Traceback:\n")
-                    f.write(traceback.format_exc())
-                    f.write("Stack Info:\n")
-                    f.write(error_data['stack_info'])
+                    f.write(trace)
                     f.write('\n' + '='*50 + '\n')
                     
             return error_data
@@ -179,55 +208,10 @@ class ErrorHandler:
             os.startfile(temp_file)
 
     def analyze_recent_errors(self) -> dict:
-        """Son hataları analiz et ve özet çıkar"""
+        """Son hataları analiz et ve özet çıkar (sayaçlar kayıt anında tutulur)"""
         try:
-            summary = {
-                'total_errors': 0,
-                'common_errors': {},
-                'critical_errors': [],
-                'last_error': None,
-                'speech_errors': 0,
-                'connection_errors': 0,
-                'command_errors': 0
-            }
-            
-            # Debug loglarını kontrol et
-            if self.debug_file.exists():
-                with open(self.debug_file, 'r', encoding='utf-8') as f:
-                    logs = f.readlines()
-                    for log in logs[-100:]:  # Son 100 log
-                        if 'ERROR' in log:
-                            summary['total_errors'] += 1
-                            
-                            # Konuşma hataları
-                            if 'SAPI.SpVoice' in log or 'speak' in log.lower():
-                                summary['speech_errors'] += 1
-                                
-                            # Bağlantı hataları    
-                            if 'connection' in log.lower() or 'could not locate' in log.lower():
-                                summary['connection_errors'] += 1
-                                
-                            # Komut hataları
-                            if 'command' in log.lower() or 'not understood' in log.lower():
-                                summary['command_errors'] += 1
-                                
-                            # Son hatayı kaydet
-                            summary['last_error'] = log.strip()
-            
-            # Errors.json'ı kontrol et
-            if self.errors_file.exists():
-                with open(self.errors_file, 'r', encoding='utf-8') as f:
-                    error_data = json.load(f)
-                    for error in error_data:
-                        error_type = error.get('error_type', '')
-                        if error_type in summary['common_errors']:
-                            summary['common_errors'][error_type] += 1
-                        else:
-                            summary['common_errors'][error_type] = 1
-                            
-                        if error.get('is_critical', False):
-                            summary['critical_errors'].append(error)
-            
+            summary = self.log_window.summary()
+            summary.update(self.error_service.get_recent_summary())
             return summary
             
         except Exception as e:
@@ -0,0 +1,261 @@
+import json
+import logging
+import os
+import struct
+import threading
+from bisect import bisect_left
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional
+
+DEFAULT_MAX_BYTES = 5 * 1024 * 1024
+DEFAULT_BACKUPS = 3
+
+# İndeks kaydı: satırın dosyadaki konumu (uint64) + zaman damgası (float64, epoch)
+INDEX_ENTRY = struct.Struct("<Qd")
+
+# Dosya sonu geriye doğru okunurken kullanılan blok boyutu
+TAIL_BLOCK_SIZE = 8192
+
+def read_tail_lines(path: Path, count: int, block_size: int = TAIL_BLOCK_SIZE) -> List[str]:
+    """Dosyanın son `count` satırını sondan geriye blok blok okuyarak getir"""
+    if count <= 0:
+        return []
+
+    with open(path, "rb") as f:
+        f.seek(0, os.SEEK_END)
+        position = f.tell()
+        data = b""
+        # Son satırın başını da bulmak için bir fazla satır sonu gerekir
+        while position > 0 and data.count(b"\n") <= count:
+            step = min(block_size, position)
+            position -= step
+            f.seek(position)
+            data = f.read(step) + data
+
+    return data.decode("utf-8", errors="replace").splitlines()[-count:]
+
+class ErrorJournal:
+    """Satır satır JSON (JSONL) hata günlüğü: yalnızca ekleme, boyuta göre döndürme, ikili konum indeksi
+
+    Her kayıt tek satırdır; `<ad>.idx` dosyası her satırın konumunu sabit genişlikte tutar.
+    Böylece son N kayıt veya belirli bir zamandan sonraki kayıtlar dosyanın
+    tamamı okunmadan bulunur.
+    """
+
+    def __init__(self, path: Path, max_bytes: int = DEFAULT_MAX_BYTES, backups: int = DEFAULT_BACKUPS):
+        self.logger = logging.getLogger("AICodeEditor.ErrorJournal")
+        self.path = Path(path)
+        self.index_path = self.path.with_suffix(".idx")
+        self.max_bytes = max_bytes
+        self.backups = max(backups, 0)
+
+        self._lock = threading.Lock()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._check_index(self.path, self.index_path)
+
+        self._data = open(self.path, "ab")
+        self._index = open(self.index_path, "ab")
+        self._size = self._data.tell()
+        self._count = self._index.tell() // INDEX_ENTRY.size
+
+    # Dosya yardımcıları
+
+    def _segment_paths(self, number: int):
+        """Döndürülmüş parça yolları (0 = etkin dosya)"""
+        if number == 0:
+            return self.path, self.index_path
+        data = self.path.with_name(f"{self.path.stem}.{number}{self.path.suffix}")
+        return data, data.with_suffix(".idx")
+
+    def _check_index(self, data_path: Path, index_path: Path):
+        """İndeks veri dosyasıyla tutarlı değilse (yarım yazma, silinme) yeniden oluştur"""
+        try:
+            data_size = data_path.stat().st_size if data_path.exists() else 0
+            index_size = index_path.stat().st_size if index_path.exists() else 0
+
+            if index_size % INDEX_ENTRY.size == 0 and (index_size == 0) == (data_size == 0):
+                if data_size == 0:
+                    return
+                with open(index_path, "rb") as f:
+                    f.seek(index_size - INDEX_ENTRY.size)
+                    last_offset, _ = INDEX_ENTRY.unpack(f.read(INDEX_ENTRY.size))
+                with open(data_path, "rb") as f:
+                    f.seek(last_offset)
+                    # Son satır dosya sonuna kadar sürmeli ve tam yazılmış olmalı
+                    if f.readline().endswith(b"\n") and f.tell() == data_size:
+                        return
+
+            self.logger.warning(f"Hata günlüğü indeksi yeniden oluşturuluyor: {index_path}")
+            self._rebuild_index(data_path, index_path)
+
+        except Exception as e:
+            self.logger.error(f"Hata günlüğü indeks kontrolü hatası: {str(e)}")
+
+    def _rebuild_index(self, data_path: Path, index_path: Path):
+        entries = bytearray()
+        valid_size = 0
+        if data_path.exists():
+            with open(data_path, "rb") as f:
+                offset = 0
+                for line in f:
+                    if not line.endswith(b"\n"):
+                        # Yarım kalmış son satır
+                        break
+                    try:
+                        record = json.loads(line)
+                        entries += INDEX_ENTRY.pack(offset, self._timestamp(record))
+                    except ValueError:
+                        pass
+                    offset += len(line)
+                valid_size = offset
+            if valid_size != data_path.stat().st_size:
+                os.truncate(data_path, valid_size)
+
+        with open(index_path, "wb") as f:
+            f.write(entries)
+
+    @staticmethod
+    def _timestamp(record: Dict) -> float:
+        try:
+            return datetime.fromisoformat(record["timestamp"]).timestamp()
+        except (KeyError, TypeError, ValueError):
+            return 0.0
+
+    def _rotate(self):
+        """Etkin dosyayı `<ad>.1.jsonl`'e kaydır, en eskiyi sil"""
+        self._data.close()
+        self._index.close()
+
+        for number in range(self.backups, 0, -1):
+            for source, target in zip(self._segment_paths(number - 1), self._segment_paths(number)):
+                if number == self.backups:
+                    target.unlink(missing_ok=True)
+                if source.exists():
+                    os.replace(source, target)
+        if self.backups == 0:
+            for path in self._segment_paths(0):
+                path.unlink(missing_ok=True)
+
+        self._data = open(self.path, "ab")
+        self._index = open(self.index_path, "ab")
+        self._size = 0
+        self._count = 0
+
+    # Yazma
+
+    def append(self, record: Dict):
+        """Kaydı günlüğün sonuna ekle (dosyanın geri kalanına dokunmadan)"""
+        line = (json.dumps(record, ensure_ascii=False, default=str) + "\n").encode("utf-8")
+        with self._lock:
+            if self._size and self._size + len(line) > self.max_bytes:
+                self._rotate()
+
+            self._data.write(line)
+            self._data.flush()
+            self._index.write(INDEX_ENTRY.pack(self._size, self._timestamp(record)))
+            self._index.flush()
+            self._size += len(line)
+            self._count += 1
+
+    # Okuma
+
+    def _read_index(self, index_path: Path, first: int = 0) -> List[tuple]:
+        if not index_path.exists():
+            return []
+        with open(index_path, "rb") as f:
+            f.seek(first * INDEX_ENTRY.size)
+            raw = f.read()
+        usable = len(raw) - len(raw) % INDEX_ENTRY.size
+        return list(INDEX_ENTRY.iter_unpack(raw[:usable]))
+
+    def _read_from(self, data_path: Path, offset: int, limit: Optional[int] = None) -> List[Dict]:
+        records = []
+        with open(data_path, "rb") as f:
+            f.seek(offset)
+            for line in f:
+                if limit is not None and len(records) >= limit:
+                    break
+                try:
+                    records.append(json.loads(line))
+                except ValueError:
+                    continue
+        return records
+
+    def tail(self, count: int) -> List[Dict]:
+        """Son `count` kaydı (eskiden yeniye) yalnızca dosya sonlarını okuyarak getir"""
+        if count <= 0:
+            return []
+
+        with self._lock:
+            collected: List[Dict] = []
+            for number in range(self.backups + 1):
+                data_path, index_path = self._segment_paths(number)
+                if not data_path.exists():
+                    break
+
+                needed = count - len(collected)
+                entries = index_path.stat().st_size // INDEX_ENTRY.size if index_path.exists() else 0
+                if entries == 0:
+                    continue
+                first = max(entries - needed, 0)
+                offset, _ = self._read_index(index_path, first)[0]
+                collected = self._read_from(data_path, offset) + collected
+                if len(collected) >= count:
+                    break
+            return collected[-count:]
+
+    def get(self, position: int) -> Optional[Dict]:
+        """Etkin dosyadaki `position`. kaydı getir (negatif değerler sondan sayar)"""
+        with self._lock:
+            if position < 0:
+                position += self._count
+            if not 0 <= position < self._count:
+                return None
+            entries = self._read_index(self.index_path, position)
+            records = self._read_from(self.path, entries[0][0], limit=1) if entries else []
+            return records[0] if records else None
+
+    def since(self, timestamp: float) -> List[Dict]:
+        """Verilen zamandan (epoch) sonraki kayıtları getir (indekste ikili arama ile)"""
+        with self._lock:
+            collected: List[Dict] = []
+            for number in range(self.backups + 1):
+                data_path, index_path = self._segment_paths(number)
+                if not data_path.exists():
+                    break
+                entries = self._read_index(index_path)
+                if not entries:
+                    continue
+
+                position = bisect_left([stamp for _, stamp in entries], timestamp)
+                if position < len(entries):
+                    collected = self._read_from(data_path, entries[position][0]) + collected
+                if position > 0:
+                    # Bu parçada daha eski kayıtlar var, öncekilere bakmaya gerek yok
+                    break
+            return collected
+
+    def iter_records(self) -> Iterator[Dict]:
+        """Tüm parçalardaki kayıtları eskiden yeniye dolaş"""
+        for number in range(self.backups, -1, -1):
+            data_path, _ = self._segment_paths(number)
+            if data_path.exists():
+                yield from self._read_from(data_path, 0)
+
+    def __len__(self) -> int:
+        return self._count
+
+    def get_stats(self) -> Dict:
+        """Günlük boyutu ve kayıt sayısı"""
+        return {
+            "records": self._count,
+            "bytes": self._size,
+            "max_bytes": self.max_bytes,
+            "backups": self.backups
+        }
+
+    def close(self):
+        with self._lock:
+            self._data.close()
+            self._index.close()
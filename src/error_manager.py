@@ -3,8 +3,9 @@ import json
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
-from config_manager import ConfigManager
+from config_manager import get_config_manager
 from language_manager import LanguageManager
+from error_service import get_error_service
 import traceback
 import sys
 import shutil
@@ -13,7 +14,7 @@ import time
 
 class ErrorManager:
     def __init__(self):
-        self.config_manager = ConfigManager()
+        self.config_manager = get_config_manager()
         self.language_manager = LanguageManager()
         self.logger = logging.getLogger("AICodeEditor.Error")
         
@@ -24,12 +25,11 @@ class ErrorManager:
         self.backup_dir.mkdir(parents=True, exist_ok=True)
         
         # Log dosyaları
-        self.error_log = self.log_dir / "errors.json"
         self.crash_log = self.log_dir / "crashes.log"
         self.debug_log = self.log_dir / "debug.log"
         
-        # Hata veritabanı
-        self.error_db = self._load_error_db()
+        # Hatalar ErrorHandler ile ortak servise kaydedilir
+        self.error_service = get_error_service()
         
         # Otomatik yedekleme için zamanlayıcı başlat
         self.backup_thread = threading.Thread(target=self._auto_backup, daemon=True)
@@ -66,7 +66,7 @@ class ErrorManager:
             critical_files = [
                 "config/default.json",
                 "config/user.json",
-                "data/logs/errors.json",
+                str(self.error_service.journal.path),
                 "data/logs/crashes.log"
             ]
             
@@ -278,77 +278,19 @@ class ErrorManager:
             self.logger.error(f"Yedekten geri yükleme hatası: {str(e)}")
             return False
             
-    def _load_error_db(self) -> dict:
-        """Hata veritabanını yükle"""
-        try:
-            if self.error_log.exists():
-                return json.loads(self.error_log.read_text(encoding='utf-8'))
-            return {"errors": [], "statistics": {}}
-        except Exception as e:
-            self.logger.error(f"Hata veritabanı yükleme hatası: {str(e)}")
-            return {"errors": [], "statistics": {}}
-            
     def log_error(self, error: Exception, context: str = "", severity: str = "ERROR") -> dict:
-        """Hatayı kaydet ve analiz et"""
+        """Hatayı ortak hata servisine kaydet"""
         try:
-            error_data = {
-                "timestamp": datetime.now().isoformat(),
-                "type": type(error).__name__,
-                "message": str(error),
-                "context": context,
-                "severity": severity,
-                "traceback": traceback.format_exc()
-            }
-            
-            # Hatayı veritabanına ekle
-            self.error_db["errors"].append(error_data)
-            
-            # İstatistikleri güncelle
-            error_type = type(error).__name__
-            self.error_db["statistics"][error_type] = self.error_db["statistics"].get(error_type, 0) + 1
-            
-            # Veritabanını kaydet
-            self._save_error_db()
-            
-            return error_data
+            return self.error_service.record(error, context=context, severity=severity)
             
         except Exception as e:
             self.logger.error(f"Hata kaydı sırasında hata: {str(e)}")
             return {}
             
     def analyze_errors(self, time_window: str = "24h") -> Dict:
-        """Hataları analiz et ve özet çıkar"""
+        """Hataları analiz et ve özet çıkar (ör. "15m", "24h", "7d")"""
         try:
-            cutoff_time = self._parse_time_window(time_window)
-            recent_errors = [
-                error for error in self.error_db["errors"]
-                if datetime.fromisoformat(error["timestamp"]) > cutoff_time
-            ]
-            
-            analysis = {
-                "total_errors": len(recent_errors),
-                "error_types": {},
-                "most_common": None,
-                "critical_errors": [],
-                "trends": self._analyze_error_trends(recent_errors)
-            }
-            
-            # Hata tiplerini say
-            for error in recent_errors:
-                error_type = error["type"]
-                analysis["error_types"][error_type] = analysis["error_types"].get(error_type, 0) + 1
-                
-                if error["severity"] == "CRITICAL":
-                    analysis["critical_errors"].append(error)
-                    
-            # En sık görülen hatayı bul
-            if analysis["error_types"]:
-                analysis["most_common"] = max(
-                    analysis["error_types"].items(),
-                    key=lambda x: x[1]
-                )
-                
-            return analysis
+            return self.error_service.analyze_errors(time_window)
             
         except Exception as e:
             self.logger.error(f"Hata analizi sırasında hata: {str(e)}")
@@ -365,12 +307,4 @@ class ErrorManager:
         elif "connection" in error_type.lower():
             solutions.append(self.solution_templates["connection_error"])
             
-        return solutions 
-
-    def _save_error_db(self):
-        """Hata veritabanını kaydet"""
-        try:
-            with open(self.error_log, 'w', encoding='utf-8') as f:
-                json.dump(self.error_db, f, indent=4, ensure_ascii=False)
-        except Exception as e:
-            self.logger.error(f"Hata veritabanı kaydetme hatası: {str(e)}") 
\ No newline at end of file
+        return solutions
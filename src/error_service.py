@@ -0,0 +1,369 @@
+import atexit
+import hashlib
+import json
+import logging
+import os
+import re
+import sys
+import threading
+import time
+import traceback
+from collections import Counter, deque
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional, Union
+from config_manager import get_config_manager
+from error_journal import ErrorJournal, DEFAULT_MAX_BYTES, DEFAULT_BACKUPS
+from error_analytics import BucketIndex, parse_time_window, slope
+from cache_registry import PRIORITY_NORMAL, estimate_size, get_cache_registry
+
+DEFAULT_JOURNAL_PATH = "data/errors.jsonl"
+DEFAULT_TAIL_SIZE = 200
+# Bellek baskısında kuyrukta bırakılan hata sayısı
+DEFAULT_TRIM_RECENT = 20
+DEFAULT_RETENTION_DAYS = 30
+# Analitik indeksinin diske yazılma aralığı (sn)
+ANALYTICS_SAVE_INTERVAL = 30
+ANALYTICS_VERSION = 1
+# Eski, ayrı tutulan hata dosyaları (bir kez günlüğe aktarılır)
+LEGACY_ERROR_FILES = ("data/errors.json", "data/logs/errors.json")
+
+# "File "x.py", line 12, in func" -> ("x.py", "func")
+TRACE_FRAME = re.compile(r'File "([^"]+)", line \d+, in (\S+)')
+HEX_ADDRESS = re.compile(r'0x[0-9a-fA-F]+')
+QUOTED = re.compile(r'(["\']).*?\1')
+NUMBER = re.compile(r'\d+')
+
+# Süreç genelinde tek hata servisi
+_service = None
+_service_lock = threading.Lock()
+
+def get_error_service() -> "ErrorService":
+    """Süreç genelinde paylaşılan hata kayıt servisini getir"""
+    global _service
+    if _service is None:
+        with _service_lock:
+            if _service is None:
+                _service = ErrorService()
+    return _service
+
+def fingerprint(error_type: str, trace: str, message: str = "") -> str:
+    """Hata tipi ve satır numaralarından arındırılmış izden parmak izi üret
+
+    İz yoksa (ör. yalnızca mesaj verildiyse) sayı/adres/tırnak içi değerleri
+    atılmış mesaj kullanılır.
+    """
+    frames = [f"{Path(path).name}:{function}" for path, function in TRACE_FRAME.findall(trace or "")]
+    if frames:
+        material = "|".join(frames)
+    else:
+        material = NUMBER.sub("#", QUOTED.sub("?", HEX_ADDRESS.sub("0x?", message or "")))
+    return hashlib.sha1(f"{error_type}|{material}".encode("utf-8")).hexdigest()[:16]
+
+class ErrorService:
+    """Tüm hataların tek kayıt noktası: günlüğe bir kez yazar, parmak iziyle tekilleştirir,
+    parmak izi sayaçlarını ve dakika/saat/gün kovalarını kayıt anında günceller"""
+
+    def __init__(self, journal_config: Optional[dict] = None):
+        self.logger = logging.getLogger("AICodeEditor.ErrorService")
+        if journal_config is None:
+            journal_config = get_config_manager().get_config("system", {}).get("error_journal", {})
+
+        self.journal = ErrorJournal(
+            Path(journal_config.get("path", DEFAULT_JOURNAL_PATH)),
+            max_bytes=journal_config.get("max_bytes", DEFAULT_MAX_BYTES),
+            backups=journal_config.get("backups", DEFAULT_BACKUPS)
+        )
+        retention_days = journal_config.get("retention_days", DEFAULT_RETENTION_DAYS)
+        tail_size = journal_config.get("tail_size", DEFAULT_TAIL_SIZE)
+
+        self._lock = threading.RLock()
+        # parmak izi -> {type, message, traceback, count, first_seen, last_seen}
+        self.fingerprints: Dict[str, dict] = {}
+        # (tip, önem, parmak izi) sayaçları; gün katmanı saklama süresini belirler
+        self.analytics = BucketIndex(
+            (("minute", 60, 180), ("hour", 3600, 168), ("day", 86400, retention_days)),
+            on_expire=self._expire_fingerprints
+        )
+        self.analytics_path = self.journal.path.with_suffix(".analytics.json")
+        self._last_counted = 0.0
+        self._last_saved = 0.0
+
+        # Son hatalar ve bunlar üzerindeki sayaçlar
+        self.recent = deque(maxlen=tail_size)
+        self.recent_type_counts: Counter = Counter()
+        self.recent_critical: List[dict] = []
+
+        self._migrate_legacy()
+        self._load()
+        atexit.register(self.save_analytics)
+        get_cache_registry().register("recent_errors", self.recent_memory_size, self.trim_recent, PRIORITY_NORMAL - 20)
+
+    # Başlangıç
+
+    def _migrate_legacy(self):
+        """Eski errors.json dosyalarını (zaman sırasıyla) bir kez günlüğe aktar"""
+        migrated = []
+        for legacy_path in map(Path, LEGACY_ERROR_FILES):
+            if not legacy_path.exists():
+                continue
+            try:
+                with open(legacy_path, 'r', encoding='utf-8') as f:
+                    legacy = json.load(f)
+                if isinstance(legacy, dict):
+                    legacy = legacy.get("errors", [])
+                migrated.extend(legacy)
+            except json.JSONDecodeError:
+                self.logger.warning(f"Eski hata dosyası bozuk, aktarılmadı: {legacy_path}")
+            except Exception as e:
+                self.logger.error(f"Eski hata dosyası okuma hatası: {str(e)}")
+                continue
+            legacy_path.rename(legacy_path.with_suffix(".json.migrated"))
+
+        for error_data in sorted(migrated, key=lambda item: item.get("timestamp", "")):
+            error_data.pop("stack_info", None)
+            error_data.setdefault("error_type", error_data.pop("type", "Error"))
+            error_data.setdefault("error_message", error_data.pop("message", ""))
+            error_data.setdefault("severity", "ERROR")
+            error_data.setdefault("fingerprint", fingerprint(
+                error_data["error_type"], error_data.get("traceback", ""), error_data["error_message"]
+            ))
+            self.journal.append(error_data)
+
+    def _load(self):
+        """Kayıtlı analitik indeksini yükle, yalnızca sonrasında eklenen kayıtları günlükten işle"""
+        try:
+            loaded_until = self._load_analytics()
+            start = loaded_until if loaded_until is not None else time.time() - self.analytics.retention
+            for error_data in self.journal.since(start):
+                if loaded_until is None or self._timestamp(error_data) > loaded_until:
+                    self._count(error_data)
+            for error_data in self.journal.tail(self.recent.maxlen):
+                self._remember(error_data)
+        except Exception as e:
+            self.logger.error(f"Hata günlüğü yükleme hatası: {str(e)}")
+
+    def _load_analytics(self) -> Optional[float]:
+        if not self.analytics_path.exists():
+            return None
+        try:
+            with open(self.analytics_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get("version") != ANALYTICS_VERSION:
+                return None
+            self.analytics.load(data.get("tiers", {}))
+            self.fingerprints = data.get("fingerprints", {})
+            self._last_counted = data.get("last_timestamp", 0.0)
+            return self._last_counted
+        except Exception as e:
+            self.logger.warning(f"Hata analitiği okunamadı, günlükten yeniden oluşturulacak: {str(e)}")
+            self.analytics.load({})
+            self.fingerprints = {}
+            return None
+
+    def save_analytics(self):
+        """Analitik indeksini ve parmak izi tablosunu günlüğün yanına atomik olarak yaz"""
+        try:
+            with self._lock:
+                data = {
+                    "version": ANALYTICS_VERSION,
+                    "last_timestamp": self._last_counted,
+                    "tiers": self.analytics.to_dict(),
+                    "fingerprints": self.fingerprints
+                }
+                temp_path = self.analytics_path.with_suffix(".tmp")
+                with open(temp_path, 'w', encoding='utf-8') as f:
+                    json.dump(data, f, ensure_ascii=False)
+                os.replace(temp_path, self.analytics_path)
+                self._last_saved = time.monotonic()
+        except Exception as e:
+            self.logger.error(f"Hata analitiği kaydetme hatası: {str(e)}")
+
+    # Sayaçlar
+
+    @staticmethod
+    def _timestamp(error_data: dict) -> Optional[float]:
+        try:
+            return datetime.fromisoformat(error_data["timestamp"]).timestamp()
+        except (KeyError, TypeError, ValueError):
+            return None
+
+    def _count(self, error_data: dict):
+        """Parmak izi sayacını ve zaman kovalarını güncelle"""
+        timestamp = self._timestamp(error_data)
+        if timestamp is None:
+            return
+
+        error_type = error_data.get("error_type", "Error")
+        key = error_data.get("fingerprint") or fingerprint(
+            error_type, error_data.get("traceback", ""), error_data.get("error_message", "")
+        )
+        entry = self.fingerprints.get(key)
+        if entry is None:
+            entry = self.fingerprints[key] = {
+                "type": error_type,
+                "message": error_data.get("error_message", ""),
+                "traceback": error_data.get("traceback", ""),
+                "count": 0,
+                "first_seen": error_data["timestamp"],
+                "last_seen": error_data["timestamp"]
+            }
+        elif not entry["traceback"]:
+            entry["traceback"] = error_data.get("traceback", "")
+        entry["count"] += 1
+        entry["last_seen"] = error_data["timestamp"]
+
+        self.analytics.add(timestamp, (error_type, error_data.get("severity", "ERROR"), key))
+        self._last_counted = max(self._last_counted, timestamp)
+
+    def _expire_fingerprints(self, bucket: Counter):
+        """Saklama süresinden düşen kovanın sayılarını parmak izi sayaçlarından çıkar"""
+        for (_, _, key), count in bucket.items():
+            entry = self.fingerprints.get(key)
+            if entry is None:
+                continue
+            entry["count"] -= count
+            if entry["count"] <= 0:
+                del self.fingerprints[key]
+
+    def _remember(self, error_data: dict):
+        """Son hatalar kuyruğuna ekle ve kuyruk sayaçlarını güncelle"""
+        if len(self.recent) == self.recent.maxlen:
+            evicted = self.recent[0]
+            evicted_type = evicted.get("error_type", "")
+            self.recent_type_counts[evicted_type] -= 1
+            if self.recent_type_counts[evicted_type] <= 0:
+                del self.recent_type_counts[evicted_type]
+            if evicted.get("is_critical", False) and self.recent_critical:
+                self.recent_critical.pop(0)
+
+        self.recent.append(error_data)
+        self.recent_type_counts[error_data.get("error_type", "")] += 1
+        if error_data.get("is_critical", False):
+            self.recent_critical.append(error_data)
+
+    def recent_memory_size(self) -> int:
+        """Son hatalar kuyruğunun yaklaşık bellek boyutu (bayt)"""
+        with self._lock:
+            return estimate_size(self.recent)
+
+    def trim_recent(self, keep: int = DEFAULT_TRIM_RECENT):
+        """Bellek baskısında son hatalar kuyruğunu kısalt (kayıtlar günlükte kalır)"""
+        with self._lock:
+            kept = list(self.recent)[-keep:] if keep else []
+            self.recent.clear()
+            self.recent_type_counts.clear()
+            self.recent_critical = []
+            for error_data in kept:
+                self._remember(error_data)
+
+    # Kayıt
+
+    def record(self, error: Union[BaseException, str], command: Optional[str] = None,
+               context: Optional[str] = None, severity: str = "ERROR", trace: Optional[str] = None) -> dict:
+        """Hatayı bir kez kaydet; aynı parmak izli tekrarların izi günlüğe yeniden yazılmaz"""
+        if trace is None:
+            trace = traceback.format_exc() if sys.exc_info()[0] is not None else ""
+        error_type = type(error).__name__ if isinstance(error, BaseException) else "Error"
+        message = str(error)
+        key = fingerprint(error_type, trace, message)
+
+        error_data = {
+            "timestamp": datetime.now().isoformat(),
+            "error_type": error_type,
+            "error_message": message,
+            "traceback": trace,
+            "command": command,
+            "context": context,
+            "severity": severity,
+            "is_critical": severity == "CRITICAL",
+            "fingerprint": key
+        }
+
+        with self._lock:
+            repeat = key in self.fingerprints
+            self._count(error_data)
+            self._remember(error_data)
+            save_due = time.monotonic() - self._last_saved >= ANALYTICS_SAVE_INTERVAL
+
+        try:
+            # Tekrarlayan hatanın izi parmak izi tablosunda durur, günlüğe yalnızca olay yazılır
+            self.journal.append({**error_data, "traceback": ""} if repeat else error_data)
+        except Exception as e:
+            self.logger.error(f"Hata günlüğe yazılamadı: {str(e)}")
+        if save_due:
+            self.save_analytics()
+        return error_data
+
+    # Sorgular
+
+    def get_traceback(self, key: str) -> str:
+        """Parmak izinin örnek hata izini getir"""
+        entry = self.fingerprints.get(key)
+        return entry["traceback"] if entry else ""
+
+    def analyze_errors(self, time_window: str = "24h") -> Dict:
+        """Pencere içindeki hataları katmanlı kovalardan özetle
+
+        Pencereyi kapsayan en ince katmanın en fazla `slots` kovası okunur; pencere
+        kova sınırına yuvarlanır. Eğilim, kova başına hata sayısının doğrusal eğimidir.
+        """
+        window = parse_time_window(time_window)
+        now = time.time()
+
+        by_fingerprint: Counter = Counter()
+        by_type: Counter = Counter()
+        by_severity: Counter = Counter()
+
+        with self._lock:
+            tier, series = self.analytics.window_series(window.total_seconds(), now)
+            type_series: Dict[str, List[int]] = {}
+            for index, bucket in enumerate(series):
+                for (error_type, severity, key), count in bucket.items():
+                    by_fingerprint[key] += count
+                    by_type[error_type] += count
+                    by_severity[severity] += count
+                    type_series.setdefault(error_type, [0] * len(series))[index] += count
+
+            top = [
+                {
+                    "fingerprint": key,
+                    "type": self.fingerprints[key]["type"],
+                    "message": self.fingerprints[key]["message"],
+                    "count": count,
+                    "last_seen": self.fingerprints[key]["last_seen"]
+                }
+                for key, count in by_fingerprint.most_common(10) if key in self.fingerprints
+            ]
+            cutoff = datetime.fromtimestamp(now - window.total_seconds()).isoformat()
+            critical = [error for error in self.recent_critical if error["timestamp"] > cutoff]
+
+        totals = [sum(bucket.values()) for bucket in series]
+        trends = {error_type: self._trend(values) for error_type, values in type_series.items()}
+
+        return {
+            "total_errors": sum(by_type.values()),
+            "error_types": dict(by_type),
+            "severities": dict(by_severity),
+            "most_common": by_type.most_common(1)[0] if by_type else None,
+            "fingerprints": top,
+            "critical_errors": critical,
+            "resolution": tier.name,
+            "series": totals,
+            "trend": self._trend(totals),
+            "trends": trends
+        }
+
+    @staticmethod
+    def _trend(values: List[int]) -> Dict:
+        value = slope(values)
+        direction = "artıyor" if value > 1e-9 else "azalıyor" if value < -1e-9 else "sabit"
+        return {"slope": round(value, 4), "direction": direction}
+
+    def get_recent_summary(self) -> Dict:
+        """Son hatalar kuyruğundaki tip sayaçları ve kritik hatalar"""
+        with self._lock:
+            return {
+                "common_errors": dict(self.recent_type_counts),
+                "critical_errors": list(self.recent_critical)
+            }
@@ -1,8 +1,12 @@
 from PyQt6.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout, 
-                           QTextEdit, QPushButton, QLabel, QProgressBar, QScrollArea, QHBoxLayout, QDialog, QComboBox, QMessageBox)
+                           QTextEdit, QPushButton, QLabel, QProgressBar, QScrollArea, QHBoxLayout, QDialog, QComboBox, QMessageBox,
+                           QTableWidget, QTableWidgetItem, QHeaderView, QAbstractItemView)
 from PyQt6.QtCore import Qt, QThread, pyqtSignal, QObject, QTimer
 from PyQt6.QtGui import QFont, QIcon, QTextCursor
 import sys
+import asyncio
+import inspect
+from contextlib import aclosing
 from voice_listener import VoiceListener
 from code_agent import CodeEditorAgent
 
@@ -40,6 +44,9 @@ class VoiceListenerThread(QThread):
 
 class AIResponseThread(QThread):
     response_ready = pyqtSignal(str)
+    stream_started = pyqtSignal()
+    chunk_ready = pyqtSignal(str)
+    stream_finished = pyqtSignal(str)
     error_occurred = pyqtSignal(str)
     
     def __init__(self, agent, command):
@@ -50,9 +57,113 @@ class AIResponseThread(QThread):
     def run(self):
         try:
             response = self.agent.process_command(self.command)
-            self.response_ready.emit(response)
+            if inspect.isasyncgen(response):
+                # Akışlı yanıt: parçalar geldikçe balona eklenir
+                self.stream_started.emit()
+                self.stream_finished.emit(asyncio.run(self._consume_stream(response)))
+            elif inspect.iscoroutine(response):
+                self.response_ready.emit(asyncio.run(response))
+            else:
+                self.response_ready.emit(response)
         except Exception as e:
             self.error_occurred.emit(str(e))
+            
+    async def _consume_stream(self, stream) -> str:
+        """Akıştaki her parçayı sinyal olarak gönder ve tam metni döndür"""
+        parts = []
+        # Hata ya da iptalde üreteç (ve içindeki iz) hemen kapatılır
+        async with aclosing(stream) as chunks:
+            async for chunk in chunks:
+                parts.append(chunk)
+                self.chunk_ready.emit(chunk)
+        return "".join(parts)
+
+class SlowCommandsDialog(QDialog):
+    """Bütçeyi aşan komutları en kötüden başlayarak listeleyen panel"""
+    COLUMNS = ["Süre (ms)", "Intent", "Komut", "Zaman", "Limit"]
+    
+    def __init__(self, performance_manager, parent=None):
+        super().__init__(parent)
+        self.performance_manager = performance_manager
+        self.reports = []
+        self.setWindowTitle("Yavaş Komutlar")
+        self.resize(900, 600)
+        
+        layout = QVBoxLayout(self)
+        
+        # Sıralama ve yenileme
+        control_layout = QHBoxLayout()
+        self.order_combo = QComboBox()
+        self.order_combo.addItem("En yavaş", "duration")
+        self.order_combo.addItem("En yeni", "timestamp")
+        self.order_combo.currentIndexChanged.connect(self.refresh)
+        refresh_button = QPushButton("Yenile")
+        refresh_button.clicked.connect(self.refresh)
+        control_layout.addWidget(self.order_combo)
+        control_layout.addWidget(refresh_button)
+        layout.addLayout(control_layout)
+        
+        self.table = QTableWidget(0, len(self.COLUMNS))
+        self.table.setHorizontalHeaderLabels(self.COLUMNS)
+        self.table.horizontalHeader().setSectionResizeMode(2, QHeaderView.ResizeMode.Stretch)
+        self.table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
+        self.table.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        self.table.currentCellChanged.connect(lambda row, *_: self.show_details(row))
+        layout.addWidget(self.table)
+        
+        # Seçili raporun aralık dökümü, kaynakları ve yığınları
+        self.details = QTextEdit()
+        self.details.setReadOnly(True)
+        self.details.setFont(QFont("Consolas", 9))
+        layout.addWidget(self.details)
+        
+        self.refresh()
+        
+    def refresh(self):
+        """Raporları yeniden yükle"""
+        self.reports = self.performance_manager.get_slow_commands(limit=50, order=self.order_combo.currentData())
+        self.table.setRowCount(len(self.reports))
+        for row, report in enumerate(self.reports):
+            values = [
+                f"{report['duration_ms']:.0f}",
+                report["intent"],
+                report["command"] or "",
+                report["recorded_at"][:19].replace("T", " "),
+                ", ".join(report["over_limits"])
+            ]
+            for column, value in enumerate(values):
+                self.table.setItem(row, column, QTableWidgetItem(value))
+        self.details.clear()
+        if self.reports:
+            self.table.selectRow(0)
+            
+    def show_details(self, row):
+        """Seçili raporun ayrıntılarını göster"""
+        if not 0 <= row < len(self.reports):
+            return
+        report = self.reports[row]
+        lines = [f"'{report['command']}' → {report['intent']} ({report['duration_ms']:.0f} ms)"]
+        if report.get("error"):
+            lines.append(f"Hata: {report['error']}")
+        
+        lines.append("\nAralıklar:")
+        for span in report["spans"]:
+            indent = "  " * span["span"].count("/")
+            lines.append(f"  {indent}{span['span'].rsplit('/', 1)[-1]}: {span['duration_ms']} ms")
+        
+        resources = report.get("resources", {})
+        lines.append(
+            f"\nKaynaklar: CPU %{resources.get('cpu_percent')} | Bellek %{resources.get('memory_percent')} | "
+            f"Disk %{resources.get('disk_percent')}"
+        )
+        
+        stacks = report.get("stacks", {})
+        lines.append(f"\nThread yığınları ({stacks.get('after_ms')} ms'de):")
+        for stack in stacks.get("threads", []):
+            marker = " (komut)" if stack["command_thread"] else ""
+            lines.append(f"  [{stack['thread']}]{marker}")
+            lines.extend(f"    {frame}" for frame in stack["frames"])
+        self.details.setPlainText("\n".join(lines))
 
 class AICodeEditorGUI(QMainWindow):
     confirmation_response = pyqtSignal(str)
@@ -60,6 +171,7 @@ class AICodeEditorGUI(QMainWindow):
     def __init__(self):
         super().__init__()
         self.agent = CodeEditorAgent()
+        self.live_bubble = None
         self.init_ui()
         self.start_voice_listener()
         self.setup_confirmation_dialog()
@@ -142,6 +254,17 @@ class AICodeEditorGUI(QMainWindow):
         
         button_layout.addWidget(self.start_button)
         button_layout.addWidget(self.stop_button)
+        
+        # Profilleme butonu (aç/kapat)
+        self.profile_button = QPushButton("Profil")
+        self.profile_button.setCheckable(True)
+        self.profile_button.toggled.connect(self.toggle_profiling)
+        button_layout.addWidget(self.profile_button)
+        
+        # Yavaş komut paneli
+        self.slow_commands_button = QPushButton("Yavaş Komutlar")
+        self.slow_commands_button.clicked.connect(self.show_slow_commands)
+        button_layout.addWidget(self.slow_commands_button)
         layout.addLayout(button_layout)
         
         self.apply_styles()
@@ -158,6 +281,24 @@ class AICodeEditorGUI(QMainWindow):
         
         # Scroll'u en alta kaydır
         QTimer.singleShot(100, self._scroll_to_bottom)
+        return bubble
+        
+    def start_live_message(self):
+        """Akışlı yanıt için boş bir asistan balonu aç"""
+        self.live_bubble = self.add_chat_message("", False)
+        
+    def append_to_live_message(self, chunk):
+        """Gelen parçayı canlı balona ekle"""
+        if self.live_bubble is None:
+            self.start_live_message()
+        self.live_bubble.setText(self.live_bubble.text() + chunk)
+        self._scroll_to_bottom()
+        
+    def finish_live_message(self, text):
+        """Akış bittiğinde canlı balonu tam metinle kapat"""
+        if self.live_bubble is not None and text:
+            self.live_bubble.setText(text)
+        self.live_bubble = None
         
     def _scroll_to_bottom(self):
         """Chat alanını en alta kaydır"""
@@ -181,6 +322,9 @@ class AICodeEditorGUI(QMainWindow):
         self.response_thread.response_ready.connect(
             lambda response: self.add_chat_message(response, False)
         )
+        self.response_thread.stream_started.connect(self.start_live_message)
+        self.response_thread.chunk_ready.connect(self.append_to_live_message)
+        self.response_thread.stream_finished.connect(self.finish_live_message)
         self.response_thread.error_occurred.connect(
             lambda error: self.add_chat_message(f"Hata: {error}", False)
         )
@@ -194,6 +338,20 @@ class AICodeEditorGUI(QMainWindow):
         self.stop_button.setEnabled(False)
         self.status_label.setText("Dinleme durduruldu")
         
+    def toggle_profiling(self, checked):
+        """Profillemeyi başlat ya da durdurup özetini göster"""
+        performance_manager = self.agent.performance_manager
+        if checked:
+            if performance_manager.start_profiling():
+                self.status_label.setText("Profilleme çalışıyor...")
+        else:
+            self.add_chat_message(performance_manager.stop_profiling(), False)
+            self.status_label.setText("Profilleme durduruldu")
+        
+    def show_slow_commands(self):
+        """Yavaş komut panelini aç"""
+        SlowCommandsDialog(self.agent.performance_manager, self).exec()
+        
     def update_status(self, status):
         self.status_label.setText(status)
         
@@ -0,0 +1,225 @@
+import logging
+import re
+import threading
+from collections import deque
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+
+APP_INTENT = "open_app"
+UNKNOWN_INTENT = "unknown"
+# Yol ya da dosya adı gibi görünen sözcük (a/b, a\b, ad_soyad, ad.py)
+PATH_LIKE = re.compile(r'[/\\_]|\.\w')
+
+def is_whole_word(text: str, start: int, end: int) -> bool:
+    """text[start:end] kelime ortasında değil mi (önünde ve ardında harf/rakam yok)"""
+    before = text[start - 1] if start > 0 else ""
+    after = text[end] if end < len(text) else ""
+    return not (before.isalnum() or before == "_") and not (after.isalnum() or after == "_")
+
+def is_word_start(text: str, start: int) -> bool:
+    """text[start] bir kelimenin başı mı (öncesinde harf/rakam yok)"""
+    before = text[start - 1] if start > 0 else ""
+    return not (before.isalnum() or before == "_")
+
+def token_at(text: str, start: int, end: int) -> str:
+    """text[start:end] aralığını içeren boşluksuz sözcüğü getir"""
+    while start > 0 and not text[start - 1].isspace():
+        start -= 1
+    while end < len(text) and not text[end].isspace():
+        end += 1
+    return text[start:end]
+
+def is_keyword_match(text: str, start: int, end: int) -> bool:
+    """Niyet anahtar kelimesi kelime başında mı ve yol/dosya adının parçası değil mi
+
+    Türkçe ekler nedeniyle kelime sonu aranmaz ("geliştirir", "profili").
+    """
+    return is_word_start(text, start) and not PATH_LIKE.search(token_at(text, start, end))
+
+class KeywordMatcher:
+    """Aho-Corasick tabanlı çoklu anahtar kelime eşleştirici"""
+
+    def __init__(self):
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._output: List[List[Tuple[str, object]]] = [[]]
+        self._built = False
+
+    def add(self, keyword: str, payload: object):
+        """Anahtar kelimeyi ve ona bağlı veriyi ekle"""
+        if not keyword:
+            return
+        state = 0
+        for char in keyword:
+            next_state = self._goto[state].get(char)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto[state][char] = next_state
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append([])
+            state = next_state
+        self._output[state].append((keyword, payload))
+        self._built = False
+
+    def build(self):
+        """Hata (failure) bağlantılarını genişlik öncelikli olarak kur"""
+        queue = deque()
+        for state in self._goto[0].values():
+            self._fail[state] = 0
+            queue.append(state)
+
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fallback = self._fail[state]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                self._fail[next_state] = self._goto[fallback].get(char, 0)
+                self._output[next_state] = self._output[next_state] + self._output[self._fail[next_state]]
+
+        self._built = True
+
+    def iter_matches(self, text: str) -> Iterator[Tuple[int, str, object]]:
+        """Metindeki tüm eşleşmeleri tek geçişte üret: (başlangıç, kelime, veri)"""
+        if not self._built:
+            self.build()
+
+        state = 0
+        goto = self._goto
+        fail = self._fail
+        output = self._output
+        for index, char in enumerate(text):
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            for keyword, payload in output[state]:
+                yield index - len(keyword) + 1, keyword, payload
+
+class RouteResult:
+    """Yönlendirme sonucu"""
+
+    def __init__(self, intent: str, keyword: Optional[str] = None, app: Optional[str] = None,
+                 matches: Optional[Dict[str, List[str]]] = None, trace: Optional[List[str]] = None):
+        self.intent = intent
+        self.keyword = keyword
+        self.app = app
+        self.matches = matches or {}
+        self.trace = trace
+
+    def __repr__(self):
+        return f"RouteResult(intent={self.intent!r}, keyword={self.keyword!r}, app={self.app!r})"
+
+class IntentRouter:
+    """Komutu tek geçişte niyete (intent) eşleyen derlenmiş yönlendirici"""
+
+    def __init__(self, intents: Sequence[Tuple[str, Sequence[str]]], config_actions: Optional[Dict[str, List[str]]] = None,
+                 app_index=None, debug: bool = False):
+        self.logger = logging.getLogger("AICodeEditor.IntentRouter")
+        self.app_index = app_index
+        self.debug = debug
+        self._lock = threading.Lock()
+
+        # Sıra önceliği belirler: listede önce gelen niyet kazanır
+        self.priorities = [name for name, _ in intents]
+        self.keywords: Dict[str, List[str]] = {}
+        for name, words in intents:
+            self.keywords[name] = list(dict.fromkeys(words))
+
+        # Config'deki komut grupları aynı adlı niyetlere eklenir
+        for group, words in (config_actions or {}).items():
+            if group in self.keywords:
+                for word in words:
+                    if word not in self.keywords[group]:
+                        self.keywords[group].append(word)
+            else:
+                self.logger.debug(f"İşleyicisi olmayan komut grubu atlandı: {group}")
+
+        self._matcher = None
+        self._app_version = None
+        self._compile()
+
+    def _compile(self):
+        """Niyet anahtar kelimeleri ve uygulama adlarından eşleştiriciyi derle"""
+        matcher = KeywordMatcher()
+        for intent, words in self.keywords.items():
+            for word in words:
+                matcher.add(word.lower(), ("intent", intent))
+
+        app_version = None
+        if self.app_index is not None:
+            app_version = self.app_index.version
+            for app_name in self.app_index.names():
+                matcher.add(app_name, ("app", app_name))
+
+        matcher.build()
+        self._matcher = matcher
+        self._app_version = app_version
+
+    def _ensure_current(self):
+        """Uygulama indeksi değiştiyse eşleştiriciyi yeniden derle"""
+        if self.app_index is not None and self.app_index.version != self._app_version:
+            with self._lock:
+                if self.app_index.version != self._app_version:
+                    self._compile()
+
+    def route(self, command: str, explain: bool = False) -> RouteResult:
+        """Komutun niyetini belirle"""
+        self._ensure_current()
+        text = command.lower().strip()
+
+        intent_hits: Dict[str, List[str]] = {}
+        best_app = None
+        for start, keyword, (kind, value) in self._matcher.iter_matches(text):
+            if kind == "intent":
+                # "src/profiler.py" içindeki "profil" ya da "googleapi" içindeki "google" niyet sayılmaz
+                if not is_keyword_match(text, start, start + len(keyword)):
+                    continue
+                hits = intent_hits.setdefault(value, [])
+                if keyword not in hits:
+                    hits.append(keyword)
+            elif (best_app is None or len(value) > len(best_app)) and is_whole_word(text, start, start + len(keyword)):
+                # Uygulama adları yalnızca tam kelime olarak sayılır; birden fazlası geçerse en uzunu seçilir
+                best_app = value
+
+        trace = [] if (explain or self.debug) else None
+        result = None
+        for intent in self.priorities:
+            hits = intent_hits.get(intent)
+            if not hits:
+                continue
+            if intent == APP_INTENT and not best_app:
+                if trace is not None:
+                    trace.append(f"{intent}: {hits} eşleşti ama uygulama adı bulunamadı, atlandı")
+                continue
+            if trace is not None:
+                trace.append(f"{intent}: {hits} eşleşti, öncelik {self.priorities.index(intent)} ile seçildi")
+            result = RouteResult(
+                intent,
+                keyword=hits[0],
+                app=best_app if intent == APP_INTENT else None,
+                matches=intent_hits,
+                trace=trace
+            )
+            break
+
+        if result is None:
+            if trace is not None:
+                trace.append("Eşleşen niyet yok")
+            result = RouteResult(UNKNOWN_INTENT, matches=intent_hits, trace=trace)
+
+        if self.debug:
+            self.logger.debug(f"Yönlendirme: '{text}' -> {result.intent} | " + "; ".join(trace))
+
+        return result
+
+    def explain(self, command: str) -> str:
+        """Bir komutun neden belirli bir niyete yönlendirildiğini açıkla"""
+        result = self.route(command, explain=True)
+        lines = [f"🧭 '{command}' → {result.intent}"]
+        if result.app:
+            lines.append(f"- Uygulama: {result.app}")
+        for intent, hits in result.matches.items():
+            lines.append(f"- {intent}: {', '.join(hits)}")
+        lines.extend(f"  {step}" for step in result.trace or [])
+        return "\n".join(lines)
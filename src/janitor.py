@@ -0,0 +1,284 @@
+import fnmatch
+import gzip
+import logging
+import os
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, List, NamedTuple, Optional, Tuple
+from config_manager import get_config_manager
+from tracer import get_tracer
+
+DEFAULT_TEMP_TARGETS = [
+    {"path": "data/temp", "max_age_hours": 24, "max_bytes": 500 * 1024 * 1024}
+]
+# Yalnızca döndürülmüş loglar (debug.log.1 ...) arşivlenir; açık handler'ların
+# yazdığı debug.log, voice.log, crashes.log gibi canlı dosyalara dokunulmaz
+DEFAULT_LOGS = {
+    "directories": ["data/logs", "data"],
+    "patterns": ["*.log.[0-9]*"],
+    "archive_after_days": 7,
+    "archive_dir": "data/logs/archive",
+    "archive_max_age_days": 90,
+    "archive_max_bytes": 200 * 1024 * 1024
+}
+DEFAULT_BATCH_SIZE = 100
+DEFAULT_PAUSE = 0.005
+DEFAULT_BYTES_PER_SECOND = 8 * 1024 * 1024
+DEFAULT_CHUNK_SIZE = 256 * 1024
+DEFAULT_IDLE_POLL = 0.25
+# Komut bitmezse temizlik en fazla bu kadar ertelenir
+DEFAULT_MAX_DEFER = 30
+
+# Süreç genelinde tek temizlikçi
+_janitor = None
+_janitor_lock = threading.Lock()
+
+def get_janitor() -> "Janitor":
+    """Paylaşılan temp/log temizlikçisini getir"""
+    global _janitor
+    if _janitor is None:
+        with _janitor_lock:
+            if _janitor is None:
+                _janitor = Janitor()
+    return _janitor
+
+class FileEntry(NamedTuple):
+    """Tarama sırasında bir kez alınan stat bilgisi"""
+    path: str
+    size: int
+    mtime: float
+
+class Janitor:
+    """os.scandir tabanlı, yaş ve boyut bütçeli temp temizliği ve sıkıştırarak log arşivleme
+
+    Her girdi için stat tek kez alınır. İş küçük parçalar halinde yapılır;
+    parçalar arasında bir komut işleniyorsa (açık iz varsa) komut bitene kadar beklenir.
+    """
+
+    def __init__(self, janitor_config: Optional[dict] = None, is_busy: Optional[Callable[[], bool]] = None):
+        self.logger = logging.getLogger("AICodeEditor.Janitor")
+        if janitor_config is None:
+            janitor_config = get_config_manager().get_config("performance", {}).get("janitor", {})
+
+        self.temp_targets = janitor_config.get("temp", DEFAULT_TEMP_TARGETS)
+        self.logs = {**DEFAULT_LOGS, **janitor_config.get("logs", {})}
+
+        throttle = janitor_config.get("throttle", {})
+        self.batch_size = max(throttle.get("batch_size", DEFAULT_BATCH_SIZE), 1)
+        self.pause = throttle.get("pause", DEFAULT_PAUSE)
+        self.bytes_per_second = throttle.get("bytes_per_second", DEFAULT_BYTES_PER_SECOND)
+        self.chunk_size = throttle.get("chunk_size", DEFAULT_CHUNK_SIZE)
+        self.idle_poll = throttle.get("idle_poll", DEFAULT_IDLE_POLL)
+        self.max_defer = throttle.get("max_defer", DEFAULT_MAX_DEFER)
+
+        tracer = get_tracer()
+        self.is_busy = is_busy or (lambda: tracer.active_traces > 0)
+
+        self._run_lock = threading.Lock()
+        self._thread_lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+        self._operations = 0
+        self.last_result: Optional[Dict] = None
+
+    def _throttle(self, weight: int = 1):
+        """Her `batch_size` işlemde bir mola ver; komut işleniyorsa bitmesini bekle"""
+        self._operations += weight
+        if self._operations < self.batch_size:
+            return
+        self._operations = 0
+
+        deadline = time.monotonic() + self.max_defer
+        while self.is_busy() and time.monotonic() < deadline and not self._stop.is_set():
+            self._stop.wait(self.idle_poll)
+        if self.pause:
+            time.sleep(self.pause)
+
+    def _scan(self, root: Path, recursive: bool = True) -> Tuple[List[FileEntry], List[FileEntry]]:
+        """Dizindeki dosyaları ve alt dizinleri tek stat ile listele (sembolik bağlar izlenmez)"""
+        files: List[FileEntry] = []
+        dirs: List[FileEntry] = []
+        stack = [str(root)]
+        while stack:
+            current = stack.pop()
+            try:
+                with os.scandir(current) as entries:
+                    for entry in entries:
+                        try:
+                            stat = entry.stat(follow_symlinks=False)
+                            if entry.is_dir(follow_symlinks=False):
+                                if recursive:
+                                    dirs.append(FileEntry(entry.path, 0, stat.st_mtime))
+                                    stack.append(entry.path)
+                            else:
+                                files.append(FileEntry(entry.path, stat.st_size, stat.st_mtime))
+                        except OSError:
+                            # Tarama sırasında silinmiş
+                            continue
+                        self._throttle()
+            except OSError as e:
+                if current != str(root) or Path(root).exists():
+                    self.logger.debug(f"Dizin okunamadı ({current}): {str(e)}")
+        return files, dirs
+
+    def _remove(self, entry: FileEntry, result: Dict) -> bool:
+        try:
+            os.unlink(entry.path)
+        except FileNotFoundError:
+            return False
+        except OSError as e:
+            # Açık/kilitli dosya; bir sonraki turda tekrar denenir
+            self.logger.debug(f"Dosya silinemedi ({entry.path}): {str(e)}")
+            result["skipped"] += 1
+            return False
+        result["files_removed"] += 1
+        result["bytes_freed"] += entry.size
+        self._throttle()
+        return True
+
+    def clean_directory(self, root: Path, max_age_hours: Optional[float] = None,
+                        max_bytes: Optional[int] = None) -> Dict:
+        """Yaşı aşan dosyaları, ardından boyut bütçesi aşılıyorsa en eskileri sil; boş alt dizinleri kaldır
+
+        `max_age_hours=0` dizinin tüm içeriğini siler, dizinin kendisi kalır.
+        """
+        result = {"path": str(root), "files_removed": 0, "dirs_removed": 0, "bytes_freed": 0, "skipped": 0}
+        files, dirs = self._scan(Path(root))
+        cutoff = time.time() - max_age_hours * 3600 if max_age_hours is not None else None
+
+        remaining = []
+        for entry in files:
+            if cutoff is not None and entry.mtime < cutoff:
+                if self._remove(entry, result):
+                    continue
+            remaining.append(entry)
+
+        if max_bytes is not None:
+            total = sum(entry.size for entry in remaining)
+            remaining.sort(key=lambda entry: entry.mtime)
+            for entry in remaining:
+                if total <= max_bytes:
+                    break
+                if self._remove(entry, result):
+                    total -= entry.size
+
+        # En derindeki dizinden başlayarak boşalanları kaldır (yaş sınırı yoksa dizinlere dokunulmaz)
+        for entry in sorted(dirs, key=lambda entry: entry.path.count(os.sep), reverse=True):
+            if cutoff is None or entry.mtime >= cutoff:
+                continue
+            try:
+                os.rmdir(entry.path)
+                result["dirs_removed"] += 1
+            except OSError:
+                pass
+        return result
+
+    def clean_temp(self) -> List[Dict]:
+        """Yapılandırılmış tüm temp dizinlerini bütçelerine göre temizle"""
+        return [
+            self.clean_directory(Path(target["path"]), target.get("max_age_hours"), target.get("max_bytes"))
+            for target in self.temp_targets
+        ]
+
+    def _compress(self, entry: FileEntry, archive_dir: Path) -> Optional[int]:
+        """Dosyayı parça parça, hız sınırıyla gzip'le; başarılıysa arşiv boyutunu döndür"""
+        source = Path(entry.path)
+        stamp = datetime.fromtimestamp(entry.mtime)
+        target = archive_dir / f"{source.name}.{stamp:%Y%m%d-%H%M%S}.gz"
+        counter = 1
+        while target.exists():
+            target = archive_dir / f"{source.name}.{stamp:%Y%m%d-%H%M%S}-{counter}.gz"
+            counter += 1
+
+        temp_path = target.with_suffix(".tmp")
+        try:
+            with open(source, "rb") as src, gzip.open(temp_path, "wb") as dst:
+                while True:
+                    chunk = src.read(self.chunk_size)
+                    if not chunk:
+                        break
+                    dst.write(chunk)
+                    if self.bytes_per_second:
+                        time.sleep(len(chunk) / self.bytes_per_second)
+                    self._throttle(self.batch_size)
+            os.replace(temp_path, target)
+        except OSError as e:
+            temp_path.unlink(missing_ok=True)
+            self.logger.debug(f"Log arşivlenemedi ({source}): {str(e)}")
+            return None
+
+        size = target.stat().st_size
+        try:
+            # Arşivin yaşı orijinal logun yaşıdır
+            os.utime(target, (entry.mtime, entry.mtime))
+            os.unlink(source)
+        except OSError as e:
+            # Kaynak silinemediyse (ör. açık dosya) arşiv geri alınır; sonraki turda tekrar denenir
+            target.unlink(missing_ok=True)
+            self.logger.debug(f"Log arşivlenemedi ({source}): {str(e)}")
+            return None
+        return size
+
+    def archive_logs(self) -> Dict:
+        """Eski logları sıkıştırarak arşivle, arşivi yaş ve boyut bütçesine göre buda"""
+        logs = self.logs
+        archive_dir = Path(logs["archive_dir"])
+        result = {"logs_archived": 0, "bytes_read": 0, "bytes_written": 0}
+        cutoff = time.time() - logs["archive_after_days"] * 86400
+
+        for directory in logs["directories"]:
+            files, _ = self._scan(Path(directory), recursive=False)
+            for entry in files:
+                name = os.path.basename(entry.path)
+                if entry.mtime >= cutoff or name.endswith(".gz"):
+                    continue
+                if not any(fnmatch.fnmatch(name, pattern) for pattern in logs["patterns"]):
+                    continue
+                archive_dir.mkdir(parents=True, exist_ok=True)
+                written = self._compress(entry, archive_dir)
+                if written is not None:
+                    result["logs_archived"] += 1
+                    result["bytes_read"] += entry.size
+                    result["bytes_written"] += written
+
+        result["archive"] = self.clean_directory(
+            archive_dir, logs["archive_max_age_days"] * 24, logs["archive_max_bytes"]
+        )
+        return result
+
+    def run(self, temp: bool = True, logs: bool = True) -> Dict:
+        """Temizliği bu thread'de çalıştır (aynı anda tek çalışma)"""
+        with self._run_lock:
+            started = time.monotonic()
+            result: Dict = {"started_at": datetime.now().isoformat()}
+            try:
+                if temp:
+                    result["temp"] = self.clean_temp()
+                if logs:
+                    result["logs"] = self.archive_logs()
+            except Exception as e:
+                result["error"] = str(e)
+                self.logger.error(f"Temizlik hatası: {str(e)}")
+            result["duration"] = round(time.monotonic() - started, 3)
+            self.last_result = result
+
+        freed = sum(item["bytes_freed"] for item in result.get("temp", []))
+        archived = result.get("logs", {}).get("logs_archived", 0)
+        self.logger.info(f"Temizlik tamamlandı: {freed / 1024 / 1024:.1f} MB boşaltıldı, {archived} log arşivlendi")
+        return result
+
+    def run_in_background(self, temp: bool = True, logs: bool = True) -> bool:
+        """Temizliği arka plan thread'inde başlat; zaten çalışıyorsa False döner"""
+        with self._thread_lock:
+            if self._thread is not None and self._thread.is_alive():
+                return False
+            self._stop.clear()
+            self._thread = threading.Thread(target=self.run, args=(temp, logs), name="Janitor", daemon=True)
+            self._thread.start()
+        return True
+
+    def stop(self):
+        """Bekleyen molaları kes (çalışan tur hızlanarak biter)"""
+        self._stop.set()
@@ -1,11 +1,11 @@
 from pathlib import Path
 import json
 import os
-from config_manager import ConfigManager
+from config_manager import get_config_manager
 
 class LanguageManager:
     def __init__(self):
-        self.config_manager = ConfigManager()
+        self.config_manager = get_config_manager()
         self.languages_dir = Path("src/languages")
         self.languages_dir.mkdir(exist_ok=True)
         
@@ -0,0 +1,95 @@
+import importlib
+import logging
+import threading
+import time
+import types
+from typing import Callable, Dict, Optional
+
+logger = logging.getLogger("AICodeEditor.LazyImport")
+
+# Yüklenen modüllerin yükleme süreleri (saniye)
+_load_times: Dict[str, float] = {}
+_import_lock = threading.RLock()
+
+class LazyModule(types.ModuleType):
+    """İlk özellik erişiminde gerçek modülü yükleyen vekil modül"""
+
+    def __init__(self, name: str, on_load: Optional[Callable] = None):
+        super().__init__(name)
+        self.__dict__["_lazy_name"] = name
+        self.__dict__["_lazy_module"] = None
+        self.__dict__["_lazy_on_load"] = on_load
+
+    def _load(self):
+        """Gerçek modülü yükle (bir kez)"""
+        module = self.__dict__["_lazy_module"]
+        if module is not None:
+            return module
+
+        with _import_lock:
+            module = self.__dict__["_lazy_module"]
+            if module is None:
+                name = self.__dict__["_lazy_name"]
+                start = time.perf_counter()
+                module = importlib.import_module(name)
+                _load_times[name] = time.perf_counter() - start
+                self.__dict__["_lazy_module"] = module
+                logger.debug(f"Modül yüklendi: {name} ({_load_times[name] * 1000:.1f} ms)")
+
+                on_load = self.__dict__["_lazy_on_load"]
+                if on_load:
+                    on_load(module)
+        return module
+
+    def __getattr__(self, attr: str):
+        return getattr(self._load(), attr)
+
+    def __setattr__(self, attr: str, value):
+        setattr(self._load(), attr, value)
+
+    def __dir__(self):
+        return dir(self._load())
+
+    def __repr__(self):
+        state = "yüklendi" if self.__dict__["_lazy_module"] is not None else "yüklenmedi"
+        return f"<LazyModule {self.__dict__['_lazy_name']} ({state})>"
+
+class LazyAttribute:
+    """Bir modülün sınıf/fonksiyon gibi özelliğini ilk kullanımda çözen vekil"""
+
+    def __init__(self, module_name: str, attr: str):
+        self._module = lazy_import(module_name)
+        self._attr = attr
+        self._target = None
+
+    def _resolve(self):
+        if self._target is None:
+            self._target = getattr(self._module, self._attr)
+        return self._target
+
+    def __call__(self, *args, **kwargs):
+        return self._resolve()(*args, **kwargs)
+
+    def __getattr__(self, attr: str):
+        return getattr(self._resolve(), attr)
+
+    def __repr__(self):
+        return f"<LazyAttribute {self._module.__name__}.{self._attr}>"
+
+def lazy_import(name: str, on_load: Optional[Callable] = None) -> LazyModule:
+    """Modülü ilk kullanımda yüklenecek şekilde içe aktar"""
+    return LazyModule(name, on_load)
+
+def lazy_attr(module_name: str, attr: str) -> LazyAttribute:
+    """Modül özelliğini (ör. sınıf) ilk kullanımda yüklenecek şekilde al"""
+    return LazyAttribute(module_name, attr)
+
+def ensure_loaded(module):
+    """Tembel modülü hemen yükle (gerçek modüller için etkisiz)"""
+    if isinstance(module, LazyModule):
+        return module._load()
+    return module
+
+def get_load_times() -> Dict[str, float]:
+    """Tembel yüklenen modüllerin yükleme sürelerini getir"""
+    return dict(_load_times)
@@ -0,0 +1,210 @@
+import atexit
+import logging
+import logging.handlers
+import queue
+import threading
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+from config_manager import get_config_manager
+
+LOG_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+CONSOLE_FORMAT = '%(levelname)s: %(message)s'
+
+DEFAULT_QUEUE_SIZE = 10000
+DEFAULT_BATCH_SIZE = 200
+DEFAULT_FLUSH_INTERVAL = 1.0
+DEFAULT_MAX_BYTES = 5 * 1024 * 1024
+DEFAULT_BACKUP_COUNT = 3
+DEFAULT_ROTATE_HOURS = 24
+DEFAULT_FILES = [
+    {"path": "data/debug.log", "level": "DEBUG"},
+    {"path": "data/logs/voice.log", "level": "DEBUG", "loggers": ["AICodeEditor.VoiceListener", "AICodeEditor.TTS"]}
+]
+
+# Süreç genelinde tek günlük hattı
+_pipeline = None
+_pipeline_lock = threading.Lock()
+
+def get_log_pipeline() -> "LogPipeline":
+    """Günlük hattını (ilk çağrıda) kur ve getir"""
+    global _pipeline
+    if _pipeline is None:
+        with _pipeline_lock:
+            if _pipeline is None:
+                _pipeline = LogPipeline()
+                _pipeline.start()
+                atexit.register(_pipeline.stop)
+    return _pipeline
+
+class DroppingQueueHandler(logging.handlers.QueueHandler):
+    """Kuyruk doluysa çağıranı bekletmek yerine kaydı düşüren kuyruk handler'ı"""
+
+    def __init__(self, log_queue: queue.Queue):
+        super().__init__(log_queue)
+        self.dropped = 0
+
+    def enqueue(self, record: logging.LogRecord):
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+class BatchedFileHandler(logging.handlers.RotatingFileHandler):
+    """Her kayıtta değil toplu olarak diske yazan, boyut ve süreye göre döndürülen dosya handler'ı"""
+
+    def __init__(self, path: Path, max_bytes: int, backup_count: int, rotate_seconds: float,
+                 loggers: Optional[List[str]] = None):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        super().__init__(path, maxBytes=max_bytes, backupCount=backup_count, encoding='utf-8')
+        self.rotate_seconds = rotate_seconds
+        self.rollover_at = time.time() + rotate_seconds if rotate_seconds else None
+        self.prefixes = tuple(loggers or ())
+        self.pending = False
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if self.prefixes and not any(
+            record.name == prefix or record.name.startswith(prefix + ".") for prefix in self.prefixes
+        ):
+            return False
+        return super().filter(record)
+
+    def shouldRollover(self, record: logging.LogRecord) -> bool:
+        if self.rollover_at is not None and time.time() >= self.rollover_at:
+            return True
+        return bool(super().shouldRollover(record))
+
+    def doRollover(self):
+        super().doRollover()
+        if self.rollover_at is not None:
+            self.rollover_at = time.time() + self.rotate_seconds
+
+    def emit(self, record: logging.LogRecord):
+        super().emit(record)
+        self.pending = True
+
+    def flush(self):
+        # StreamHandler her kayıttan sonra flush çağırır; gerçek yazma flush_batch'te
+        pass
+
+    def flush_batch(self):
+        if self.pending and self.stream:
+            self.acquire()
+            try:
+                self.stream.flush()
+            finally:
+                self.release()
+        self.pending = False
+
+class LogPipeline:
+    """Kuyruk tabanlı günlük hattı: çağıran thread'ler yalnızca kuyruğa ekler, tek yazıcı thread dosyalara toplu yazar"""
+
+    def __init__(self, logging_config: Optional[dict] = None):
+        if logging_config is None:
+            logging_config = get_config_manager().get_config("logging", {})
+
+        self.batch_size = logging_config.get("batch_size", DEFAULT_BATCH_SIZE)
+        self.flush_interval = logging_config.get("flush_interval", DEFAULT_FLUSH_INTERVAL)
+        self.queue: queue.Queue = queue.Queue(logging_config.get("queue_size", DEFAULT_QUEUE_SIZE))
+        self.queue_handler = DroppingQueueHandler(self.queue)
+
+        max_bytes = logging_config.get("max_bytes", DEFAULT_MAX_BYTES)
+        backup_count = logging_config.get("backup_count", DEFAULT_BACKUP_COUNT)
+        rotate_seconds = logging_config.get("rotate_hours", DEFAULT_ROTATE_HOURS) * 3600
+
+        formatter = logging.Formatter(LOG_FORMAT)
+        self.file_handlers: List[BatchedFileHandler] = []
+        for file_config in logging_config.get("files", DEFAULT_FILES):
+            handler = BatchedFileHandler(
+                Path(file_config["path"]), max_bytes, backup_count, rotate_seconds, file_config.get("loggers")
+            )
+            handler.setLevel(file_config.get("level", "DEBUG"))
+            handler.setFormatter(formatter)
+            self.file_handlers.append(handler)
+
+        self.console_handler = logging.StreamHandler()
+        self.console_handler.setLevel(logging_config.get("console_level", "INFO"))
+        self.console_handler.setFormatter(logging.Formatter(CONSOLE_FORMAT))
+
+        self.handlers: List[logging.Handler] = [*self.file_handlers, self.console_handler]
+        self.levels: Dict[str, str] = logging_config.get("levels", {"AICodeEditor": "DEBUG"})
+        self.root_level = logging_config.get("root_level", "WARNING")
+
+        self._thread: Optional[threading.Thread] = None
+        self._stop = object()
+
+    def start(self):
+        """Kök logger'a kuyruk handler'ını bağla, seviyeleri uygula ve yazıcıyı başlat"""
+        root = logging.getLogger()
+        root.setLevel(self.root_level)
+        root.addHandler(self.queue_handler)
+        self.apply_levels(self.levels)
+
+        self._thread = threading.Thread(target=self._writer_loop, name="LogWriter", daemon=True)
+        self._thread.start()
+
+    def apply_levels(self, levels: Dict[str, str]):
+        """Alt sistem başına günlük seviyelerini uygula (örn. {"AICodeEditor.VoiceListener": "INFO"})"""
+        for name, level in levels.items():
+            logging.getLogger(name).setLevel(level)
+        self.levels = {**self.levels, **levels}
+
+    def _dispatch(self, record: logging.LogRecord):
+        for handler in self.handlers:
+            if record.levelno >= handler.level:
+                handler.handle(record)
+
+    def _flush(self):
+        for handler in self.file_handlers:
+            handler.flush_batch()
+        self.console_handler.flush()
+
+    def _writer_loop(self):
+        last_flush = time.monotonic()
+        while True:
+            try:
+                record = self.queue.get(timeout=self.flush_interval)
+            except queue.Empty:
+                self._flush()
+                last_flush = time.monotonic()
+                continue
+
+            # Kuyrukta biriken kayıtları tek seferde işle
+            batch = [record]
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(self.queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            urgent = False
+            for item in batch:
+                if item is self._stop:
+                    self._flush()
+                    return
+                self._dispatch(item)
+                urgent = urgent or item.levelno >= logging.ERROR
+
+            # Hatalar çökme öncesinde kaybolmasın diye hemen diske yazılır
+            if urgent or time.monotonic() - last_flush >= self.flush_interval:
+                self._flush()
+                last_flush = time.monotonic()
+
+    def get_stats(self) -> Dict:
+        """Kuyruk doluluğu ve düşürülen kayıt sayısı"""
+        return {
+            "queued": self.queue.qsize(),
+            "dropped": self.queue_handler.dropped,
+            "levels": dict(self.levels)
+        }
+
+    def stop(self):
+        """Kuyruğu boşalt, dosyaları kapat"""
+        if self._thread is None:
+            return
+        logging.getLogger().removeHandler(self.queue_handler)
+        self.queue.put(self._stop, timeout=5)
+        self._thread.join(timeout=5)
+        self._thread = None
+        for handler in self.handlers:
+            handler.close()
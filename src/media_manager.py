@@ -3,14 +3,14 @@ from pycaw.pycaw import AudioUtilities, IAudioEndpointVolume
 from ctypes import cast, POINTER
 import comtypes
 import screen_brightness_control as sbc
-from config_manager import ConfigManager
+from config_manager import get_config_manager
 from language_manager import LanguageManager
 import logging
 from typing import Dict, Optional
 
 class MediaManager:
     def __init__(self):
-        self.config_manager = ConfigManager()
+        self.config_manager = get_config_manager()
         self.language_manager = LanguageManager()
         self.logger = logging.getLogger("AICodeEditor.Media")
         
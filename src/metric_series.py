@@ -0,0 +1,253 @@
+import logging
+import mmap
+import os
+import struct
+import threading
+import time
+from pathlib import Path
+from typing import Iterable, List, NamedTuple, Optional, Tuple
+
+DEFAULT_DIRECTORY = "data/metrics"
+# (ad, kova süresi sn, saklama gün); ham katman (0) her ölçümü olduğu gibi tutar
+DEFAULT_TIERS = (
+    ("raw", 0, 1),
+    ("minute", 60, 30),
+    ("hour", 3600, 365),
+)
+# Saklama süresini bu oranda aşan eski kayıt birikince dosya baştan kırpılır
+COMPACT_SLACK = 0.25
+
+class MetricPoint(NamedTuple):
+    """Tek zaman noktası: ham katmanda bir ölçüm, özet katmanlarda bir kova"""
+    timestamp: float
+    samples: float
+    cpu_percent: float
+    memory_percent: float
+    disk_percent: float
+    process_rss: float
+    response_count: float
+    response_mean: float
+    response_p90: float
+    response_max: float
+
+# Sabit genişlikli kayıt: tüm alanlar little-endian double (80 bayt)
+RECORD = struct.Struct("<" + "d" * len(MetricPoint._fields))
+TIMESTAMP = struct.Struct("<d")
+
+def merge_points(timestamp: float, points: List[MetricPoint]) -> MetricPoint:
+    """Noktaları tek kovada birleştir (kaynaklar örnek sayısıyla, yanıtlar yanıt sayısıyla ağırlıklı)"""
+    samples = sum(point.samples for point in points) or 1.0
+    responses = sum(point.response_count for point in points)
+
+    def weighted(field: str) -> float:
+        return sum(getattr(point, field) * point.samples for point in points) / samples
+
+    return MetricPoint(
+        timestamp=timestamp,
+        samples=samples,
+        cpu_percent=weighted("cpu_percent"),
+        memory_percent=weighted("memory_percent"),
+        disk_percent=weighted("disk_percent"),
+        process_rss=weighted("process_rss"),
+        response_count=responses,
+        response_mean=sum(point.response_mean * point.response_count for point in points) / responses if responses else 0.0,
+        # Alt kovaların yüzdelikleri birleştirilemez; kaba katmanda en kötü p90 tutulur
+        response_p90=max(point.response_p90 for point in points),
+        response_max=max(point.response_max for point in points)
+    )
+
+class SeriesFile:
+    """Sabit genişlikli kayıtlardan oluşan, sona eklenen ve mmap ile okunan zaman serisi dosyası
+
+    Kayıtlar zamana göre sıralı olduğundan aralık sorguları ikili aramayla bulunur.
+    Saklama süresinden eski kayıtlar, birikince dosya yeniden yazılarak atılır.
+    """
+
+    def __init__(self, path: Path, retention: float):
+        self.path = Path(path)
+        self.retention = retention
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.RLock()
+        self._repair()
+        self._file = open(self.path, "ab")
+        self._map: Optional[mmap.mmap] = None
+        self._count = self.path.stat().st_size // RECORD.size
+        self._first = self._timestamp_at(0) if self._count else None
+
+    def _repair(self):
+        """Yarım yazılmış son kaydı at"""
+        if not self.path.exists():
+            return
+        size = self.path.stat().st_size
+        if size % RECORD.size:
+            with open(self.path, "r+b") as f:
+                f.truncate(size - size % RECORD.size)
+
+    def _view(self) -> Optional[mmap.mmap]:
+        """Dosyanın güncel mmap görünümü (dosya büyüdüyse yeniden eşlenir)"""
+        size = self._count * RECORD.size
+        if not size:
+            return None
+        if self._map is None or len(self._map) != size:
+            self._close_map()
+            with open(self.path, "rb") as f:
+                self._map = mmap.mmap(f.fileno(), size, access=mmap.ACCESS_READ)
+        return self._map
+
+    def _close_map(self):
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+
+    def _timestamp_at(self, index: int) -> float:
+        return TIMESTAMP.unpack_from(self._view(), index * RECORD.size)[0]
+
+    def _bisect(self, timestamp: float) -> int:
+        """Zamanı `timestamp` veya sonrası olan ilk kaydın sırası"""
+        low, high = 0, self._count
+        while low < high:
+            middle = (low + high) // 2
+            if self._timestamp_at(middle) < timestamp:
+                low = middle + 1
+            else:
+                high = middle
+        return low
+
+    def __len__(self) -> int:
+        return self._count
+
+    def append(self, point: MetricPoint):
+        with self._lock:
+            self._file.write(RECORD.pack(*point))
+            self._file.flush()
+            self._count += 1
+            if self._first is None:
+                self._first = point.timestamp
+            if point.timestamp - self._first > self.retention * (1 + COMPACT_SLACK):
+                self._compact(point.timestamp - self.retention)
+
+    def _compact(self, cutoff: float):
+        """`cutoff` öncesini atarak dosyayı yeniden yaz"""
+        start = self._bisect(cutoff)
+        data = self._view()[start * RECORD.size:] if start < self._count else b""
+        temp_path = self.path.with_suffix(self.path.suffix + ".tmp")
+        temp_path.write_bytes(data)
+
+        # Windows'ta eşlenmiş/açık dosya değiştirilemez
+        self._close_map()
+        self._file.close()
+        os.replace(temp_path, self.path)
+        self._file = open(self.path, "ab")
+        self._count = len(data) // RECORD.size
+        self._first = self._timestamp_at(0) if self._count else None
+
+    def range(self, start: Optional[float] = None, end: Optional[float] = None) -> List[MetricPoint]:
+        """[start, end) aralığındaki kayıtlar, eskiden yeniye"""
+        with self._lock:
+            if not self._count:
+                return []
+            low = self._bisect(start) if start is not None else 0
+            high = self._bisect(end) if end is not None else self._count
+            if low >= high:
+                return []
+            data = self._view()[low * RECORD.size:high * RECORD.size]
+        return [MetricPoint._make(values) for values in RECORD.iter_unpack(data)]
+
+    def last(self) -> Optional[MetricPoint]:
+        with self._lock:
+            if not self._count:
+                return None
+            return MetricPoint._make(RECORD.unpack_from(self._view(), (self._count - 1) * RECORD.size))
+
+    def close(self):
+        with self._lock:
+            self._close_map()
+            self._file.close()
+
+class MetricSeriesStore:
+    """Ham ölçümleri ve onlardan türetilen dakika/saat özetlerini katmanlı dosyalarda tutan depo
+
+    Her katman bir öncekinin kayıtlarından beslenir; kova kapandığında özet kaydı
+    yazılır. Yeniden başlatmada kapanmamış kovalar ince katmandan yeniden kurulur.
+    """
+
+    def __init__(self, directory: str = DEFAULT_DIRECTORY, tiers: Iterable[Tuple[str, int, float]] = DEFAULT_TIERS):
+        self.logger = logging.getLogger("AICodeEditor.MetricSeries")
+        self.directory = Path(directory)
+        self.tiers = [
+            (name, size, SeriesFile(self.directory / f"{name}.bin", retention_days * 86400))
+            for name, size, retention_days in tiers
+        ]
+        self._pending: List[List[MetricPoint]] = [[] for _ in self.tiers]
+        self._lock = threading.Lock()
+        self._restore_pending()
+
+    @staticmethod
+    def _bucket(point: MetricPoint, size: int) -> float:
+        return point.timestamp // size * size
+
+    def _restore_pending(self):
+        """Özet katmanlara henüz yazılmamış ince katman kayıtlarını kovalarına dağıt"""
+        for level in range(1, len(self.tiers)):
+            _, size, series = self.tiers[level]
+            last = series.last()
+            source = self.tiers[level - 1][2]
+            points = source.range(last.timestamp + size if last else None)
+
+            # Tamamlanmış kovalar yazılır, sonuncusu açık kalır
+            pending: List[MetricPoint] = []
+            for point in points:
+                if pending and self._bucket(point, size) != self._bucket(pending[0], size):
+                    series.append(merge_points(self._bucket(pending[0], size), pending))
+                    pending = []
+                pending.append(point)
+            self._pending[level] = pending
+
+    def _push(self, level: int, point: MetricPoint):
+        _, size, series = self.tiers[level]
+        pending = self._pending[level]
+        if pending and self._bucket(point, size) != self._bucket(pending[0], size):
+            merged = merge_points(self._bucket(pending[0], size), pending)
+            self._pending[level] = [point]
+            series.append(merged)
+            if level + 1 < len(self.tiers):
+                self._push(level + 1, merged)
+        else:
+            pending.append(point)
+
+    def append(self, point: MetricPoint):
+        """Ham ölçümü yaz ve özet katmanlara aktar"""
+        with self._lock:
+            self.tiers[0][2].append(point)
+            if len(self.tiers) > 1:
+                self._push(1, point)
+
+    def select_tier(self, window: float) -> Tuple[str, SeriesFile]:
+        """Pencereyi kapsayan en ince katman"""
+        for name, _, series in self.tiers:
+            if window <= series.retention:
+                return name, series
+        name, _, series = self.tiers[-1]
+        return name, series
+
+    def query(self, window: float, tier: Optional[str] = None, now: Optional[float] = None) -> Tuple[str, List[MetricPoint]]:
+        """Son `window` saniyenin noktaları; katman verilmezse pencereye göre seçilir"""
+        now = time.time() if now is None else now
+        if tier is None:
+            name, series = self.select_tier(window)
+        else:
+            matches = [(name, series) for name, _, series in self.tiers if name == tier]
+            if not matches:
+                raise KeyError(f"Bilinmeyen katman: {tier}")
+            name, series = matches[0]
+        return name, series.range(now - window)
+
+    def get_stats(self) -> dict:
+        return {
+            name: {"records": len(series), "bytes": len(series) * RECORD.size}
+            for name, _, series in self.tiers
+        }
+
+    def close(self):
+        for _, _, series in self.tiers:
+            series.close()
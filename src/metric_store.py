@@ -0,0 +1,252 @@
+import math
+import threading
+import time
+from array import array
+from typing import Dict, List, Optional, Tuple, Union
+from error_analytics import parse_time_window
+
+DEFAULT_CAPACITY = 720
+# Intent başına tutulan son komut süresi sayısı
+DEFAULT_INTENT_HISTORY = 200
+
+# Histogram: değer aralığı (sn) ve ikinin her kuvveti için alt kova sayısı (~%3 bağıl hata)
+HISTOGRAM_MIN_VALUE = 1e-6
+HISTOGRAM_MAX_VALUE = 3600.0
+HISTOGRAM_SUB_BUCKETS = 32
+
+REPORTED_PERCENTILES = (50, 90, 99)
+
+def percentile(sorted_values: List[float], percent: float) -> Optional[float]:
+    """Sıralı listede en yakın sıra yöntemiyle yüzdelik değeri bul"""
+    if not sorted_values:
+        return None
+    rank = max(math.ceil(percent / 100 * len(sorted_values)), 1)
+    return sorted_values[min(rank, len(sorted_values)) - 1]
+
+def window_seconds(window: Union[str, float, int, None]) -> Optional[float]:
+    """"15m" gibi pencere ifadesini ya da sayıyı saniyeye çevir"""
+    if window is None:
+        return None
+    if isinstance(window, (int, float)):
+        return float(window)
+    return parse_time_window(window).total_seconds()
+
+class RingBuffer:
+    """Sabit kapasiteli, dizi tabanlı zaman damgalı değer tamponu (ekleme O(1))"""
+
+    def __init__(self, capacity: int = DEFAULT_CAPACITY):
+        self.capacity = max(capacity, 1)
+        self._values = array("d", bytes(8 * self.capacity))
+        self._times = array("d", bytes(8 * self.capacity))
+        self._next = 0
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def append(self, value: float, timestamp: Optional[float] = None):
+        with self._lock:
+            self._values[self._next] = value
+            self._times[self._next] = time.time() if timestamp is None else timestamp
+            self._next = (self._next + 1) % self.capacity
+            self._size = min(self._size + 1, self.capacity)
+
+    def __len__(self) -> int:
+        return self._size
+
+    @property
+    def latest(self) -> Optional[float]:
+        if not self._size:
+            return None
+        return self._values[(self._next - 1) % self.capacity]
+
+    def items(self, since: Optional[float] = None) -> List[Tuple[float, float]]:
+        """(zaman, değer) çiftleri, eskiden yeniye; `since` verilirse yalnızca sonrası"""
+        with self._lock:
+            result = []
+            index = self._next
+            for _ in range(self._size):
+                index = (index - 1) % self.capacity
+                timestamp = self._times[index]
+                if since is not None and timestamp < since:
+                    break
+                result.append((timestamp, self._values[index]))
+        result.reverse()
+        return result
+
+    def values(self, since: Optional[float] = None) -> List[float]:
+        return [value for _, value in self.items(since)]
+
+    def stats(self, window: Union[str, float, None] = None) -> Dict:
+        """Pencere içindeki örneklerin sayı, min/maks, ortalama, yüzdelik ve dakikalık hızı"""
+        now = time.time()
+        seconds = window_seconds(window)
+        items = self.items(now - seconds if seconds is not None else None)
+        values = sorted(value for _, value in items)
+        if not values:
+            return {"count": 0}
+
+        span = seconds if seconds is not None else max(now - items[0][0], 1e-9)
+        result = {
+            "count": len(values),
+            "min": values[0],
+            "max": values[-1],
+            "mean": sum(values) / len(values),
+            "rate_per_min": len(values) / span * 60
+        }
+        for percent in REPORTED_PERCENTILES:
+            result[f"p{percent}"] = percentile(values, percent)
+        return result
+
+class LatencyHistogram:
+    """HDR benzeri log-doğrusal histogram: sabit bellekle tüm örneklerin yüzdeliklerini yaklaşık verir"""
+
+    def __init__(self, min_value: float = HISTOGRAM_MIN_VALUE, max_value: float = HISTOGRAM_MAX_VALUE,
+                 sub_buckets: int = HISTOGRAM_SUB_BUCKETS):
+        self.min_value = min_value
+        self.max_value = max_value
+        self.sub_buckets = sub_buckets
+        self._min_exponent = math.frexp(min_value)[1]
+        exponents = math.frexp(max_value)[1] - self._min_exponent + 1
+        self.counts = array("Q", bytes(8 * exponents * sub_buckets))
+        self.count = 0
+        self.total = 0.0
+        self.min = None
+        self.max = None
+        self._lock = threading.Lock()
+
+    def _index(self, value: float) -> int:
+        value = min(max(value, self.min_value), self.max_value)
+        mantissa, exponent = math.frexp(value)
+        sub = int((mantissa - 0.5) * 2 * self.sub_buckets)
+        return (exponent - self._min_exponent) * self.sub_buckets + min(sub, self.sub_buckets - 1)
+
+    def _value_at(self, index: int) -> float:
+        """Kovanın üst sınırı (raporlanan değer gerçek değerden küçük olmaz)"""
+        exponent, sub = divmod(index, self.sub_buckets)
+        return math.ldexp(0.5 + (sub + 1) / (2 * self.sub_buckets), exponent + self._min_exponent)
+
+    def record(self, value: float):
+        with self._lock:
+            self.counts[self._index(value)] += 1
+            self.count += 1
+            self.total += value
+            self.min = value if self.min is None else min(self.min, value)
+            self.max = value if self.max is None else max(self.max, value)
+
+    def percentile(self, percent: float) -> Optional[float]:
+        with self._lock:
+            if not self.count:
+                return None
+            rank = max(math.ceil(percent / 100 * self.count), 1)
+            seen = 0
+            for index, count in enumerate(self.counts):
+                seen += count
+                if seen >= rank:
+                    return min(self._value_at(index), self.max)
+            return self.max
+
+    def summary(self) -> Dict:
+        if not self.count:
+            return {"count": 0}
+        result = {
+            "count": self.count,
+            "min": self.min,
+            "max": self.max,
+            "mean": self.total / self.count
+        }
+        for percent in REPORTED_PERCENTILES:
+            result[f"p{percent}"] = self.percentile(percent)
+        return result
+
+    def reset(self):
+        with self._lock:
+            for index in range(len(self.counts)):
+                self.counts[index] = 0
+            self.count = 0
+            self.total = 0.0
+            self.min = self.max = None
+
+class LatencyStore:
+    """Intent başına komut gecikmeleri: son süreler halka tamponda, tüm süreler ve aralık kırılımı histogramda"""
+
+    def __init__(self, history: int = DEFAULT_INTENT_HISTORY):
+        self.history = history
+        self._timings: Dict[str, RingBuffer] = {}
+        self._histograms: Dict[str, LatencyHistogram] = {}
+        # intent -> aralık adı -> histogram
+        self._spans: Dict[str, Dict[str, LatencyHistogram]] = {}
+        self._lock = threading.Lock()
+
+    def _series(self, intent: str) -> Tuple[RingBuffer, LatencyHistogram]:
+        with self._lock:
+            timings = self._timings.get(intent)
+            if timings is None:
+                timings = self._timings[intent] = RingBuffer(self.history)
+                self._histograms[intent] = LatencyHistogram()
+                self._spans[intent] = {}
+            return timings, self._histograms[intent]
+
+    def record(self, intent: str, duration: float):
+        """Komut süresini kaydet"""
+        timings, histogram = self._series(intent)
+        timings.append(duration)
+        histogram.record(duration)
+
+    def record_trace(self, root) -> str:
+        """Tamamlanan kök izi ve alt aralıklarını intent altında kaydet; intent'i döndür"""
+        intent = root.intent or root.name
+        self.record(intent, root.duration)
+        stack = list(root.children)
+        while stack:
+            child = stack.pop()
+            if child.duration is None:
+                # Kök kapandığında hâlâ süren aralık (ör. arka plan seslendirmesi) ölçülmez
+                continue
+            with self._lock:
+                histogram = self._spans[intent].get(child.name)
+                if histogram is None:
+                    histogram = self._spans[intent][child.name] = LatencyHistogram()
+            histogram.record(child.duration)
+            stack.extend(child.children)
+        return intent
+
+    def intents(self) -> List[str]:
+        with self._lock:
+            return list(self._timings)
+
+    def histograms(self) -> List[Tuple[str, LatencyHistogram]]:
+        with self._lock:
+            return list(self._histograms.items())
+
+    def stats(self, intent: str, window: Union[str, float, None] = None) -> Dict:
+        """Pencere verilmezse tüm örnekler histogramdan (yaklaşık), verilirse son örnekler tampondan (kesin)"""
+        with self._lock:
+            timings = self._timings.get(intent)
+            histogram = self._histograms.get(intent)
+        if timings is None:
+            return {"count": 0}
+        return histogram.summary() if window is None else timings.stats(window)
+
+    def span_stats(self, intent: str) -> Dict[str, Dict]:
+        """Intent'in aralık adı başına gecikme özeti"""
+        with self._lock:
+            spans = list(self._spans.get(intent, {}).items())
+        return {name: histogram.summary() for name, histogram in spans}
+
+    def format_report(self) -> str:
+        """Intent ve aralık gecikmelerini okunabilir metne çevir"""
+        stats = {intent: self.stats(intent) for intent in self.intents()}
+        if not stats:
+            return "⏱️ Henüz ölçülmüş komut yok."
+
+        def ms(value: float) -> float:
+            return round(value * 1000, 3)
+
+        lines = ["⏱️ Komut Gecikmeleri (ms):"]
+        for intent, summary in sorted(stats.items(), key=lambda item: -item[1]["p90"]):
+            lines.append(
+                f"- {intent} ({summary['count']}): p50 {ms(summary['p50'])} | "
+                f"p90 {ms(summary['p90'])} | p99 {ms(summary['p99'])}"
+            )
+            for span, span_summary in self.span_stats(intent).items():
+                lines.append(f"    {span}: p50 {ms(span_summary['p50'])} | p90 {ms(span_summary['p90'])}")
+        return "\n".join(lines)
@@ -0,0 +1,127 @@
+import logging
+import threading
+import time
+from typing import Callable, List, NamedTuple, Optional
+import psutil
+from config_manager import get_config_manager
+
+DEFAULT_INTERVAL = 5
+DEFAULT_DISK_PATH = "/"
+
+# Süreç genelinde tek toplayıcı
+_collector = None
+_collector_lock = threading.Lock()
+
+def get_metrics_collector() -> "MetricsCollector":
+    """Paylaşılan sistem metrikleri toplayıcısını (ilk çağrıda başlatarak) getir"""
+    global _collector
+    if _collector is None:
+        with _collector_lock:
+            if _collector is None:
+                _collector = MetricsCollector()
+                _collector.start()
+    return _collector
+
+class MetricsSnapshot(NamedTuple):
+    """Tek ölçümde alınmış, değiştirilemez sistem metrikleri"""
+    timestamp: float
+    cpu_percent: float
+    memory_percent: float
+    memory_available: int
+    disk_percent: float
+    battery_percent: Optional[float]
+    power_plugged: Optional[bool]
+    process_rss: int
+
+class MetricsCollector:
+    """Sistem metriklerini her periyotta bir kez ölçüp son anlık görüntüyü yayınlayan toplayıcı
+
+    Okuyucular `latest` ile sistem çağrısı yapmadan son değerleri alır;
+    aboneler her yeni ölçümde toplayıcı thread'inden çağrılır.
+    """
+
+    def __init__(self, monitoring_config: Optional[dict] = None):
+        self.logger = logging.getLogger("AICodeEditor.Metrics")
+        if monitoring_config is None:
+            monitoring_config = get_config_manager().get_config("performance", {}).get("monitoring", {})
+
+        self.enabled = monitoring_config.get("enabled", True)
+        self.interval = max(monitoring_config.get("interval", DEFAULT_INTERVAL), 0.1)
+        self.disk_path = monitoring_config.get("disk_path", DEFAULT_DISK_PATH)
+
+        self._process = psutil.Process()
+        self._snapshot: Optional[MetricsSnapshot] = None
+        self._subscribers: List[Callable[[MetricsSnapshot], None]] = []
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+        # cpu_percent(None) bir önceki çağrıdan bu yana ölçer; ilk çağrı referans noktasıdır
+        psutil.cpu_percent(interval=None)
+
+    def sample(self) -> MetricsSnapshot:
+        """Tek seferde tüm metrikleri ölç ve son anlık görüntü olarak yayınla"""
+        memory = psutil.virtual_memory()
+        battery = psutil.sensors_battery() if hasattr(psutil, "sensors_battery") else None
+        snapshot = MetricsSnapshot(
+            timestamp=time.time(),
+            cpu_percent=psutil.cpu_percent(interval=None),
+            memory_percent=memory.percent,
+            memory_available=memory.available,
+            disk_percent=psutil.disk_usage(self.disk_path).percent,
+            battery_percent=battery.percent if battery else None,
+            power_plugged=battery.power_plugged if battery else None,
+            process_rss=self._process.memory_info().rss
+        )
+        # Tek atama: okuyucular her zaman tutarlı bir görüntü görür
+        self._snapshot = snapshot
+        return snapshot
+
+    @property
+    def latest(self) -> MetricsSnapshot:
+        """Son anlık görüntü (henüz ölçüm yoksa bir kez ölçülür)"""
+        snapshot = self._snapshot
+        if snapshot is None:
+            snapshot = self.sample()
+        return snapshot
+
+    def subscribe(self, callback: Callable[[MetricsSnapshot], None]):
+        """Her yeni ölçümde çağrılacak fonksiyonu kaydet"""
+        with self._lock:
+            if callback not in self._subscribers:
+                self._subscribers.append(callback)
+
+    def unsubscribe(self, callback: Callable[[MetricsSnapshot], None]):
+        with self._lock:
+            if callback in self._subscribers:
+                self._subscribers.remove(callback)
+
+    def start(self):
+        """Periyodik ölçüm thread'ini başlat (izleme kapalıysa yalnızca istek üzerine ölçülür)"""
+        if not self.enabled or self._thread is not None:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="MetricsCollector", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=1)
+            self._thread = None
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            try:
+                snapshot = self.sample()
+            except Exception as e:
+                self.logger.error(f"Metrik ölçüm hatası: {str(e)}")
+                continue
+
+            with self._lock:
+                subscribers = list(self._subscribers)
+            for callback in subscribers:
+                try:
+                    callback(snapshot)
+                except Exception as e:
+                    self.logger.error(f"Metrik abonesi hatası: {str(e)}")
@@ -0,0 +1,362 @@
+import asyncio
+import hashlib
+import json
+import logging
+import random
+import re
+import threading
+from contextlib import aclosing
+from typing import AsyncIterator, Callable, Dict, List, Optional
+import httpx
+from config_manager import get_config_manager
+
+DEFAULT_HOST = "http://localhost:11434"
+DEFAULT_TIMEOUT = 120
+DEFAULT_CONNECT_TIMEOUT = 5
+DEFAULT_MAX_RETRIES = 2
+DEFAULT_BACKOFF = 0.5
+DEFAULT_MAX_BACKOFF = 8
+DEFAULT_MAX_CONNECTIONS = 4
+
+# Yeniden denenebilecek HTTP durum kodları
+RETRY_STATUS = {408, 429, 500, 502, 503, 504}
+
+# Cümle sonu: noktalama (+ kapanış tırnak/parantez) ardından boşluk ya da satır sonu
+SENTENCE_BOUNDARY = re.compile(r'[.!?…]+["\')\]]*\s+|\n+')
+
+class SentenceBuffer:
+    """Akış parçalarını biriktirip tamamlanan cümleleri veren tampon"""
+
+    def __init__(self, min_length: int = 2):
+        self.min_length = min_length
+        self._buffer = ""
+
+    def feed(self, chunk: str) -> List[str]:
+        """Parçayı ekle ve tamamlanan cümleleri döndür"""
+        self._buffer += chunk
+        sentences = []
+        last_end = 0
+        for match in SENTENCE_BOUNDARY.finditer(self._buffer):
+            sentence = self._buffer[last_end:match.end()].strip()
+            last_end = match.end()
+            if len(sentence) >= self.min_length:
+                sentences.append(sentence)
+        self._buffer = self._buffer[last_end:]
+        return sentences
+
+    def flush(self) -> Optional[str]:
+        """Kalan yarım cümleyi döndür ve tamponu boşalt"""
+        rest = self._buffer.strip()
+        self._buffer = ""
+        return rest if len(rest) >= self.min_length else None
+
+class RetryableStatus(Exception):
+    """Yeniden denenebilir HTTP yanıtı"""
+    pass
+
+class _StreamBroadcast:
+    """Aynı akışı bekleyen tüm abonelere parçaları dağıtan paylaşımlı üretim"""
+
+    def __init__(self):
+        self.chunks: List[str] = []
+        self.done = False
+        self.error: Optional[BaseException] = None
+        self.condition = asyncio.Condition()
+
+    async def push(self, chunk: str):
+        async with self.condition:
+            self.chunks.append(chunk)
+            self.condition.notify_all()
+
+    async def finish(self, error: Optional[BaseException] = None):
+        async with self.condition:
+            self.done = True
+            self.error = error
+            self.condition.notify_all()
+
+class ModelClient:
+    """Ollama HTTP API istemcisi: kalıcı bağlantı havuzu, zaman aşımı, yeniden deneme ve istek birleştirme
+
+    Havuz kendi olay döngüsü thread'inde yaşar; böylece her çağrıda asyncio.run
+    kullanan QThread'ler de aynı keep-alive bağlantıları paylaşır.
+    """
+
+    def __init__(self, host: Optional[str] = None, timeout: Optional[float] = None,
+                 client_config: Optional[dict] = None):
+        self.logger = logging.getLogger("AICodeEditor.ModelClient")
+        ai_config = get_config_manager().get_config("ai", {})
+        if client_config is None:
+            client_config = ai_config.get("client", {})
+
+        self.host = (host or ai_config.get("host", DEFAULT_HOST)).rstrip("/")
+        self.timeout = timeout or ai_config.get("timeout", DEFAULT_TIMEOUT)
+        self.connect_timeout = client_config.get("connect_timeout", DEFAULT_CONNECT_TIMEOUT)
+        self.max_retries = client_config.get("max_retries", DEFAULT_MAX_RETRIES)
+        self.backoff = client_config.get("backoff", DEFAULT_BACKOFF)
+        self.max_backoff = client_config.get("max_backoff", DEFAULT_MAX_BACKOFF)
+        self.max_connections = client_config.get("max_connections", DEFAULT_MAX_CONNECTIONS)
+        self.keepalive_expiry = client_config.get("keepalive_expiry", 300)
+
+        self._lock = threading.Lock()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._client: Optional[httpx.AsyncClient] = None
+
+        # Aşağıdakiler yalnızca istemci döngüsünden erişilir
+        self._inflight: Dict[str, asyncio.Future] = {}
+        self._streams: Dict[str, _StreamBroadcast] = {}
+
+        self.stats = {"requests": 0, "coalesced": 0, "retries": 0, "failures": 0}
+
+    def _make_timeout(self, timeout: Optional[float] = None) -> httpx.Timeout:
+        return httpx.Timeout(timeout or self.timeout, connect=self.connect_timeout)
+
+    def _ensure_loop(self) -> asyncio.AbstractEventLoop:
+        """İstemci olay döngüsü thread'ini (bir kez) başlat"""
+        if self._loop is not None:
+            return self._loop
+
+        with self._lock:
+            if self._loop is None:
+                loop = asyncio.new_event_loop()
+                ready = threading.Event()
+
+                def run_loop():
+                    asyncio.set_event_loop(loop)
+                    loop.call_soon(ready.set)
+                    loop.run_forever()
+
+                self._thread = threading.Thread(target=run_loop, name="ModelClientLoop", daemon=True)
+                self._thread.start()
+                ready.wait()
+                self._loop = loop
+        return self._loop
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """Kalıcı bağlantı havuzunu getir (istemci döngüsünde çağrılır)"""
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                base_url=self.host,
+                timeout=self._make_timeout(),
+                limits=httpx.Limits(
+                    max_connections=self.max_connections,
+                    max_keepalive_connections=self.max_connections,
+                    keepalive_expiry=self.keepalive_expiry
+                )
+            )
+        return self._client
+
+    async def _run_in_loop(self, coro):
+        """Coroutine'i istemci döngüsünde çalıştır ve sonucunu çağıranın döngüsünde bekle"""
+        future = asyncio.run_coroutine_threadsafe(coro, self._ensure_loop())
+        try:
+            return await asyncio.wrap_future(future)
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+
+    def _build_payload(self, model: str, messages: List[Dict], stream: bool,
+                       temperature: Optional[float] = None, max_tokens: Optional[int] = None,
+                       context_window: Optional[int] = None) -> Dict:
+        """Ollama /api/chat istek gövdesini oluştur"""
+        options = {}
+        if temperature is not None:
+            options["temperature"] = temperature
+        if max_tokens is not None:
+            options["num_predict"] = max_tokens
+        if context_window is not None:
+            # Bağlam bütçesi bu pencereye göre hesaplanır; gönderilmezse Ollama kendi varsayılanıyla keser
+            options["num_ctx"] = context_window
+
+        return {
+            "model": model,
+            "messages": messages,
+            "stream": stream,
+            "options": options
+        }
+
+    def _request_key(self, payload: Dict) -> str:
+        """Aynı isteklerin birleştirilmesi için anahtar"""
+        material = json.dumps(payload, sort_keys=True, ensure_ascii=False)
+        return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+    async def _backoff(self, attempt: int, error: Exception):
+        """Üstel bekleme (rastgele sapmalı) uygula"""
+        delay = min(self.backoff * (2 ** attempt), self.max_backoff) * (0.5 + random.random() / 2)
+        self.stats["retries"] += 1
+        self.logger.warning(f"Model isteği başarısız ({str(error) or type(error).__name__}), {delay:.2f} sn sonra yeniden denenecek")
+        await asyncio.sleep(delay)
+
+    def _is_retryable(self, error: Exception) -> bool:
+        """Okuma zaman aşımı yeniden denenmez: model hâlâ üretiyor olabilir, tekrar istek yükü ikiye katlar"""
+        return not isinstance(error, httpx.ReadTimeout)
+
+    async def _post_with_retry(self, payload: Dict, timeout: Optional[float]) -> str:
+        """Tam yanıt isteğini yeniden deneme ile gönder"""
+        client = self._get_client()
+        for attempt in range(self.max_retries + 1):
+            try:
+                response = await client.post("/api/chat", json=payload, timeout=self._make_timeout(timeout))
+                if response.status_code in RETRY_STATUS:
+                    raise RetryableStatus(f"HTTP {response.status_code}")
+                response.raise_for_status()
+                data = response.json()
+                if "error" in data:
+                    raise RuntimeError(data["error"])
+                return data.get("message", {}).get("content", "")
+
+            except (httpx.TransportError, RetryableStatus) as e:
+                if not self._is_retryable(e) or attempt >= self.max_retries:
+                    self.stats["failures"] += 1
+                    raise
+                await self._backoff(attempt, e)
+
+    async def _chat_in_loop(self, payload: Dict, timeout: Optional[float]) -> str:
+        """Aynı anda gelen özdeş istekleri tek üretimde birleştir"""
+        key = self._request_key(payload)
+        task = self._inflight.get(key)
+        if task is None:
+            self.stats["requests"] += 1
+            task = asyncio.ensure_future(self._post_with_retry(payload, timeout))
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        else:
+            self.stats["coalesced"] += 1
+        # Bir bekleyenin iptali ortak üretimi iptal etmez
+        return await asyncio.shield(task)
+
+    async def chat(self, model: str, messages: List[Dict], temperature: Optional[float] = None,
+                   max_tokens: Optional[int] = None, timeout: Optional[float] = None,
+                   context_window: Optional[int] = None) -> str:
+        """Tamamlanmış yanıtı tek seferde getir"""
+        payload = self._build_payload(model, messages, False, temperature, max_tokens, context_window)
+        return await self._run_in_loop(self._chat_in_loop(payload, timeout))
+
+    async def _produce_stream(self, key: str, payload: Dict, broadcast: _StreamBroadcast, timeout: Optional[float]):
+        """Akışı üret ve abonelere dağıt; yanıt gövdesi gelmeye başlamadan önceki hatalarda yeniden dene"""
+        client = self._get_client()
+        streamed = False
+        try:
+            for attempt in range(self.max_retries + 1):
+                try:
+                    async with client.stream("POST", "/api/chat", json=payload,
+                                             timeout=self._make_timeout(timeout)) as response:
+                        if response.status_code >= 400:
+                            # Gövde okunursa bağlantı havuza geri döner
+                            await response.aread()
+                        if response.status_code in RETRY_STATUS:
+                            raise RetryableStatus(f"HTTP {response.status_code}")
+                        response.raise_for_status()
+
+                        # Ollama her satırda bir JSON nesnesi gönderir
+                        async with aclosing(response.aiter_lines()) as lines:
+                            async for line in lines:
+                                streamed = True
+                                if not line.strip():
+                                    continue
+
+                                data = json.loads(line)
+                                if "error" in data:
+                                    raise RuntimeError(data["error"])
+
+                                chunk = data.get("message", {}).get("content", "")
+                                if chunk:
+                                    await broadcast.push(chunk)
+                                # "done" satırından sonra gövde biter; sonuna kadar okunan
+                                # bağlantı kapatılmak yerine havuza geri döner
+                    break
+
+                except (httpx.TransportError, RetryableStatus) as e:
+                    # Gövde gelmeye başladıysa yeniden denemek tekrar eden metin üretir
+                    if streamed or not self._is_retryable(e) or attempt >= self.max_retries:
+                        self.stats["failures"] += 1
+                        raise
+                    await self._backoff(attempt, e)
+
+            await broadcast.finish()
+        except Exception as e:
+            await broadcast.finish(e)
+        except asyncio.CancelledError as e:
+            # Bekleyen aboneler de sonlanır; iptal yukarı iletilir
+            await broadcast.finish(e)
+            raise
+        finally:
+            self._streams.pop(key, None)
+
+    async def _subscribe_stream(self, payload: Dict, deliver: Callable, timeout: Optional[float]):
+        """Akışa abone ol (gerekirse üretimi başlat) ve parçaları çağırana ilet"""
+        key = self._request_key(payload)
+        broadcast = self._streams.get(key)
+        if broadcast is None:
+            self.stats["requests"] += 1
+            broadcast = self._streams[key] = _StreamBroadcast()
+            asyncio.ensure_future(self._produce_stream(key, payload, broadcast, timeout))
+        else:
+            self.stats["coalesced"] += 1
+
+        index = 0
+        while True:
+            async with broadcast.condition:
+                await broadcast.condition.wait_for(lambda: len(broadcast.chunks) > index or broadcast.done)
+                pending = broadcast.chunks[index:]
+                done, error = broadcast.done, broadcast.error
+
+            for chunk in pending:
+                deliver(("chunk", chunk))
+            index += len(pending)
+
+            if done and index >= len(broadcast.chunks):
+                deliver(("error", error) if error else ("done", None))
+                return
+
+    async def stream_chat(self, model: str, messages: List[Dict], temperature: Optional[float] = None,
+                          max_tokens: Optional[int] = None, timeout: Optional[float] = None,
+                          context_window: Optional[int] = None) -> AsyncIterator[str]:
+        """Yanıtı üretildikçe parça parça getir"""
+        payload = self._build_payload(model, messages, True, temperature, max_tokens, context_window)
+        caller_loop = asyncio.get_running_loop()
+        queue: asyncio.Queue = asyncio.Queue()
+
+        def deliver(item):
+            try:
+                caller_loop.call_soon_threadsafe(queue.put_nowait, item)
+            except RuntimeError:
+                # Çağıranın döngüsü kapandı
+                pass
+
+        subscription = asyncio.run_coroutine_threadsafe(
+            self._subscribe_stream(payload, deliver, timeout), self._ensure_loop()
+        )
+        try:
+            while True:
+                kind, value = await queue.get()
+                if kind == "chunk":
+                    yield value
+                elif kind == "error":
+                    raise value
+                else:
+                    break
+        finally:
+            subscription.cancel()
+
+    def get_stats(self) -> Dict:
+        """İstek, birleştirme ve yeniden deneme sayılarını getir"""
+        return dict(self.stats)
+
+    def close(self):
+        """Bağlantı havuzunu kapat ve döngüyü durdur"""
+        if self._loop is None:
+            return
+
+        async def shutdown():
+            if self._client is not None:
+                await self._client.aclose()
+                self._client = None
+            await asyncio.get_running_loop().shutdown_asyncgens()
+
+        try:
+            asyncio.run_coroutine_threadsafe(shutdown(), self._loop).result(timeout=5)
+        except Exception as e:
+            self.logger.error(f"Model istemcisi kapatma hatası: {str(e)}")
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._loop = None
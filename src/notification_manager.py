@@ -3,14 +3,15 @@ import pyttsx3
 import logging
 from typing import Optional
 from pathlib import Path
-from config_manager import ConfigManager
+from config_manager import get_config_manager
+from cache_registry import PRIORITY_NORMAL, estimate_size, get_cache_registry
 from language_manager import LanguageManager
 from datetime import datetime
 import json
 
 class NotificationManager:
     def __init__(self):
-        self.config_manager = ConfigManager()
+        self.config_manager = get_config_manager()
         self.language_manager = LanguageManager()
         self.logger = logging.getLogger("AICodeEditor.Notification")
         
@@ -35,6 +36,7 @@ class NotificationManager:
         
         # Bildirim geçmişi
         self.history = []
+        get_cache_registry().register("notification_history", self.history_size, self.trim_history, PRIORITY_NORMAL - 10)
         
     def _check_icons(self):
         """İkon dosyalarının varlığını kontrol et ve yoksa varsayılan ikonları oluştur"""
@@ -117,6 +119,14 @@ class NotificationManager:
         except Exception as e:
             self.logger.error(f"Sesli bildirim hatası: {str(e)}")
             
+    def history_size(self) -> int:
+        """Bildirim geçmişinin yaklaşık bellek boyutu (bayt)"""
+        return estimate_size(self.history)
+        
+    def trim_history(self, keep: int = 10):
+        """Bellek baskısında yalnızca son `keep` bildirimi tut"""
+        del self.history[:-keep or None]
+            
     def get_history(self, limit: int = None) -> list:
         """Bildirim geçmişini getir"""
         if limit is None:
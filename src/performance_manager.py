@@ -1,31 +1,60 @@
 import psutil
-import os
 import gc
 import logging
 from typing import Dict, List, Optional
 from pathlib import Path
 import json
-from datetime import datetime, timedelta
-import threading
 import time
+from tracer import get_tracer
+from metrics_collector import MetricsSnapshot, get_metrics_collector
+from config_manager import get_config_manager
+from metric_store import DEFAULT_INTENT_HISTORY, LatencyHistogram, LatencyStore, RingBuffer, window_seconds
+from metric_series import DEFAULT_DIRECTORY, DEFAULT_TIERS, MetricPoint, MetricSeriesStore
+from prometheus_export import MetricFamily, summary_samples, write_textfile
+from sampling_profiler import get_profiler
+from slow_command_recorder import get_slow_command_recorder
+from janitor import get_janitor
+from cache_registry import PRIORITY_NORMAL, get_cache_registry
+
+# Kaynak metrikleri için varsayılan geçmiş (5 sn aralıkla ~1 saat)
+DEFAULT_HISTORY = 720
+DEFAULT_RESPONSE_HISTORY = 1000
+DEFAULT_EXPORT_PATH = "data/metrics.prom"
+DEFAULT_EXPORT_INTERVAL = 15
+# Önbellek boşaltmaları arasında en az bu kadar saniye beklenir
+DEFAULT_EVICTION_COOLDOWN = 300
 
 class PerformanceManager:
     def __init__(self):
         self.logger = logging.getLogger("AICodeEditor.Performance")
         self.temp_dir = Path("data/temp")
         self.temp_dir.mkdir(parents=True, exist_ok=True)
+        self.janitor = get_janitor()
+        self.cache_registry = get_cache_registry()
+        self.last_eviction: Optional[Dict] = None
+        
+        monitoring_config = get_config_manager().get_config("performance", {}).get("monitoring", {})
+        history = monitoring_config.get("history", DEFAULT_HISTORY)
+        self.intent_history = monitoring_config.get("intent_history", DEFAULT_INTENT_HISTORY)
+        self.eviction_cooldown = monitoring_config.get("eviction_cooldown", DEFAULT_EVICTION_COOLDOWN)
+        self._last_eviction_at: Optional[float] = None
         
-        # Performans metrikleri
+        # Performans metrikleri (sabit kapasiteli halka tamponlar)
         self.metrics = {
-            "memory_usage": [],
-            "cpu_usage": [],
-            "disk_usage": [],
-            "response_times": []
+            "memory_usage": RingBuffer(history),
+            "cpu_usage": RingBuffer(history),
+            "disk_usage": RingBuffer(history),
+            "response_times": RingBuffer(monitoring_config.get("response_history", DEFAULT_RESPONSE_HISTORY))
         }
+        # Başlangıçtan beri tüm yanıt süreleri (sabit bellekli histogram)
+        self.response_histogram = LatencyHistogram()
         
-        # Komut zamanlaması için
-        self.command_timings = {}
-        self.start_times = {}
+        # Komut gecikmelerinin tek deposu (intent -> son süreler / histogram / aralık kırılımı)
+        self.latency = LatencyStore(self.intent_history)
+        self.tracer = get_tracer()
+        self.tracer.add_listener(self._on_trace_finished)
+        self.profiler = get_profiler()
+        self.slow_commands = get_slow_command_recorder()
         
         # Kaynak limitleri
         self.resource_limits = {
@@ -35,63 +64,115 @@ class PerformanceManager:
             "memory_cleanup_threshold": 70  # Bellek temizleme eşiği %
         }
         
-        # Performans izleme thread'ini başlat
-        self.monitoring = True
-        self.monitor_thread = threading.Thread(target=self._monitor_resources, daemon=True)
-        self.monitor_thread.start()
-        
-    def _monitor_resources(self):
-        """Sistem kaynaklarını sürekli izle"""
-        while self.monitoring:
-            try:
-                # Metrikleri topla
-                memory = psutil.virtual_memory()
-                cpu = psutil.cpu_percent(interval=1)
-                disk = psutil.disk_usage('/')
-                
-                # Metrikleri kaydet
-                self.metrics["memory_usage"].append(memory.percent)
-                self.metrics["cpu_usage"].append(cpu)
-                self.metrics["disk_usage"].append(disk.percent)
-                
-                # Son 10 ölçümü tut
-                for metric in self.metrics.values():
-                    if len(metric) > 10:
-                        metric.pop(0)
-                
-                # Kaynak kontrolü
-                self._check_resource_usage()
-                
-                time.sleep(5)  # 5 saniye bekle
-                
-            except Exception as e:
-                self.logger.error(f"Kaynak izleme hatası: {str(e)}")
-                time.sleep(10)  # Hata durumunda 10 saniye bekle
+        # Paylaşılan toplayıcının ölçümlerine abone ol
+        self.metrics_collector = get_metrics_collector()
+        
+        # Kalıcı zaman serisi deposu ve Prometheus metin dosyası
+        self.series_store: Optional[MetricSeriesStore] = None
+        self._init_series_store(monitoring_config.get("series", {}))
+        self._last_sample_time = time.time()
+        self._last_export = 0.0
+        
+        self.metrics_collector.subscribe(self._on_metrics)
+        
+    def _init_series_store(self, series_config: Dict):
+        """Zaman serisi deposunu aç ve yeniden başlatma öncesi ölçümlerle tamponları doldur"""
+        self.export_path = Path(series_config.get("export_path", DEFAULT_EXPORT_PATH))
+        self.export_interval = series_config.get("export_interval", DEFAULT_EXPORT_INTERVAL)
+        if not series_config.get("enabled", True):
+            return
+        
+        try:
+            retention = series_config.get("retention_days", {})
+            tiers = [(name, size, retention.get(name, days)) for name, size, days in DEFAULT_TIERS]
+            self.series_store = MetricSeriesStore(series_config.get("directory", DEFAULT_DIRECTORY), tiers)
+            
+            since = time.time() - self.metrics["cpu_usage"].capacity * self.metrics_collector.interval
+            for point in self.series_store.tiers[0][2].range(since):
+                self.metrics["memory_usage"].append(point.memory_percent, point.timestamp)
+                self.metrics["cpu_usage"].append(point.cpu_percent, point.timestamp)
+                self.metrics["disk_usage"].append(point.disk_percent, point.timestamp)
+        except Exception as e:
+            self.series_store = None
+            self.logger.error(f"Metrik deposu açma hatası: {str(e)}")
+        
+    def _on_metrics(self, snapshot: MetricsSnapshot):
+        """Toplayıcıdan gelen her ölçümü kaydet ve kaynakları kontrol et"""
+        try:
+            # Metrikleri kaydet
+            self.metrics["memory_usage"].append(snapshot.memory_percent, snapshot.timestamp)
+            self.metrics["cpu_usage"].append(snapshot.cpu_percent, snapshot.timestamp)
+            self.metrics["disk_usage"].append(snapshot.disk_percent, snapshot.timestamp)
+            self._persist_snapshot(snapshot)
+            
+            # Kaynak kontrolü
+            self._check_resource_usage(snapshot)
+            
+        except Exception as e:
+            self.logger.error(f"Kaynak izleme hatası: {str(e)}")
+    
+    def _persist_snapshot(self, snapshot: MetricsSnapshot):
+        """Ölçümü ve son aralıktaki yanıt sürelerini diske yaz, gerekirse dışa aktarım dosyasını yenile"""
+        responses = self.metrics["response_times"].values(since=self._last_sample_time)
+        self._last_sample_time = snapshot.timestamp
+        
+        if self.series_store is not None:
+            responses.sort()
+            self.series_store.append(MetricPoint(
+                timestamp=snapshot.timestamp,
+                samples=1,
+                cpu_percent=snapshot.cpu_percent,
+                memory_percent=snapshot.memory_percent,
+                disk_percent=snapshot.disk_percent,
+                process_rss=snapshot.process_rss,
+                response_count=len(responses),
+                response_mean=sum(responses) / len(responses) if responses else 0.0,
+                response_p90=responses[int(0.9 * (len(responses) - 1))] if responses else 0.0,
+                response_max=responses[-1] if responses else 0.0
+            ))
+        
+        if self.export_interval and snapshot.timestamp - self._last_export >= self.export_interval:
+            self._last_export = snapshot.timestamp
+            self.export_metrics()
     
-    def _check_resource_usage(self):
+    def _check_resource_usage(self, snapshot: MetricsSnapshot):
         """Kaynak kullanımını kontrol et ve gerekirse önlem al"""
         try:
-            # Bellek kullanımı yüksekse
-            memory = psutil.virtual_memory()
-            if memory.percent > self.resource_limits["memory_cleanup_threshold"]:
-                self.optimize_memory()
+            # Bellek kullanımı yüksekse (bekleme süresi dolmadan önbellekler yeniden boşaltılmaz)
+            if snapshot.memory_percent > self.resource_limits["memory_cleanup_threshold"] and (
+                self._last_eviction_at is None
+                or snapshot.timestamp - self._last_eviction_at >= self.eviction_cooldown
+            ):
+                self._last_eviction_at = snapshot.timestamp
+                self.optimize_memory(snapshot)
             
             # CPU kullanımı yüksekse
-            cpu = psutil.cpu_percent()
-            if cpu > self.resource_limits["max_cpu_percent"]:
+            if snapshot.cpu_percent > self.resource_limits["max_cpu_percent"]:
                 self.optimize_cpu()
             
             # Disk kullanımı yüksekse
-            disk = psutil.disk_usage('/')
-            if disk.percent > self.resource_limits["max_disk_percent"]:
+            if snapshot.disk_percent > self.resource_limits["max_disk_percent"]:
                 self.cleanup_disk()
                 
         except Exception as e:
             self.logger.error(f"Kaynak kontrolü hatası: {str(e)}")
     
-    def optimize_memory(self):
-        """Bellek optimizasyonu yap"""
+    def optimize_memory(self, snapshot: Optional[MetricsSnapshot] = None) -> Dict:
+        """Bellek optimizasyonu yap: kayıtlı önbellekleri boşalt, GC çalıştır, temp dosyalarını temizle"""
         try:
+            snapshot = snapshot or self.metrics_collector.latest
+            
+            # Eşik aşımının yalnızca bu sürecin (RSS) payına düşen kısmı hedeflenir; belleği
+            # başka uygulamalar dolduruyorsa asistan kendi önbelleklerini boşuna boşaltmaz.
+            # Maksimum limit aşıldıysa yüksek öncelikli önbellekler (konuşma bağlamı) de boşaltılır
+            excess = max(snapshot.memory_percent - self.resource_limits["memory_cleanup_threshold"], 0)
+            critical = snapshot.memory_percent > self.resource_limits["max_memory_percent"]
+            report = self.cache_registry.evict(
+                target_bytes=int(snapshot.process_rss * excess / max(snapshot.memory_percent, 1)),
+                max_priority=None if critical else PRIORITY_NORMAL
+            )
+            self.last_eviction = report
+            
             # Garbage collector'ı çalıştır
             gc.collect()
             
@@ -100,10 +181,15 @@ class PerformanceManager:
             
             # Bellek kullanımını logla
             memory = psutil.virtual_memory()
-            self.logger.info(f"Bellek optimizasyonu yapıldı. Kullanım: {memory.percent}%")
+            self.logger.info(
+                f"Bellek optimizasyonu yapıldı. Kullanım: {memory.percent}%, "
+                f"önbelleklerden {report['reclaimed_bytes'] / 1024:.0f} KB geri kazanıldı"
+            )
+            return report
             
         except Exception as e:
             self.logger.error(f"Bellek optimizasyonu hatası: {str(e)}")
+            return {"reclaimed_bytes": 0, "evicted": []}
     
     def optimize_cpu(self):
         """CPU kullanımını optimize et"""
@@ -127,11 +213,8 @@ class PerformanceManager:
     def cleanup_disk(self):
         """Disk temizliği yap"""
         try:
-            # Temp dosyalarını temizle
-            self.cleanup_temp_files()
-            
-            # Log dosyalarını arşivle
-            self._archive_old_logs()
+            # Temp dosyalarını temizle ve eski logları sıkıştırarak arşivle (arka planda, kısılmış)
+            self.janitor.run_in_background()
             
             # Disk kullanımını logla
             disk = psutil.disk_usage('/')
@@ -141,49 +224,27 @@ class PerformanceManager:
             self.logger.error(f"Disk temizliği hatası: {str(e)}")
     
     def cleanup_temp_files(self):
-        """Geçici dosyaları temizle"""
+        """Geçici dosyaları yaş ve boyut bütçesine göre arka planda temizle"""
         try:
-            # 24 saatten eski temp dosyalarını sil
-            cutoff = datetime.now() - timedelta(hours=24)
-            
-            for file in self.temp_dir.glob("*"):
-                if file.stat().st_mtime < cutoff.timestamp():
-                    if file.is_file():
-                        file.unlink()
-                    elif file.is_dir():
-                        os.rmdir(file)
-            
-            self.logger.info("Geçici dosyalar temizlendi")
-            
+            self.janitor.run_in_background(logs=False)
         except Exception as e:
             self.logger.error(f"Temp dosya temizleme hatası: {str(e)}")
     
-    def _archive_old_logs(self):
-        """Eski logları arşivle"""
-        try:
-            log_dir = Path("data/logs")
-            archive_dir = log_dir / "archive"
-            archive_dir.mkdir(exist_ok=True)
-            
-            # 7 günden eski logları arşivle
-            cutoff = datetime.now() - timedelta(days=7)
-            
-            for log_file in log_dir.glob("*.log"):
-                if log_file.stat().st_mtime < cutoff.timestamp():
-                    archive_path = archive_dir / f"{log_file.stem}_{datetime.now():%Y%m%d}.log"
-                    log_file.rename(archive_path)
-            
-        except Exception as e:
-            self.logger.error(f"Log arşivleme hatası: {str(e)}")
-    
     def get_performance_metrics(self) -> Dict:
         """Performans metriklerini getir"""
         try:
+            snapshot = self.metrics_collector.latest
+            recent = self.metrics["response_times"].values()[-10:]
+            lifetime = self.response_histogram.summary()
             current_metrics = {
-                "memory": psutil.virtual_memory().percent,
-                "cpu": psutil.cpu_percent(),
-                "disk": psutil.disk_usage('/').percent,
-                "average_response_time": sum(self.metrics["response_times"][-10:]) / len(self.metrics["response_times"][-10:]) if self.metrics["response_times"] else 0
+                "memory": snapshot.memory_percent,
+                "cpu": snapshot.cpu_percent,
+                "disk": snapshot.disk_percent,
+                "average_response_time": sum(recent) / len(recent) if recent else 0,
+                "p50_response_time": lifetime.get("p50"),
+                "p90_response_time": lifetime.get("p90"),
+                "p99_response_time": lifetime.get("p99"),
+                "cache_bytes_reclaimed": self.cache_registry.total_reclaimed
             }
             return current_metrics
         except Exception as e:
@@ -194,36 +255,130 @@ class PerformanceManager:
         """Yanıt süresini kaydet"""
         try:
             self.metrics["response_times"].append(response_time)
-            if len(self.metrics["response_times"]) > 100:
-                self.metrics["response_times"].pop(0)
+            self.response_histogram.record(response_time)
         except Exception as e:
             self.logger.error(f"Yanıt süresi kaydetme hatası: {str(e)}")
     
-    def start_command_timing(self, command: str):
-        """Komut zamanlamasını başlat"""
-        self.start_times[command] = time.time()
-        
-    def end_command_timing(self, command: str):
-        """Komut zamanlamasını bitir ve süreyi kaydet"""
-        if command in self.start_times:
-            end_time = time.time()
-            duration = end_time - self.start_times[command]
-            
-            if command not in self.command_timings:
-                self.command_timings[command] = []
-                
-            self.command_timings[command].append(duration)
-            del self.start_times[command]
-            
-            # Son 10 ölçümü tut
-            if len(self.command_timings[command]) > 10:
-                self.command_timings[command].pop(0)
-                
-            return duration
-        return None
+    def _on_trace_finished(self, trace):
+        """Tamamlanan komut izinin süresini ve aralıklarını intent bazında kaydet"""
+        if trace.name != "command":
+            return
+        self.latency.record_trace(trace)
+        self.log_response_time(trace.duration)
+        
+    def record_command_timing(self, intent: str, duration: float):
+        """Komut süresini kaydet"""
+        self.latency.record(intent, duration)
+        self.log_response_time(duration)
+        
+    def command_timing(self, command: str, intent: Optional[str] = None):
+        """Komutu kendi kimliğiyle izleyen bağlam yöneticisi (her çıkışta kapanır)"""
+        return self.tracer.trace("command", intent=intent, command=command)
+        
+    def get_latency_report(self, intent: Optional[str] = None) -> Dict:
+        """Intent başına p50/p90/p99 komut gecikmelerini aralık kırılımıyla getir"""
+        intents = [intent] if intent is not None else self.latency.intents()
+        return {name: {**self.latency.stats(name), "spans": self.latency.span_stats(name)} for name in intents}
+        
+    def format_latency_report(self) -> str:
+        """Gecikme raporunu okunabilir metin olarak getir"""
+        return self.latency.format_report()
+        
+    def get_metric_stats(self, name: str, window: Optional[str] = None) -> Dict:
+        """Metriğin pencere içindeki ("15m", "1h" ya da saniye) min/maks, p50/p90/p99 ve dakikalık hızı"""
+        buffer = self.metrics.get(name)
+        if buffer is None:
+            raise KeyError(f"Bilinmeyen metrik: {name}")
+        return buffer.stats(window)
+        
+    def get_latency_stats(self, intent: Optional[str] = None, window: Optional[str] = None) -> Dict:
+        """Komut gecikme istatistikleri
+
+        Pencere verilmezse başlangıçtan beri tüm örnekler histogramdan (yaklaşık),
+        verilirse son örnekler halka tampondan (kesin) hesaplanır.
+        """
+        if intent is None:
+            if window is None:
+                return self.response_histogram.summary()
+            return self.metrics["response_times"].stats(window)
+        return self.latency.stats(intent, window)
+        
+    def get_all_latency_stats(self, window: Optional[str] = None) -> Dict[str, Dict]:
+        """Tüm intent'lerin gecikme istatistikleri"""
+        return {intent: self.latency.stats(intent, window) for intent in self.latency.intents()}
+    
+    def start_profiling(self, duration: Optional[float] = None) -> bool:
+        """Tüm thread'leri örnekleyen profillemeyi başlat"""
+        return self.profiler.start(duration)
+        
+    def stop_profiling(self) -> str:
+        """Profillemeyi durdur, katlanmış yığın dosyasını yaz ve özetini döndür"""
+        session = self.profiler.stop()
+        if session is None:
+            return "Çalışan profilleme yok."
+        return self.profiler.format_report(session)
+        
+    def get_profile_report(self) -> str:
+        """Son profilin özeti ya da çalışan profillemenin durumu"""
+        if self.profiler.running:
+            return "Profilleme çalışıyor."
+        return self.profiler.format_report()
+        
+    def get_slow_commands(self, limit: int = 10, intent: Optional[str] = None,
+                          window: Optional[str] = None, order: str = "duration") -> List[Dict]:
+        """Bütçeyi aşan komut raporları; o anda aşılmış kaynak limitleri `over_limits` ile işaretlenir"""
+        limits = (("memory", "max_memory_percent"), ("cpu", "max_cpu_percent"), ("disk", "max_disk_percent"))
+        reports = []
+        for report in self.slow_commands.query(limit, intent, window, order):
+            resources = report.get("resources", {})
+            reports.append({**report, "over_limits": [
+                name for name, key in limits
+                if resources.get(f"{name}_percent", 0) > self.resource_limits[key]
+            ]})
+        return reports
+        
+    def get_metric_history(self, window: str = "24h", tier: Optional[str] = None) -> Dict:
+        """Diskteki geçmiş ölçümler; katman verilmezse pencereyi kapsayan en ince katman (raw/minute/hour)"""
+        if self.series_store is None:
+            return {"tier": None, "points": []}
+        name, points = self.series_store.query(window_seconds(window), tier)
+        return {"tier": name, "points": [point._asdict() for point in points]}
+        
+    def _metric_families(self) -> List[MetricFamily]:
+        snapshot = self.metrics_collector.latest
+        families = [
+            MetricFamily("assistant_cpu_percent", "Sistem CPU kullanımı", "gauge", [("", {}, snapshot.cpu_percent)]),
+            MetricFamily("assistant_memory_percent", "Sistem bellek kullanımı", "gauge", [("", {}, snapshot.memory_percent)]),
+            MetricFamily("assistant_disk_percent", "Disk kullanımı", "gauge", [("", {}, snapshot.disk_percent)]),
+            MetricFamily("assistant_process_rss_bytes", "Asistan süreci bellek kullanımı", "gauge", [("", {}, snapshot.process_rss)]),
+            MetricFamily("assistant_response_seconds", "Komut yanıt süreleri", "summary",
+                         summary_samples(self.response_histogram.summary()))
+        ]
+        
+        command_samples = []
+        for intent, histogram in self.latency.histograms():
+            command_samples.extend(summary_samples(histogram.summary(), {"intent": intent}))
+        families.append(MetricFamily("assistant_command_seconds", "Intent başına komut süreleri", "summary", command_samples))
+        
+        if self.series_store is not None:
+            families.append(MetricFamily(
+                "assistant_metric_store_records", "Zaman serisi deposundaki kayıt sayısı", "gauge",
+                [("", {"tier": name}, stats["records"]) for name, stats in self.series_store.get_stats().items()]
+            ))
+        return families
+        
+    def export_metrics(self) -> Optional[Path]:
+        """Güncel metrikleri Prometheus metin biçiminde dosyaya yaz"""
+        try:
+            write_textfile(self.export_path, self._metric_families())
+            return self.export_path
+        except Exception as e:
+            self.logger.error(f"Metrik dışa aktarma hatası: {str(e)}")
+            return None
     
     def __del__(self):
         """Yıkıcı metod"""
-        self.monitoring = False
-        if hasattr(self, 'monitor_thread'):
-            self.monitor_thread.join(timeout=1) 
\ No newline at end of file
+        if hasattr(self, 'metrics_collector'):
+            self.metrics_collector.unsubscribe(self._on_metrics)
+        if getattr(self, 'series_store', None) is not None:
+            self.series_store.close() 
\ No newline at end of file
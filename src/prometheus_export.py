@@ -0,0 +1,53 @@
+import os
+from pathlib import Path
+from typing import Dict, Iterable, List, NamedTuple, Tuple
+
+class MetricFamily(NamedTuple):
+    """Prometheus metrik ailesi: ad, açıklama, tip ve (etiketler, değer) örnekleri"""
+    name: str
+    help: str
+    type: str
+    samples: List[Tuple[str, Dict[str, str], float]]
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+def _format_value(value: float) -> str:
+    if value != value:
+        return "NaN"
+    if value in (float("inf"), float("-inf")):
+        return "+Inf" if value > 0 else "-Inf"
+    return repr(float(value))
+
+def format_metrics(families: Iterable[MetricFamily]) -> str:
+    """Aileleri Prometheus metin biçimine (0.0.4) çevir"""
+    lines = []
+    for family in families:
+        lines.append(f"# HELP {family.name} {_escape(family.help)}")
+        lines.append(f"# TYPE {family.name} {family.type}")
+        for suffix, labels, value in family.samples:
+            label_text = ",".join(f'{key}="{_escape(str(val))}"' for key, val in labels.items())
+            name = family.name + suffix
+            lines.append(f"{name}{{{label_text}}} {_format_value(value)}" if label_text else f"{name} {_format_value(value)}")
+    return "\n".join(lines) + "\n"
+
+def summary_samples(summary: Dict, labels: Dict[str, str] = None) -> List[Tuple[str, Dict[str, str], float]]:
+    """Yüzdelik özetini (count, mean, p50/p90/p99) summary örneklerine çevir"""
+    labels = labels or {}
+    count = summary.get("count", 0)
+    samples = [
+        ("", {**labels, "quantile": str(int(key[1:]) / 100)}, value)
+        for key, value in summary.items()
+        if key.startswith("p") and key[1:].isdigit() and value is not None
+    ]
+    samples.append(("_sum", labels, summary.get("mean", 0.0) * count))
+    samples.append(("_count", labels, count))
+    return samples
+
+def write_textfile(path: Path, families: Iterable[MetricFamily]):
+    """Metrikleri okuyucuların yarım dosya görmemesi için atomik olarak yaz (node_exporter textfile)"""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temp_path = path.with_suffix(path.suffix + ".tmp")
+    temp_path.write_text(format_metrics(families), encoding="utf-8")
+    os.replace(temp_path, path)
@@ -0,0 +1,154 @@
+import hashlib
+import json
+import logging
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, Optional
+from config_manager import get_config_manager
+
+DEFAULT_CACHE_DIR = "data/cache/responses"
+DEFAULT_MAX_BYTES = 50 * 1024 * 1024
+# Yalnızca (neredeyse) deterministik yanıtlar önbelleğe alınır
+DEFAULT_MAX_TEMPERATURE = 0.2
+# Önbelleğe alınacak istekler (inceleme, düzenleme) bu sıcaklıkla gönderilir
+DEFAULT_REQUEST_TEMPERATURE = 0.0
+
+class ResponseCache:
+    """Model yanıtlarının içerik adresli, boyut sınırlı (LRU) disk önbelleği"""
+
+    def __init__(self, cache_config: Optional[dict] = None):
+        self.logger = logging.getLogger("AICodeEditor.ResponseCache")
+        if cache_config is None:
+            cache_config = get_config_manager().get_config("ai", {}).get("response_cache", {})
+
+        self.enabled = cache_config.get("enabled", True)
+        self.cache_dir = Path(cache_config.get("cache_dir", DEFAULT_CACHE_DIR))
+        self.max_bytes = cache_config.get("max_bytes", DEFAULT_MAX_BYTES)
+        # Bu değerin üzerindeki sıcaklıklar deterministik sayılmaz, önbelleğe alınmaz
+        self.max_temperature = cache_config.get("max_temperature", DEFAULT_MAX_TEMPERATURE)
+        # Sohbet sıcaklığı ne olursa olsun önbellekli istekler deterministik gönderilir
+        self.request_temperature = cache_config.get("temperature", DEFAULT_REQUEST_TEMPERATURE)
+
+        self._lock = threading.Lock()
+        # anahtar -> dosya boyutu; en az kullanılan başta
+        self._entries: "OrderedDict[str, int]" = OrderedDict()
+        self._total_bytes = 0
+        self.hits = 0
+        self.misses = 0
+
+        if self.enabled:
+            self._load_index()
+
+    def _load_index(self):
+        """Diskteki kayıtları son kullanım sırasına göre indeksle"""
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            entries = []
+            with os.scandir(self.cache_dir) as it:
+                for entry in it:
+                    if entry.is_file() and entry.name.endswith(".json"):
+                        stat = entry.stat()
+                        entries.append((stat.st_mtime_ns, entry.name[:-5], stat.st_size))
+
+            for _, key, size in sorted(entries):
+                self._entries[key] = size
+                self._total_bytes += size
+
+        except Exception as e:
+            self.logger.error(f"Yanıt önbelleği yükleme hatası: {str(e)}")
+
+    @staticmethod
+    def make_key(model: str, temperature: float, system_prompt: str, prompt: str) -> str:
+        """(model, sıcaklık, system prompt, istem özeti) için içerik adresi üret"""
+        prompt_hash = hashlib.sha256(prompt.encode("utf-8")).hexdigest()
+        material = json.dumps([model, temperature, system_prompt, prompt_hash], ensure_ascii=False)
+        return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+    def is_cacheable(self, temperature: float) -> bool:
+        """Bu sıcaklıkla üretilen yanıt önbelleğe alınabilir mi"""
+        return self.enabled and temperature <= self.max_temperature
+
+    def temperature_for(self, temperature: float) -> float:
+        """Önbellekli istek için kullanılacak sıcaklık (önbellek kapalıysa modelinki)"""
+        return self.request_temperature if self.enabled else temperature
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.json"
+
+    def get(self, key: str) -> Optional[str]:
+        """Önbellekteki yanıtı getir ve son kullanım zamanını güncelle"""
+        with self._lock:
+            if key not in self._entries:
+                self.misses += 1
+                return None
+
+            path = self._path(key)
+            try:
+                with open(path, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+                os.utime(path)
+            except Exception as e:
+                self.logger.error(f"Yanıt önbelleği okuma hatası: {str(e)}")
+                self._remove(key)
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return data.get("response")
+
+    def put(self, key: str, response: str, metadata: Optional[Dict] = None):
+        """Yanıtı önbelleğe yaz ve boyut sınırını koru"""
+        if not self.enabled:
+            return
+
+        with self._lock:
+            try:
+                path = self._path(key)
+                temp_path = path.with_suffix(".tmp")
+                with open(temp_path, 'w', encoding='utf-8') as f:
+                    json.dump({"response": response, "metadata": metadata or {}}, f, ensure_ascii=False)
+                os.replace(temp_path, path)
+
+                if key in self._entries:
+                    self._total_bytes -= self._entries.pop(key)
+                size = path.stat().st_size
+                self._entries[key] = size
+                self._total_bytes += size
+
+                self._evict()
+
+            except Exception as e:
+                self.logger.error(f"Yanıt önbelleği yazma hatası: {str(e)}")
+
+    def _remove(self, key: str):
+        size = self._entries.pop(key, 0)
+        self._total_bytes -= size
+        try:
+            self._path(key).unlink()
+        except FileNotFoundError:
+            pass
+
+    def _evict(self):
+        """Toplam boyut sınırı aşıldıysa en az kullanılan kayıtları sil"""
+        while self._entries and self._total_bytes > self.max_bytes:
+            key = next(iter(self._entries))
+            self._remove(key)
+
+    def clear(self):
+        """Tüm önbelleği temizle"""
+        with self._lock:
+            for key in list(self._entries):
+                self._remove(key)
+
+    def get_stats(self) -> Dict:
+        """Önbellek istatistiklerini getir"""
+        return {
+            "entries": len(self._entries),
+            "bytes": self._total_bytes,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses
+        }
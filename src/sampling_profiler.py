@@ -0,0 +1,253 @@
+import logging
+import os
+import sys
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+from config_manager import get_config_manager
+
+DEFAULT_INTERVAL = 0.01
+DEFAULT_MAX_DURATION = 60
+DEFAULT_MAX_DEPTH = 64
+DEFAULT_OUTPUT_DIR = "data/profiles"
+DEFAULT_LATENCY_THRESHOLD = 5.0
+DEFAULT_AUTO_DURATION = 15
+DEFAULT_AUTO_COOLDOWN = 300
+DEFAULT_KEEP_PROFILES = 20
+
+# Süreç genelinde tek profilleyici
+_profiler = None
+_profiler_lock = threading.Lock()
+
+def get_profiler() -> "SamplingProfiler":
+    """Paylaşılan örnekleyici profilleyiciyi getir"""
+    global _profiler
+    if _profiler is None:
+        with _profiler_lock:
+            if _profiler is None:
+                _profiler = SamplingProfiler()
+    return _profiler
+
+def _frame_label(code) -> str:
+    return f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})"
+
+class ProfileSession:
+    """Tek profilleme oturumu: yığın sayaçları ve meta bilgi"""
+
+    def __init__(self, reason: str, duration: float):
+        self.reason = reason
+        self.duration = duration
+        self.started = time.time()
+        self.samples = 0
+        self.stacks: Counter = Counter()
+        self.path: Optional[Path] = None
+
+    def top_frames(self, limit: int = 10) -> List[Tuple[str, int]]:
+        """En çok örnekte en üstte görülen fonksiyonlar (kendi süresi)"""
+        leaf_counts = Counter()
+        for stack, count in self.stacks.items():
+            leaf_counts[stack[-1]] += count
+        return leaf_counts.most_common(limit)
+
+class SamplingProfiler:
+    """Tüm thread'lerin yığınlarını sabit aralıkla örnekleyen düşük maliyetli profilleyici
+
+    Örnekleme yalnızca oturum açıkken ayrı bir thread'de `sys._current_frames()`
+    ile yapılır; izlenen kodda ek maliyet yoktur. Sonuç, flamegraph araçlarının
+    okuduğu katlanmış yığın (collapsed stack) biçiminde `data/profiles` altına yazılır.
+    """
+
+    def __init__(self, profiler_config: Optional[dict] = None):
+        self.logger = logging.getLogger("AICodeEditor.Profiler")
+        if profiler_config is None:
+            profiler_config = get_config_manager().get_config("performance", {}).get("profiler", {})
+
+        self.interval = max(profiler_config.get("interval", DEFAULT_INTERVAL), 0.001)
+        self.max_duration = profiler_config.get("max_duration", DEFAULT_MAX_DURATION)
+        self.max_depth = profiler_config.get("max_depth", DEFAULT_MAX_DEPTH)
+        self.output_dir = Path(profiler_config.get("output_dir", DEFAULT_OUTPUT_DIR))
+        self.keep_profiles = profiler_config.get("keep_profiles", DEFAULT_KEEP_PROFILES)
+
+        # Gecikme eşiğini aşan komut sürerken otomatik profilleme
+        self.auto_enabled = profiler_config.get("auto", True)
+        self.latency_threshold = profiler_config.get("latency_threshold", DEFAULT_LATENCY_THRESHOLD)
+        self.auto_duration = profiler_config.get("auto_duration", DEFAULT_AUTO_DURATION)
+        self.auto_cooldown = profiler_config.get("auto_cooldown", DEFAULT_AUTO_COOLDOWN)
+
+        self._lock = threading.Lock()
+        self._session: Optional[ProfileSession] = None
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self.last_session: Optional[ProfileSession] = None
+
+        # İzlenen işler: kimlik -> [ad, başlangıç, eşik kontrol edildi mi]
+        self._inflight: Dict[int, list] = {}
+        self._next_watch = 0
+        self._auto_watch: Optional[int] = None
+        self._last_auto = 0.0
+        self._watch_changed = threading.Condition(self._lock)
+        self._watchdog: Optional[threading.Thread] = None
+
+    @property
+    def running(self) -> bool:
+        return self._session is not None
+
+    def start(self, duration: Optional[float] = None, reason: str = "manual") -> bool:
+        """Profillemeyi başlat; zaten çalışıyorsa False döner"""
+        with self._lock:
+            if self._session is not None:
+                return False
+            duration = min(duration or self.max_duration, self.max_duration)
+            self._session = ProfileSession(reason, duration)
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._sample_loop, args=(self._session,),
+                                            name="SamplingProfiler", daemon=True)
+            self._thread.start()
+        self.logger.info(f"Profilleme başladı ({reason}, en fazla {duration:g} sn)")
+        return True
+
+    def stop(self) -> Optional[ProfileSession]:
+        """Profillemeyi durdur ve sonucu dosyaya yaz"""
+        with self._lock:
+            session, thread = self._session, self._thread
+            if session is None:
+                return None
+            self._stop.set()
+        if thread is not threading.current_thread():
+            thread.join(timeout=1)
+        # Süre dolup oturum örnekleyicide kapandıysa onun sonucu döner
+        return self._finish(session) or self.last_session
+
+    def _finish(self, session: ProfileSession) -> Optional[ProfileSession]:
+        with self._lock:
+            if self._session is not session:
+                # Başka bir thread oturumu zaten kapattı
+                return None
+            self._session = None
+            self._thread = None
+            self._auto_watch = None
+        try:
+            session.path = self._write(session)
+            self.logger.info(f"Profil kaydedildi: {session.path} ({session.samples} örnek)")
+        except Exception as e:
+            self.logger.error(f"Profil yazma hatası: {str(e)}")
+        self.last_session = session
+        return session
+
+    def _sample_loop(self, session: ProfileSession):
+        # Profilleyicinin kendi thread'leri örneklenmez
+        own_ids = {threading.get_ident(), self._watchdog.ident if self._watchdog else None}
+        deadline = time.monotonic() + session.duration
+        while not self._stop.wait(self.interval):
+            if time.monotonic() >= deadline:
+                break
+            try:
+                self._sample(session, own_ids)
+            except Exception as e:
+                self.logger.error(f"Profil örnekleme hatası: {str(e)}")
+                break
+        if not self._stop.is_set():
+            # Süre doldu; oturumu örnekleyici kapatır
+            self._finish(session)
+
+    def _sample(self, session: ProfileSession, own_ids: set):
+        names = {thread.ident: thread.name for thread in threading.enumerate()}
+        for thread_id, frame in sys._current_frames().items():
+            if thread_id in own_ids:
+                continue
+            stack = []
+            while frame is not None and len(stack) < self.max_depth:
+                stack.append(_frame_label(frame.f_code))
+                frame = frame.f_back
+            stack.append(names.get(thread_id, f"thread-{thread_id}"))
+            stack.reverse()
+            session.stacks[tuple(stack)] += 1
+        session.samples += 1
+
+    def _write(self, session: ProfileSession) -> Path:
+        """Katlanmış yığın dosyası yaz (satır başına `thread;dış;...;iç sayı`)"""
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        started = datetime.fromtimestamp(session.started)
+        path = self.output_dir / f"profile-{started:%Y%m%d-%H%M%S}-{session.reason}.collapsed"
+        with open(path, "w", encoding="utf-8") as f:
+            for stack, count in session.stacks.most_common():
+                f.write(";".join(part.replace(";", ",") for part in stack) + f" {count}\n")
+
+        # Eski profilleri sınırlı sayıda tut
+        profiles = sorted(self.output_dir.glob("profile-*.collapsed"), key=lambda p: p.stat().st_mtime)
+        for old in profiles[:-self.keep_profiles] if self.keep_profiles else []:
+            old.unlink()
+        return path
+
+    @contextmanager
+    def watch(self, name: str):
+        """Süresi eşiği aşarsa profillemeyi otomatik başlatacak işi izle"""
+        if not self.auto_enabled or not self.latency_threshold:
+            yield
+            return
+
+        with self._lock:
+            watch_id = self._next_watch
+            self._next_watch += 1
+            self._inflight[watch_id] = [name, time.monotonic(), False]
+            if self._watchdog is None:
+                self._watchdog = threading.Thread(target=self._watchdog_loop, name="ProfilerWatchdog", daemon=True)
+                self._watchdog.start()
+            self._watch_changed.notify()
+        try:
+            yield
+        finally:
+            with self._lock:
+                self._inflight.pop(watch_id, None)
+                self._watch_changed.notify()
+                stop_auto = self._auto_watch == watch_id
+            if stop_auto:
+                # Yavaş iş bitti; oturum sonucu hemen yazılır
+                self.stop()
+
+    def _watchdog_loop(self):
+        """İzlenen işlerden eşiği aşan olursa profillemeyi başlat"""
+        while True:
+            with self._lock:
+                pending = [(watch_id, entry) for watch_id, entry in self._inflight.items() if not entry[2]]
+                if not pending:
+                    self._watch_changed.wait()
+                    continue
+                watch_id, entry = min(pending, key=lambda item: item[1][1])
+                now = time.monotonic()
+                remaining = entry[1] + self.latency_threshold - now
+                if remaining > 0:
+                    self._watch_changed.wait(remaining)
+                    continue
+
+                # Her iş en fazla bir kez tetikler
+                entry[2] = True
+                trigger = (self._session is None and now - self._last_auto >= self.auto_cooldown)
+                if trigger:
+                    self._auto_watch = watch_id
+                    self._last_auto = now
+
+            if trigger:
+                self.logger.warning(f"'{entry[0]}' {self.latency_threshold} sn'yi aştı, profilleme başlatılıyor")
+                self.start(self.auto_duration, reason=f"auto-{entry[0]}")
+
+    def list_profiles(self) -> List[Path]:
+        """Kaydedilmiş profiller, yeniden eskiye"""
+        if not self.output_dir.exists():
+            return []
+        return sorted(self.output_dir.glob("profile-*.collapsed"), key=lambda p: p.stat().st_mtime, reverse=True)
+
+    def format_report(self, session: Optional[ProfileSession] = None, limit: int = 10) -> str:
+        """Oturumun en yoğun fonksiyonlarını metin olarak özetle"""
+        session = session or self.last_session
+        if session is None:
+            return "Henüz profil alınmadı."
+        lines = [f"Profil ({session.reason}): {session.samples} örnek, {session.path or 'kaydedilmedi'}"]
+        total = sum(session.stacks.values()) or 1
+        for label, count in session.top_frames(limit):
+            lines.append(f"  %{count * 100 / total:5.1f}  {label}")
+        return "\n".join(lines)
@@ -6,11 +6,24 @@ import xml.etree.ElementTree as ET
 import time
 import re
 import os
+from cache_registry import PRIORITY_LOW, get_cache_registry
 
 class ScreenScraper:
     def __init__(self):
         self.current_data = []
         self.last_screenshot = None
+        get_cache_registry().register("last_screenshot", self.screenshot_size, self.release_screenshot, PRIORITY_LOW)
+        
+    def screenshot_size(self) -> int:
+        """Son ekran görüntüsünün piksel verisi boyutu (bayt)"""
+        image = self.last_screenshot
+        if image is None:
+            return 0
+        return image.width * image.height * len(image.getbands())
+        
+    def release_screenshot(self):
+        """Bellek baskısında son ekran görüntüsünü bırak"""
+        self.last_screenshot = None
         
     def capture_area(self, x1=None, y1=None, x2=None, y2=None):
         """Belirtilen alanın ekran görüntüsünü al"""
@@ -5,14 +5,14 @@ from pathlib import Path
 from datetime import datetime, timedelta
 from cryptography.fernet import Fernet
 from language_manager import LanguageManager
-from config_manager import ConfigManager
+from config_manager import get_config_manager
 import logging
 import shutil
 
 class SecurityManager:
     def __init__(self):
         self.language_manager = LanguageManager()
-        self.config_manager = ConfigManager()
+        self.config_manager = get_config_manager()
         self.logger = logging.getLogger("AICodeEditor.Security")
         
         # Güvenlik ayarlarını yükle
@@ -35,12 +35,8 @@ class SecurityManager:
     def _load_security_config(self) -> dict:
         """Güvenlik yapılandırmasını yükle"""
         try:
-            config_file = self.config_dir / "default.json"
-            if config_file.exists():
-                with open(config_file, 'r', encoding='utf-8') as f:
-                    config = json.load(f)
-                    return config.get("security", {})
-            return {}
+            # Paylaşılan yapılandırmadan al, dosyayı yeniden okuma
+            return self.config_manager.get_config("security", {})
         except Exception as e:
             self.logger.error(f"Güvenlik yapılandırması yükleme hatası: {str(e)}")
             return {}
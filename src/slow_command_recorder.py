@@ -0,0 +1,233 @@
+import json
+import logging
+import os
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional
+from config_manager import get_config_manager
+from metric_store import window_seconds
+from metrics_collector import get_metrics_collector
+from tracer import Span, get_tracer
+
+DEFAULT_BUDGET = 3.0
+DEFAULT_CAPACITY = 50
+DEFAULT_DIRECTORY = "data/slow_commands"
+DEFAULT_STACK_DEPTH = 40
+# Raporlanan kök izler: komutlar ve komut dışında başlatılan model akışları
+RECORDED_TRACES = ("command", "llm_stream")
+
+# Süreç genelinde tek kaydedici
+_recorder = None
+_recorder_lock = threading.Lock()
+
+def get_slow_command_recorder() -> "SlowCommandRecorder":
+    """Paylaşılan yavaş komut kaydedicisini getir"""
+    global _recorder
+    if _recorder is None:
+        with _recorder_lock:
+            if _recorder is None:
+                _recorder = SlowCommandRecorder()
+    return _recorder
+
+def flatten_spans(span: Dict, prefix: str = "") -> List[Dict]:
+    """İç içe aralıkları "handler/llm" gibi yollarla düz listeye çevir"""
+    rows = []
+    for child in span.get("children", []):
+        path = f"{prefix}{child['name']}"
+        rows.append({"span": path, "duration_ms": child["duration_ms"], "error": child["error"]})
+        rows.extend(flatten_spans(child, path + "/"))
+    return rows
+
+class SlowCommandRecorder:
+    """Gecikme bütçesini aşan komutların anlık durumunu diskteki sabit boyutlu halkaya kaydeden sınıf
+
+    Bütçe dolduğunda (komut hâlâ sürerken) tüm thread yığınları alınır; komut
+    bitince ifade, intent, aralık dökümü ve son kaynak ölçümüyle birlikte
+    `slow-NNN.json` yuvalarından birine yazılır. En eski rapor üzerine yazılır.
+    """
+
+    def __init__(self, slow_config: Optional[dict] = None):
+        self.logger = logging.getLogger("AICodeEditor.SlowCommands")
+        if slow_config is None:
+            slow_config = get_config_manager().get_config("performance", {}).get("slow_commands", {})
+
+        self.enabled = slow_config.get("enabled", True)
+        self.budget = slow_config.get("budget", DEFAULT_BUDGET)
+        self.capacity = max(slow_config.get("capacity", DEFAULT_CAPACITY), 1)
+        self.directory = Path(slow_config.get("directory", DEFAULT_DIRECTORY))
+        self.stack_depth = slow_config.get("max_stack_depth", DEFAULT_STACK_DEPTH)
+
+        self._lock = threading.Lock()
+        # trace_id -> bütçe aşıldığında alınan yığınlar
+        self._captured: Dict[int, Dict] = {}
+        self.reports: List[Dict] = []
+        self._next_slot = 0
+        self._load()
+
+        get_tracer().add_listener(self._on_trace_finished)
+
+    def _slot_path(self, slot: int) -> Path:
+        return self.directory / f"slow-{slot:03d}.json"
+
+    def _load(self):
+        """Diskteki yuvaları oku; sıradaki yuva en yeni raporun ardıdır"""
+        if not self.directory.exists():
+            return
+        for path in self.directory.glob("slow-*.json"):
+            try:
+                with open(path, "r", encoding="utf-8") as f:
+                    report = json.load(f)
+                if report.get("slot", self.capacity) < self.capacity:
+                    self.reports.append(report)
+            except Exception as e:
+                self.logger.error(f"Yavaş komut raporu okuma hatası ({path.name}): {str(e)}")
+        self.reports.sort(key=lambda report: report["timestamp"])
+        if self.reports:
+            self._next_slot = (self.reports[-1]["slot"] + 1) % self.capacity
+
+    @contextmanager
+    def watch(self, trace: Span):
+        """Komut bütçeyi aşarsa, sürerken thread yığınlarını yakala"""
+        if not self.enabled or not self.budget:
+            yield
+            return
+
+        timer = threading.Timer(self.budget, self._capture, args=(trace.trace_id, threading.get_ident()))
+        timer.daemon = True
+        timer.start()
+        try:
+            yield
+        finally:
+            timer.cancel()
+
+    def _capture(self, trace_id: int, thread_id: int):
+        try:
+            stacks = self.thread_stacks(thread_id)
+            with self._lock:
+                self._captured[trace_id] = {"after_ms": round(self.budget * 1000), "threads": stacks}
+        except Exception as e:
+            self.logger.error(f"Yığın yakalama hatası: {str(e)}")
+
+    def thread_stacks(self, command_thread: Optional[int] = None) -> List[Dict]:
+        """Tüm thread'lerin yığınları (komut thread'i önce, çağrılar dıştan içe)"""
+        names = {thread.ident: thread.name for thread in threading.enumerate()}
+        own_id = threading.get_ident()
+        stacks = []
+        for thread_id, frame in sys._current_frames().items():
+            if thread_id == own_id:
+                continue
+            frames = []
+            while frame is not None and len(frames) < self.stack_depth:
+                code = frame.f_code
+                frames.append(f"{os.path.basename(code.co_filename)}:{frame.f_lineno} {code.co_name}")
+                frame = frame.f_back
+            frames.reverse()
+            stacks.append({
+                "thread": names.get(thread_id, f"thread-{thread_id}"),
+                "command_thread": thread_id == command_thread,
+                "frames": frames
+            })
+        stacks.sort(key=lambda stack: not stack["command_thread"])
+        return stacks
+
+    def _on_trace_finished(self, trace: Span):
+        with self._lock:
+            captured = self._captured.pop(trace.trace_id, None)
+        if trace.name not in RECORDED_TRACES or not self.enabled or trace.duration is None or trace.duration < self.budget:
+            return
+        try:
+            self.record(trace, captured)
+        except Exception as e:
+            self.logger.error(f"Yavaş komut kaydetme hatası: {str(e)}")
+
+    def record(self, trace: Span, captured: Optional[Dict] = None) -> Dict:
+        """Yavaş komut raporunu oluştur ve sıradaki yuvaya yaz"""
+        trace_data = trace.to_dict()
+        report = {
+            "timestamp": time.time(),
+            "recorded_at": datetime.now().isoformat(),
+            "command": trace.attributes.get("command"),
+            "intent": trace.intent or trace.name,
+            "duration_ms": trace.duration_ms,
+            "budget_ms": round(self.budget * 1000),
+            "error": trace.error,
+            "spans": flatten_spans(trace_data),
+            "trace": trace_data,
+            # Yığınlar bütçe dolduğunda alınır; zamanlayıcı tetiklenmediyse bitiş anındaki durum
+            "stacks": captured or {"after_ms": trace.duration_ms, "threads": self.thread_stacks()},
+            "resources": get_metrics_collector().latest._asdict()
+        }
+
+        with self._lock:
+            slot = report["slot"] = self._next_slot
+            self._next_slot = (slot + 1) % self.capacity
+            self.reports = [item for item in self.reports if item["slot"] != slot]
+            self.reports.append(report)
+
+        self.directory.mkdir(parents=True, exist_ok=True)
+        path = self._slot_path(slot)
+        temp_path = path.with_suffix(".tmp")
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+        os.replace(temp_path, path)
+
+        self.logger.warning(
+            f"Yavaş komut ({report['duration_ms']:.0f} ms > {report['budget_ms']} ms): "
+            f"{report['intent']} - {report['command']}"
+        )
+        return report
+
+    def query(self, limit: int = 10, intent: Optional[str] = None, window: Optional[str] = None,
+              order: str = "duration") -> List[Dict]:
+        """Raporları süreye (en kötü önce) ya da zamana (en yeni önce) göre getir"""
+        seconds = window_seconds(window)
+        since = time.time() - seconds if seconds is not None else None
+        with self._lock:
+            reports = [
+                report for report in self.reports
+                if (intent is None or report["intent"] == intent)
+                and (since is None or report["timestamp"] >= since)
+            ]
+        key = (lambda report: report["duration_ms"]) if order == "duration" else (lambda report: report["timestamp"])
+        return sorted(reports, key=key, reverse=True)[:limit]
+
+    def summary_by_intent(self) -> Dict[str, Dict]:
+        """Intent başına yavaş komut sayısı, en kötü ve ortalama süre"""
+        summary: Dict[str, Dict] = {}
+        with self._lock:
+            reports = list(self.reports)
+        for report in reports:
+            item = summary.setdefault(report["intent"], {"count": 0, "max_ms": 0.0, "total_ms": 0.0})
+            item["count"] += 1
+            item["max_ms"] = max(item["max_ms"], report["duration_ms"])
+            item["total_ms"] += report["duration_ms"]
+        for item in summary.values():
+            item["mean_ms"] = round(item.pop("total_ms") / item["count"], 3)
+        return summary
+
+    def clear(self):
+        """Tüm raporları sil"""
+        with self._lock:
+            self.reports = []
+            self._next_slot = 0
+        for path in self.directory.glob("slow-*.json"):
+            path.unlink()
+
+    def format_report(self, limit: int = 5) -> str:
+        """En yavaş komutların okunabilir listesi"""
+        reports = self.query(limit)
+        if not reports:
+            return "🐢 Kayıtlı yavaş komut yok."
+        lines = [f"🐢 En Yavaş Komutlar (bütçe {round(self.budget * 1000)} ms):"]
+        for report in reports:
+            slowest = max(report["spans"], key=lambda span: span["duration_ms"] or 0, default=None)
+            detail = f" | en uzun: {slowest['span']} {slowest['duration_ms']} ms" if slowest else ""
+            lines.append(
+                f"- {report['duration_ms']:.0f} ms {report['intent']}: '{report['command']}' "
+                f"({report['recorded_at'][:19]}){detail}"
+            )
+        return "\n".join(lines)
@@ -1,9 +1,9 @@
 import pyttsx3
-from config_manager import ConfigManager
+from config_manager import get_config_manager
 
 class SpeechManager:
     def __init__(self):
-        self.config_manager = ConfigManager()
+        self.config_manager = get_config_manager()
         speech_config = self.config_manager.get_config("speech")
         
         # Ses tanıma ayarları
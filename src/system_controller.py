@@ -1,4 +1,3 @@
-import psutil
 import os
 import screen_brightness_control as sbc
 import sounddevice as sd
@@ -6,11 +5,12 @@ import numpy as np
 import subprocess
 from datetime import datetime
 from pathlib import Path
-from config_manager import ConfigManager
+from config_manager import get_config_manager
+from metrics_collector import get_metrics_collector
 
 class SystemController:
     def __init__(self):
-        self.config_manager = ConfigManager()
+        self.config_manager = get_config_manager()
         system_config = self.config_manager.get_config("system")
         
         self.volume_step = system_config.get("volume_step", 10)
@@ -26,16 +26,14 @@ class SystemController:
         
     def get_system_info(self):
         """Sistem bilgilerini al"""
-        cpu = psutil.cpu_percent()
-        memory = psutil.virtual_memory()
-        disk = psutil.disk_usage('/')
-        battery = psutil.sensors_battery()
+        snapshot = get_metrics_collector().latest
+        battery = snapshot.battery_percent
         
         return {
-            "CPU Kullanımı": f"%{cpu}",
-            "RAM Kullanımı": f"%{memory.percent}",
-            "Disk Kullanımı": f"%{disk.percent}",
-            "Pil Durumu": f"%{battery.percent if battery else 'Bilgi yok'}"
+            "CPU Kullanımı": f"%{snapshot.cpu_percent}",
+            "RAM Kullanımı": f"%{snapshot.memory_percent}",
+            "Disk Kullanımı": f"%{snapshot.disk_percent}",
+            "Pil Durumu": f"%{battery if battery is not None else 'Bilgi yok'}"
         }
         
     def control_brightness(self, value=None, increase=False, decrease=False):
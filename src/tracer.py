@@ -0,0 +1,206 @@
+import functools
+import itertools
+import logging
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import datetime
+from typing import Callable, Deque, Dict, List, Optional
+
+# Ayrıntısıyla saklanan son iz sayısı
+DEFAULT_RECENT_TRACES = 50
+
+_current_span: ContextVar[Optional["Span"]] = ContextVar("current_span", default=None)
+
+# Süreç genelinde paylaşılan örnek
+_shared_instance = None
+_shared_lock = threading.Lock()
+
+def get_tracer() -> "Tracer":
+    """Süreç genelinde paylaşılan izleyiciyi getir"""
+    global _shared_instance
+    if _shared_instance is None:
+        with _shared_lock:
+            if _shared_instance is None:
+                _shared_instance = Tracer()
+    return _shared_instance
+
+class Span:
+    """Tek bir ölçüm aralığı; iç içe alt aralıklar içerebilir"""
+
+    def __init__(self, name: str, trace_id: int, parent: Optional["Span"] = None, attributes: Optional[Dict] = None):
+        self.name = name
+        self.trace_id = trace_id
+        self.parent = parent
+        self.attributes = dict(attributes or {})
+        self.children: List["Span"] = []
+        self.intent = None
+        self.error = None
+        self.started_at = datetime.now().isoformat()
+        self._start = time.perf_counter()
+        self.duration = None
+
+    @property
+    def root(self) -> "Span":
+        span = self
+        while span.parent is not None:
+            span = span.parent
+        return span
+
+    @property
+    def duration_ms(self) -> Optional[float]:
+        return round(self.duration * 1000, 3) if self.duration is not None else None
+
+    def set_intent(self, intent: str):
+        """İzin ait olduğu intent'i belirle (kök aralığa yazılır)"""
+        self.root.intent = intent
+
+    def set_attribute(self, key: str, value):
+        self.attributes[key] = value
+
+    def add_child(self, name: str, duration: float, **attributes) -> "Span":
+        """Ayrı ölçülmüş, tamamlanmış bir alt aralık ekle"""
+        child = Span(name, self.trace_id, self, attributes)
+        child.duration = duration
+        self.children.append(child)
+        return child
+
+    def finish(self):
+        if self.duration is None:
+            self.duration = time.perf_counter() - self._start
+
+    def to_dict(self) -> Dict:
+        return {
+            "name": self.name,
+            "trace_id": self.trace_id,
+            "intent": self.intent,
+            "started_at": self.started_at,
+            "duration_ms": self.duration_ms,
+            "error": self.error,
+            "attributes": self.attributes,
+            "children": [child.to_dict() for child in self.children]
+        }
+
+class Tracer:
+    """Komut çağrılarını iç içe aralıklarla izleyen izleyici
+
+    Gecikme istatistikleri burada tutulmaz; tamamlanan izler dinleyicilere
+    (performans yöneticisinin gecikme deposu, yavaş komut kaydedici) iletilir.
+    """
+
+    def __init__(self, recent_size: int = DEFAULT_RECENT_TRACES):
+        self.logger = logging.getLogger("AICodeEditor.Tracer")
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+        self._recent: Deque[Span] = deque(maxlen=recent_size)
+        self._listeners: List[Callable[[Span], None]] = []
+        # Şu anda açık kök iz sayısı (işlenmekte olan komutlar)
+        self._active = 0
+
+    @property
+    def active_traces(self) -> int:
+        return self._active
+
+    def add_listener(self, listener: Callable[[Span], None]):
+        """Tamamlanan her kök iz için çağrılacak fonksiyon ekle"""
+        self._listeners.append(listener)
+
+    def current_span(self) -> Optional[Span]:
+        return _current_span.get()
+
+    @contextmanager
+    def span(self, name: str, **attributes):
+        """Aralık aç; etkin iz yoksa yeni bir kök iz başlatır"""
+        parent = _current_span.get()
+        trace_id = parent.trace_id if parent is not None else next(self._ids)
+        span = Span(name, trace_id, parent, attributes)
+        if parent is not None:
+            parent.children.append(span)
+        else:
+            with self._lock:
+                self._active += 1
+
+        token = _current_span.set(span)
+        try:
+            yield span
+        except BaseException as e:
+            span.error = f"{type(e).__name__}: {str(e)}"
+            raise
+        finally:
+            span.finish()
+            try:
+                _current_span.reset(token)
+            except ValueError:
+                # Async üreteç başka bir bağlamda kapatıldıysa
+                _current_span.set(parent)
+            if parent is None:
+                with self._lock:
+                    self._active -= 1
+                self._record(span)
+
+    @contextmanager
+    def trace(self, name: str, intent: Optional[str] = None, **attributes):
+        """Her çağrı için ayrı kimlikli yeni bir kök iz başlat"""
+        token = _current_span.set(None)
+        try:
+            with self.span(name, **attributes) as root:
+                if intent:
+                    root.intent = intent
+                yield root
+        finally:
+            try:
+                _current_span.reset(token)
+            except ValueError:
+                _current_span.set(None)
+
+    @contextmanager
+    def child_span(self, name: str, **attributes):
+        """Etkin iz varsa altına aralık aç; yoksa yeni kök iz başlatmadan çalıştır"""
+        if _current_span.get() is None:
+            yield None
+            return
+        with self.span(name, **attributes) as span:
+            yield span
+
+    @contextmanager
+    def attach(self, span: Optional[Span]):
+        """Açık bir aralığı bu bağlamda etkin yap (iz başka thread/görevde sürdürülürken)"""
+        token = _current_span.set(span)
+        try:
+            yield span
+        finally:
+            try:
+                _current_span.reset(token)
+            except ValueError:
+                _current_span.set(None)
+
+    def traced(self, name: Optional[str] = None):
+        """Fonksiyonu bir aralık içinde çalıştıran dekoratör"""
+        def decorator(func):
+            span_name = name or func.__name__
+
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                with self.span(span_name):
+                    return func(*args, **kwargs)
+            return wrapper
+        return decorator
+
+    def _record(self, root: Span):
+        """Tamamlanan kök izi sakla ve dinleyicilere ilet"""
+        with self._lock:
+            self._recent.append(root)
+
+        for listener in list(self._listeners):
+            try:
+                listener(root)
+            except Exception as e:
+                self.logger.error(f"İz dinleyici hatası: {str(e)}")
+
+    def get_recent_traces(self, limit: int = 10) -> List[Dict]:
+        """Son tamamlanan izleri ayrıntılarıyla getir"""
+        with self._lock:
+            traces = list(self._recent)[-limit:]
+        return [trace.to_dict() for trace in traces]
@@ -5,7 +5,7 @@ from gtts import gTTS
 import edge_tts
 import asyncio
 import pyttsx3
-from config_manager import ConfigManager
+from config_manager import get_config_manager
 from language_manager import LanguageManager
 import os
 import tempfile
@@ -16,30 +16,11 @@ import logging
 import platform
 import winsound  # Windows için ses çalma
 
-# Loglama ayarları
-log_dir = Path("data/logs")
-log_dir.mkdir(parents=True, exist_ok=True)
-log_file = log_dir / "voice.log"
+from log_pipeline import get_log_pipeline
 
-# Root logger ayarları
+# Loglama: dosya/konsol yazımı günlük hattının yazıcı thread'inde yapılır
+get_log_pipeline()
 logger = logging.getLogger("AICodeEditor")
-logger.setLevel(logging.DEBUG)
-
-# Dosya handler
-file_handler = logging.FileHandler(log_file, encoding='utf-8')
-file_handler.setLevel(logging.DEBUG)
-file_formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
-file_handler.setFormatter(file_formatter)
-
-# Konsol handler
-console_handler = logging.StreamHandler()
-console_handler.setLevel(logging.INFO)
-console_formatter = logging.Formatter('%(levelname)s: %(message)s')
-console_handler.setFormatter(console_formatter)
-
-# Handler'ları ekle
-logger.addHandler(file_handler)
-logger.addHandler(console_handler)
 
 class TTSEngine:
     """Soyut TTS motor sınıfı"""
@@ -141,7 +122,7 @@ class VoiceListener(QObject):
     def __init__(self):
         super().__init__()
         self.logger = logger.getChild("VoiceListener")
-        self.config_manager = ConfigManager()
+        self.config_manager = get_config_manager()
         self.language_manager = LanguageManager()
         
         # Ayarları yükle
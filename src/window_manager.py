@@ -1,7 +1,7 @@
 import pygetwindow as gw
 import screeninfo
 from typing import Dict, List, Optional, Tuple
-from config_manager import ConfigManager
+from config_manager import get_config_manager
 from language_manager import LanguageManager
 import subprocess
 import time
@@ -9,7 +9,7 @@ import logging
 
 class WindowManager:
     def __init__(self):
-        self.config_manager = ConfigManager()
+        self.config_manager = get_config_manager()
         self.language_manager = LanguageManager()
         self.logger = logging.getLogger("AICodeEditor.Window")
         
@@ -0,0 +1,124 @@
+import json
+import os
+import sys
+import threading
+import time
+from collections import deque
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+# Modüller `src` altından düz içe aktarılır (src.x biçimindekiler için proje kökü de eklenir)
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SRC_DIR = os.path.join(PROJECT_ROOT, "src")
+
+for path in (PROJECT_ROOT, SRC_DIR):
+    if path not in sys.path:
+        sys.path.insert(0, path)
+
+def reply(content: str, delay: float = 0):
+    """Tam (stream=false) yanıt gönder"""
+    def action(handler, payload):
+        time.sleep(delay)
+        handler.send_body(200, {"message": {"role": "assistant", "content": content}, "done": True})
+    return action
+
+def status(code: int):
+    """Yalnızca HTTP durum kodu döndür"""
+    def action(handler, payload):
+        handler.send_body(code, {"error": f"HTTP {code}"})
+    return action
+
+def drop():
+    """Yanıt göndermeden bağlantıyı kapat"""
+    def action(handler, payload):
+        handler.close_connection = True
+    return action
+
+def stall(seconds: float, content: str = "geç"):
+    """Yanıtı istemci zaman aşımından sonraya bırak"""
+    return reply(content, delay=seconds)
+
+def stream(chunks, delay: float = 0, drop_after=None):
+    """Parçaları Ollama gibi satır başına bir JSON (NDJSON) olarak gönder; drop_after parçadan sonra kes"""
+    def action(handler, payload):
+        handler.send_response(200)
+        handler.send_header("Content-Type", "application/x-ndjson")
+        handler.send_header("Transfer-Encoding", "chunked")
+        handler.end_headers()
+        for index, chunk in enumerate(chunks):
+            if drop_after is not None and index >= drop_after:
+                handler.close_connection = True
+                return
+            handler.send_chunk({"message": {"role": "assistant", "content": chunk}, "done": False})
+            time.sleep(delay)
+        handler.send_chunk({"message": {"role": "assistant", "content": ""}, "done": True})
+        handler.wfile.write(b"0\r\n\r\n")
+    return action
+
+class _OllamaHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, *args):
+        pass
+
+    def send_body(self, code: int, body: dict):
+        data = json.dumps(body).encode("utf-8")
+        self.send_response(code)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def send_chunk(self, body: dict):
+        data = (json.dumps(body, ensure_ascii=False) + "\n").encode("utf-8")
+        self.wfile.write(f"{len(data):X}\r\n".encode("ascii") + data + b"\r\n")
+        self.wfile.flush()
+
+    def do_POST(self):
+        payload = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))))
+        action = self.server.stub.record(self.client_address, payload)
+        action(self, payload)
+
+class OllamaStub:
+    """/api/chat uç noktasını taklit eden yerel sunucu; yanıtlar sırayla `script`ten alınır"""
+
+    def __init__(self):
+        self.script = deque()
+        self.requests = []
+        self.connections = set()
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), _OllamaHandler)
+        self._server.daemon_threads = True
+        self._server.stub = self
+        self.url = f"http://127.0.0.1:{self._server.server_address[1]}"
+
+    def record(self, client_address, payload):
+        with self._lock:
+            self.requests.append(payload)
+            self.connections.add(client_address)
+            if self.script:
+                return self.script.popleft()
+        return stream(["tamam"]) if payload.get("stream") else reply("tamam")
+
+    def start(self):
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+@pytest.fixture
+def ollama_stub():
+    stub = OllamaStub()
+    stub.start()
+    yield stub
+    stub.stop()
+
+@pytest.fixture
+def model_client(ollama_stub):
+    pytest.importorskip("httpx")
+    from model_client import ModelClient
+    client = ModelClient(host=ollama_stub.url, timeout=5, client_config={"backoff": 0.01, "max_retries": 2})
+    yield client
+    client.close()
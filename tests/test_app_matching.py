@@ -0,0 +1,37 @@
+from app_index import AppIndex
+from intent_router import IntentRouter
+
+# code_agent'taki gibi open_app, pencere ve medya niyetlerinden önce gelir
+INTENTS = (
+    ("open_app", ["aç"]),
+    ("window", ["pencere"]),
+    ("media", ["ses", "müzik"]),
+)
+
+def make_index(tmp_path, *exe_names) -> AppIndex:
+    apps_dir = tmp_path / "apps"
+    apps_dir.mkdir()
+    for name in exe_names:
+        (apps_dir / name).write_bytes(b"")
+    index = AppIndex({
+        "index_file": str(tmp_path / "app_index.json"),
+        "scan_roots": [str(apps_dir)],
+        "scan_registry": False
+    })
+    index.refresh()
+    return index
+
+def test_find_in_text_matches_whole_words_only(tmp_path):
+    index = make_index(tmp_path, "git.exe", "code.exe")
+    assert index.find_in_text("git aç") == "git"
+    assert index.find_in_text("digit aç") is None
+    assert index.find_in_text("vscode'u aç") == "vscode"
+    assert index.find_in_text("visual studio code aç") == "visual studio code"
+
+def test_short_exe_names_do_not_hijack_words(tmp_path):
+    router = IntentRouter(INTENTS, app_index=make_index(tmp_path, "git.exe", "pen.exe", "zik.exe"))
+    assert router.route("git aç").app == "git"
+    assert router.route("digit aç").intent == "unknown"
+    # "pencere" içindeki "pen", "müzik" içindeki "zik" uygulama sayılmaz
+    assert router.route("pencereyi aç").intent == "window"
+    assert router.route("müzik aç").intent == "media"
@@ -0,0 +1,93 @@
+import time
+
+import pytest
+
+from cache_registry import PRIORITY_HIGH, PRIORITY_LOW, PRIORITY_NORMAL, CacheRegistry
+from metrics_collector import MetricsSnapshot
+
+MB = 1024 * 1024
+
+class FakeCache:
+    def __init__(self, size: int):
+        self.bytes = size
+
+    def size(self) -> int:
+        return self.bytes
+
+    def clear(self):
+        self.bytes = 0
+
+def make_registry(**caches):
+    registry = CacheRegistry()
+    for name, (size, priority) in caches.items():
+        cache = FakeCache(size)
+        caches[name] = cache
+        registry.register(name, cache.size, cache.clear, priority)
+    return registry, caches
+
+def test_evicts_low_priority_and_larger_caches_first():
+    registry, caches = make_registry(
+        context=(5 * MB, PRIORITY_HIGH), small=(1 * MB, PRIORITY_NORMAL),
+        large=(3 * MB, PRIORITY_NORMAL), scratch=(2 * MB, PRIORITY_LOW)
+    )
+    report = registry.evict(target_bytes=4 * MB)
+    # Hedefe ulaşılınca durulur: düşük öncelik, ardından aynı öncelikte büyük olan
+    assert [item["name"] for item in report["evicted"]] == ["scratch", "large"]
+    assert report["reclaimed_bytes"] == 5 * MB
+    assert caches["small"].bytes and caches["context"].bytes
+
+def test_max_priority_protects_high_priority_caches():
+    registry, caches = make_registry(context=(5 * MB, PRIORITY_HIGH), scratch=(1 * MB, PRIORITY_LOW))
+    report = registry.evict(target_bytes=10 * MB, max_priority=PRIORITY_NORMAL)
+    assert [item["name"] for item in report["evicted"]] == ["scratch"]
+    assert caches["context"].bytes == 5 * MB
+
+def test_dead_owners_are_dropped():
+    registry = CacheRegistry()
+    cache = FakeCache(MB)
+    registry.register("gone", cache.size, cache.clear)
+    del cache
+    assert registry.sizes() == []
+
+performance_manager = pytest.importorskip("performance_manager")
+
+class IdleJanitor:
+    def run_in_background(self, **kwargs):
+        return False
+
+def make_manager(registry):
+    """Yalnızca bellek kontrolü yolunu kuran performans yöneticisi"""
+    manager = performance_manager.PerformanceManager.__new__(performance_manager.PerformanceManager)
+    manager.logger = performance_manager.logging.getLogger("test")
+    manager.cache_registry = registry
+    manager.janitor = IdleJanitor()
+    manager.last_eviction = None
+    manager.eviction_cooldown = 60
+    manager._last_eviction_at = None
+    manager.resource_limits = {
+        "max_memory_percent": 80, "max_cpu_percent": 101, "max_disk_percent": 101, "memory_cleanup_threshold": 70
+    }
+    return manager
+
+def snapshot(memory_percent: float, process_rss: int, timestamp: float) -> MetricsSnapshot:
+    return MetricsSnapshot(timestamp, 0.0, memory_percent, 2048 * MB, 0.0, None, None, process_rss)
+
+def test_eviction_target_is_the_process_share_and_cools_down():
+    registry, caches = make_registry(
+        context=(40 * MB, PRIORITY_HIGH), scratch=(4 * MB, PRIORITY_LOW), index=(20 * MB, PRIORITY_NORMAL)
+    )
+    manager = make_manager(registry)
+    now = time.time()
+
+    # %90 doluluk, başka uygulamalardan; süreç 100 MB -> hedef 100 * 20 / 90 ≈ 22 MB
+    manager._check_resource_usage(snapshot(90, 100 * MB, now))
+    assert [item["name"] for item in manager.last_eviction["evicted"]] == ["scratch", "index"]
+    assert caches["context"].bytes == 40 * MB
+
+    # Bekleme süresi dolmadan sonraki ölçümler yeniden boşaltmaz
+    caches["scratch"].bytes = 4 * MB
+    manager._check_resource_usage(snapshot(95, 100 * MB, now + 5))
+    assert caches["scratch"].bytes == 4 * MB
+
+    manager._check_resource_usage(snapshot(95, 100 * MB, now + 61))
+    assert caches["scratch"].bytes == 0
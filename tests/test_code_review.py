@@ -0,0 +1,38 @@
+import pytest
+
+code_agent = pytest.importorskip("code_agent")
+from config_manager import get_config_manager
+from intent_router import RouteResult
+from sampling_profiler import SamplingProfiler
+from slow_command_recorder import SlowCommandRecorder
+
+class AllowAll:
+    def verify_command(self, command):
+        return True
+
+class ReviewRouter:
+    def route(self, command):
+        return RouteResult("review")
+
+class RecordingReviewer:
+    targets = []
+
+    def __init__(self, ask, config):
+        pass
+
+    def review(self, target):
+        self.targets.append(target)
+        return "rapor"
+
+def test_batch_review_keeps_path_case(tmp_path, monkeypatch):
+    monkeypatch.setattr(code_agent, "BatchReviewer", RecordingReviewer)
+    agent = code_agent.CodeEditorAgent.__new__(code_agent.CodeEditorAgent)
+    agent.driver = None
+    agent._subsystems = {"security_manager": AllowAll(), "intent_router": ReviewRouter()}
+    agent.config_manager = get_config_manager()
+    agent.tracer = code_agent.get_tracer()
+    agent.profiler = SamplingProfiler({"auto": False})
+    agent.slow_commands = SlowCommandRecorder({"enabled": False, "directory": str(tmp_path)})
+
+    assert agent.process_command("Toplu incele C:/Projeler/MyApp/src") == "rapor"
+    assert RecordingReviewer.targets == ["C:/Projeler/MyApp/src"]
@@ -0,0 +1,70 @@
+import pytest
+
+import command_patterns
+from command_patterns import PATTERNS
+
+@pytest.fixture(autouse=True)
+def fresh_caches():
+    command_patterns.clear_caches()
+    yield
+    command_patterns.clear_caches()
+
+@pytest.mark.parametrize("text, video_id", [
+    ("youtube.com/watch?v=dQw4w9WgXcQ aç", "dQw4w9WgXcQ"),
+    ("https://www.youtube.com/watch?v=abc123&t=42", "abc123"),
+    ("youtu.be/xyz789 oynat", "xyz789"),
+    ("youtube.com/playlist?list=PL42", "PL42"),
+    ("youtube'da müzik aç", None),
+])
+def test_extract_youtube_id(text, video_id):
+    assert command_patterns.extract_youtube_id(text) == video_id
+
+def test_extract_url_from_command():
+    assert command_patterns.extract_url_from_command("aç github.com/user/repo") == "https://github.com/user/repo"
+    assert command_patterns.extract_url_from_command("https://example.com/a git") == "https://example.com/a"
+    assert command_patterns.extract_url_from_command("bir şey söyle") is None
+
+def test_path_url_and_coordinates():
+    assert command_patterns.extract_path("C:/projeler/main.py dosyasını aç") == "C:/projeler/main.py"
+    assert command_patterns.extract_path("dosyayı aç") == ""
+    assert command_patterns.extract_url("www.google.com adresine git") == "www.google.com"
+    assert command_patterns.extract_url("python.org aç") == "https://python.org"
+    assert command_patterns.extract_coordinates("500,300 koordinatlarına tıkla") == (500, 300)
+    assert command_patterns.extract_coordinates("a,b tıkla") is None
+
+@pytest.mark.parametrize("command, amount", [
+    ("aşağı kaydır", -3),
+    ("yukarı kaydır", 3),
+    ("sayfayı 5 aşağı kaydır", -5),
+    ("sayfayı 5 yukarı kaydır", 5),
+])
+def test_extract_scroll_amount(command, amount):
+    assert command_patterns.extract_scroll_amount(command) == amount
+
+def test_target_text_and_speech_cleanup():
+    assert command_patterns.extract_target_text('kaydet "Tamam" butonuna tıkla') == "Tamam"
+    assert command_patterns.extract_target_text("tıkla") == ""
+    assert command_patterns.clean_text_for_speech("Görev 😀 eklendi → #1 `yüksek`") == "Görev  eklendi ok 1 yüksek"
+
+def test_single_patterns_used_by_dispatch():
+    assert PATTERNS["timer_amount"].search("5 dakika sonra").groups() == ("5", "dakika")
+    assert PATTERNS["reminder_text"].search("toplantıyı hatırlat yarın 2 saat sonra").group(1) == "yarın 2"
+    assert PATTERNS["reminder_when"].search("2 saat sonra").groups() == ("2", "saat")
+    assert PATTERNS["task_title"].search("görev rapor yaz öncelik yüksek").group(1) == "rapor yaz"
+    assert PATTERNS["task_priority"].search("öncelik Yüksek").group(1) == "Yüksek"
+    assert PATTERNS["task_id"].search("görev 12 tamamlandı").group(1) == "12"
+    assert PATTERNS["batch_target"].search("Toplu incele C:/Projeler/MyApp").group(1) == "C:/Projeler/MyApp"
+
+def test_extractors_are_cached_per_text():
+    command_patterns.extract_path("a/b.py aç")
+    command_patterns.extract_path("a/b.py aç")
+    info = command_patterns.get_cache_info()["path"]
+    assert (info["hits"], info["misses"], info["size"]) == (1, 1, 1)
+
+    command_patterns.clear_caches()
+    assert command_patterns.get_cache_info()["path"]["size"] == 0
+
+def test_benchmark_covers_every_extractor():
+    results = command_patterns.benchmark(iterations=10)
+    assert set(results) == set(command_patterns.EXTRACTORS)
+    assert all(result["uncached_us"] > 0 and result["cached_us"] > 0 for result in results.values())
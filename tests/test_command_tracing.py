@@ -0,0 +1,161 @@
+import asyncio
+import time
+
+import pytest
+
+code_agent = pytest.importorskip("code_agent")
+from intent_router import RouteResult
+from sampling_profiler import SamplingProfiler
+from slow_command_recorder import SlowCommandRecorder
+from tracer import get_tracer
+
+class AllowAll:
+    def verify_command(self, command):
+        return True
+
+class FixedRouter:
+    def __init__(self, intent):
+        self.intent = intent
+
+    def route(self, command):
+        return RouteResult(self.intent)
+
+def make_agent(intent, result_factory, tmp_path):
+    """Ağır alt sistemler olmadan yalnızca komut işleme yolunu kuran ajan"""
+    agent = code_agent.CodeEditorAgent.__new__(code_agent.CodeEditorAgent)
+    agent._subsystems = {"security_manager": AllowAll(), "intent_router": FixedRouter(intent)}
+    agent.tracer = get_tracer()
+    agent.profiler = SamplingProfiler({"auto": False, "output_dir": str(tmp_path / "profiles")})
+    agent.slow_commands = SlowCommandRecorder({"enabled": False, "directory": str(tmp_path / "slow")})
+    agent.driver = None
+    agent._dispatch_intent = lambda command, route, original=None: result_factory()
+    return agent
+
+@pytest.fixture
+def finished(monkeypatch):
+    """Tamamlanan kök izleri topla"""
+    traces = []
+    tracer = get_tracer()
+    tracer.add_listener(traces.append)
+    yield traces
+    tracer._listeners.remove(traces.append)
+
+def test_trace_covers_awaited_model_response(tmp_path, finished):
+    async def answer():
+        await asyncio.sleep(0.05)
+        return "yanıt"
+
+    agent = make_agent("development", answer, tmp_path)
+    response = agent.process_command("kodu geliştir")
+    # Yanıt tüketilmeden iz kapanmaz
+    assert not [trace for trace in finished if trace.name == "command"]
+
+    assert asyncio.run(response) == "yanıt"
+    trace = next(trace for trace in finished if trace.name == "command")
+    assert trace.intent == "development"
+    assert trace.duration >= 0.05
+    assert [child.name for child in trace.children][-1] == "response"
+    assert get_tracer().active_traces == 0
+
+def test_trace_covers_streamed_model_response(tmp_path, finished):
+    async def chunks():
+        for chunk in ("Merhaba. ", "Nasılsın?"):
+            await asyncio.sleep(0.02)
+            yield chunk
+
+    async def consume(stream):
+        return [chunk async for chunk in stream]
+
+    agent = make_agent("unknown", chunks, tmp_path)
+    assert asyncio.run(consume(agent.process_command("merhaba"))) == ["Merhaba. ", "Nasılsın?"]
+    trace = next(trace for trace in finished if trace.name == "command")
+    assert trace.duration >= 0.04
+    assert get_tracer().active_traces == 0
+    # Çağıranın bağlamında iz açık kalmaz
+    assert get_tracer().current_span() is None
+
+class ChunkClient:
+    """Parçaları sırayla üreten model istemcisi"""
+
+    def __init__(self, chunks):
+        self.chunks = chunks
+
+    async def stream_chat(self, **kwargs):
+        for chunk in self.chunks:
+            await asyncio.sleep(0)
+            yield chunk
+
+class SilentEngine:
+    def say(self, text):
+        pass
+
+    def runAndWait(self):
+        pass
+
+def test_abandoned_stream_closes_its_trace(tmp_path, finished):
+    agent = make_agent("unknown", None, tmp_path)
+    agent._subsystems["model_client"] = ChunkClient(["Bir. ", "İki. ", "Üç."])
+    agent.context = code_agent.ConversationContext("", budget=1000)
+    agent.model, agent.temperature, agent.max_tokens = "test", 0.0, 100
+    agent.context_window = 1000
+    agent.speak_streamed = False
+    agent.logger = code_agent.logging.getLogger("test")
+
+    async def first_chunk():
+        async with code_agent.aclosing(agent.stream_response("say")) as stream:
+            async for chunk in stream:
+                return chunk
+
+    assert asyncio.run(first_chunk()) == "Bir. "
+    assert get_tracer().active_traces == 0
+    assert [trace.name for trace in finished] == ["llm_stream"]
+
+def test_speech_outside_command_opens_no_root_trace(tmp_path, finished):
+    agent = make_agent("unknown", None, tmp_path)
+    agent._subsystems["tts_engine"] = SilentEngine()
+    agent.logger = code_agent.logging.getLogger("test")
+    agent.speak("merhaba")
+    assert finished == []
+
+    with get_tracer().trace("command") as trace:
+        agent.speak("merhaba")
+    assert [child.name for child in trace.children] == ["tts"]
+
+def test_auto_profile_covers_awaited_model_response(tmp_path, finished):
+    async def slow_answer():
+        await asyncio.sleep(0.3)
+        return "yanıt"
+
+    agent = make_agent("development", slow_answer, tmp_path)
+    agent.profiler = SamplingProfiler({
+        "latency_threshold": 0.05, "auto_duration": 5, "auto_cooldown": 0,
+        "output_dir": str(tmp_path / "profiles")
+    })
+    assert asyncio.run(agent.process_command("kodu geliştir")) == "yanıt"
+    # Yavaş iş bitince oturum kapanır ve profil yazılır
+    assert not agent.profiler.running
+    assert agent.profiler.last_session.reason == "auto-command"
+    assert agent.profiler.last_session.samples > 0
+
+def test_slow_model_response_is_recorded(tmp_path, finished):
+    async def slow_answer():
+        await asyncio.sleep(0.3)
+        return "yanıt"
+
+    agent = make_agent("development", slow_answer, tmp_path)
+    agent.slow_commands = SlowCommandRecorder({"budget": 0.1, "directory": str(tmp_path / "slow")})
+    assert asyncio.run(agent.process_command("kodu geliştir")) == "yanıt"
+
+    report = agent.slow_commands.reports[-1]
+    assert report["intent"] == "development"
+    assert report["duration_ms"] >= 300
+    assert "response" in [row["span"] for row in report["spans"]]
+    # Yığınlar model yanıtı beklenirken, bütçe dolduğunda alınır
+    assert report["stacks"]["after_ms"] == 100
+    assert report["stacks"]["threads"][0]["command_thread"]
+
+def test_slow_stream_outside_command_is_recorded(tmp_path, finished):
+    recorder = SlowCommandRecorder({"budget": 0.05, "directory": str(tmp_path / "slow")})
+    with get_tracer().span("llm_stream"):
+        time.sleep(0.1)
+    assert recorder.reports[-1]["intent"] == "llm_stream"
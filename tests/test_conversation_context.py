@@ -0,0 +1,13 @@
+from conversation_context import ConversationContext, estimate_tokens
+
+def prompt_tokens(messages) -> int:
+    return sum(estimate_tokens(message["content"]) + 4 for message in messages)
+
+def test_full_prompt_leaves_room_for_the_response():
+    context = ConversationContext("sistem talimatı", budget=4096, response_reserve=1024)
+    for index in range(200):
+        context.add("user", f"soru {index} " + "x" * 400)
+        context.add("assistant", f"yanıt {index} " + "y" * 400)
+
+    messages = context.build_messages("son soru " + "z" * 20000)
+    assert prompt_tokens(messages) + context.response_reserve <= context.budget
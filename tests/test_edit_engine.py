@@ -0,0 +1,43 @@
+from conversation_context import estimate_tokens
+from edit_engine import EditEngine
+
+def make_source(functions: int = 60) -> str:
+    lines = []
+    for index in range(functions):
+        lines.append(f"def func_{index}(x):\n")
+        lines.extend(f"    value_{j} = compute(x, {j}) + other_call(x)\n" for j in range(12))
+        lines.append("    return x\n\n")
+    return "".join(lines)
+
+def test_prompt_fits_token_budget():
+    engine = EditEngine(max_prompt_lines=400, max_prompt_tokens=1500)
+    prompt, regions = engine.build_prompt("a.py", make_source(), "func_42 fonksiyonunu hızlandır")
+    assert estimate_tokens(prompt) <= 1500
+    assert [region.name for region in regions] == ["func_42"]
+
+def test_small_file_is_sent_whole_only_when_it_fits():
+    source = make_source(5)
+    engine = EditEngine(max_prompt_tokens=4000)
+    assert [region.name for region in engine.build_prompt("a.py", source, "düzelt")[1]] == ["<tüm dosya>"]
+
+    engine = EditEngine(max_prompt_tokens=600)
+    prompt, regions = engine.build_prompt("a.py", source, "düzelt")
+    assert "<tüm dosya>" not in [region.name for region in regions]
+    assert estimate_tokens(prompt) <= 600
+
+def test_insertion_hunk_goes_after_its_start_line():
+    engine = EditEngine()
+    content = "a\nb\nc\n"
+    diff = "@@ -2,0 +3,1 @@\n+yeni\n"
+    assert engine.apply_hunks(content, engine.parse_diff(diff))[0] == "a\nb\nyeni\nc\n"
+    diff = "@@ -0,0 +1,1 @@\n+ilk\n"
+    assert engine.apply_hunks(content, engine.parse_diff(diff))[0] == "ilk\na\nb\nc\n"
+
+def test_apply_keeps_crlf_line_endings(tmp_path):
+    engine = EditEngine()
+    path = tmp_path / "a.py"
+    path.write_bytes(b"x = 1\r\ny = 2\r\nz = 3\r\n")
+    content = engine.read(str(path))
+    diff = "@@ -2,1 +2,1 @@\n-y = 2\n+y = 20\n"
+    engine.apply(str(path), content, diff)
+    assert path.read_bytes() == b"x = 1\r\ny = 20\r\nz = 3\r\n"
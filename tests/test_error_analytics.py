@@ -0,0 +1,90 @@
+from collections import Counter
+from datetime import timedelta
+
+import pytest
+
+from error_analytics import BucketIndex, BucketTier, parse_time_window, slope
+
+KEY = ("ValueError", "ERROR", "abc")
+OTHER = ("KeyError", "ERROR", "def")
+
+def test_bucket_tier_expires_buckets_outside_its_slots():
+    tier = BucketTier("minute", 60, 3)
+    assert tier.add(0, KEY) == []
+    assert tier.add(70, KEY) == []
+    assert tier.add(130, OTHER) == []
+
+    # Dördüncü dakika açılınca ilk kova saklama dışına düşer
+    assert tier.add(185, KEY) == [Counter({KEY: 1})]
+    assert sorted(tier.buckets) == [1, 2, 3]
+
+    # İki kova birden atlanınca ikisi de düşer
+    expired = tier.add(5 * 60, KEY, 2)
+    assert expired == [Counter({KEY: 1}), Counter({OTHER: 1})]
+    assert sorted(tier.buckets) == [3, 5]
+
+def test_bucket_tier_ignores_events_older_than_retention():
+    tier = BucketTier("minute", 60, 3)
+    tier.add(10 * 60, KEY)
+    assert tier.add(7 * 60, KEY) == []
+    assert 7 not in tier.buckets
+    # Saklama içindeki geç gelen olay eski kovasına eklenir
+    tier.add(8 * 60, KEY)
+    assert tier.buckets[8] == Counter({KEY: 1})
+    assert tier.latest == 10
+
+def test_bucket_tier_series_fills_missing_buckets():
+    tier = BucketTier("minute", 60, 5)
+    tier.add(60, KEY, 2)
+    tier.add(180, KEY)
+    series = tier.series(now=200, count=4)
+    assert [sum(bucket.values()) for bucket in series] == [0, 2, 0, 1]
+
+def test_bucket_tier_round_trips_through_dict():
+    tier = BucketTier("minute", 60, 3)
+    tier.add(60, KEY, 2)
+    tier.add(120, OTHER)
+    loaded = BucketTier("minute", 60, 3)
+    loaded.load(tier.to_dict())
+    assert loaded.latest == tier.latest
+    assert loaded.buckets == tier.buckets
+
+def test_index_reports_buckets_leaving_the_coarsest_tier():
+    expired = []
+    index = BucketIndex((("minute", 60, 2), ("hour", 3600, 2)), on_expire=expired.append)
+    index.add(0, KEY)
+    # Dakika katmanından düşmek yetmez
+    index.add(5 * 60, KEY)
+    assert expired == []
+    index.add(2 * 3600, OTHER)
+    assert expired == [Counter({KEY: 2})]
+    assert index.retention == 2 * 3600
+
+def test_index_selects_finest_covering_tier():
+    index = BucketIndex()
+    assert index.select_tier(15 * 60).name == "minute"
+    assert index.select_tier(24 * 3600).name == "hour"
+    assert index.select_tier(7 * 86400).name == "hour"
+    assert index.select_tier(30 * 86400).name == "day"
+    # Saklamadan uzun pencereler en kaba katmanla sınırlanır
+    tier, series = index.window_series(365 * 86400, now=0)
+    assert tier.name == "day" and len(series) == tier.slots
+
+@pytest.mark.parametrize("text, expected", [
+    ("15m", timedelta(minutes=15)),
+    (" 24h ", timedelta(hours=24)),
+    ("7d", timedelta(days=7)),
+    ("30s", timedelta(seconds=30)),
+])
+def test_parse_time_window(text, expected):
+    assert parse_time_window(text) == expected
+
+@pytest.mark.parametrize("text", ["", "24", "1w", "h24"])
+def test_parse_time_window_rejects_invalid(text):
+    with pytest.raises(ValueError):
+        parse_time_window(text)
+
+def test_slope():
+    assert slope([5]) == 0.0
+    assert slope([1, 2, 3, 4]) == pytest.approx(1.0)
+    assert slope([3, 3, 3]) == 0.0
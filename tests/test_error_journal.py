@@ -0,0 +1,72 @@
+import os
+from datetime import datetime, timedelta
+
+from error_journal import INDEX_ENTRY, ErrorJournal
+
+START = datetime(2026, 1, 1, 12, 0, 0)
+
+def record(number: int) -> dict:
+    return {"id": number, "timestamp": (START + timedelta(minutes=number)).isoformat(), "message": f"hata {number}"}
+
+def fill(journal: ErrorJournal, count: int):
+    for number in range(count):
+        journal.append(record(number))
+
+def test_tail_get_and_since(tmp_path):
+    journal = ErrorJournal(tmp_path / "errors.jsonl")
+    fill(journal, 10)
+
+    assert [item["id"] for item in journal.tail(3)] == [7, 8, 9]
+    assert journal.get(0)["id"] == 0
+    assert journal.get(-1)["id"] == 9
+    assert journal.get(10) is None
+    since = (START + timedelta(minutes=6)).timestamp()
+    assert [item["id"] for item in journal.since(since)] == [6, 7, 8, 9]
+    journal.close()
+
+def test_rotation_keeps_reads_across_segments(tmp_path):
+    journal = ErrorJournal(tmp_path / "errors.jsonl", max_bytes=300, backups=2)
+    fill(journal, 12)
+
+    assert (tmp_path / "errors.1.jsonl").exists()
+    ids = [item["id"] for item in journal.iter_records()]
+    # En eski parça silinir; kalanlar sırayla okunur
+    assert ids == sorted(ids) and ids[-1] == 11
+    assert [item["id"] for item in journal.tail(5)] == [7, 8, 9, 10, 11]
+    assert [item["id"] for item in journal.since((START + timedelta(minutes=9)).timestamp())] == [9, 10, 11]
+    journal.close()
+
+def test_half_written_line_is_dropped_and_index_rebuilt(tmp_path):
+    path = tmp_path / "errors.jsonl"
+    journal = ErrorJournal(path)
+    fill(journal, 5)
+    journal.close()
+
+    # Son satır yazılırken kesilmiş gibi
+    os.truncate(path, path.stat().st_size - 10)
+    journal = ErrorJournal(path)
+    assert len(journal) == 4
+    assert journal.get(-1)["id"] == 3
+    assert path.read_bytes().endswith(b"\n")
+
+    journal.append(record(4))
+    assert [item["id"] for item in journal.tail(2)] == [3, 4]
+    journal.close()
+
+def test_truncated_or_missing_index_is_rebuilt(tmp_path):
+    path = tmp_path / "errors.jsonl"
+    journal = ErrorJournal(path)
+    fill(journal, 6)
+    journal.close()
+
+    index_path = path.with_suffix(".idx")
+    os.truncate(index_path, 2 * INDEX_ENTRY.size + 3)
+    journal = ErrorJournal(path)
+    assert len(journal) == 6
+    assert journal.get(4)["id"] == 4
+    journal.close()
+
+    index_path.unlink()
+    journal = ErrorJournal(path)
+    assert [item["id"] for item in journal.tail(2)] == [4, 5]
+    journal.close()
@@ -0,0 +1,63 @@
+import json
+
+import pytest
+
+from error_service import ErrorService, fingerprint
+
+TRACE = '''Traceback (most recent call last):
+  File "/repo/src/code_agent.py", line {line}, in edit_file
+  File "/repo/src/edit_engine.py", line 88, in apply
+ValueError: hunk uygulanamadı
+'''
+
+@pytest.fixture
+def service(tmp_path, monkeypatch):
+    # Eski hata dosyaları çalışma dizinine göre aranır
+    monkeypatch.chdir(tmp_path)
+    return ErrorService({"path": str(tmp_path / "errors.jsonl"), "tail_size": 3})
+
+def test_fingerprint_ignores_line_numbers_and_values():
+    assert fingerprint("ValueError", TRACE.format(line=10)) == fingerprint("ValueError", TRACE.format(line=99))
+    assert fingerprint("ValueError", TRACE.format(line=10)) != fingerprint("KeyError", TRACE.format(line=10))
+    assert fingerprint("Error", "", "port 8080 meşgul: 'a.py'") == fingerprint("Error", "", "port 9090 meşgul: 'b.py'")
+
+def test_repeats_are_counted_once_and_trace_written_once(service, tmp_path):
+    first = service.record(ValueError("hunk uygulanamadı"), trace=TRACE.format(line=10))
+    second = service.record(ValueError("hunk uygulanamadı"), trace=TRACE.format(line=12))
+    assert first["fingerprint"] == second["fingerprint"]
+    assert service.fingerprints[first["fingerprint"]]["count"] == 2
+    assert service.get_traceback(first["fingerprint"]) == TRACE.format(line=10)
+
+    lines = [json.loads(line) for line in (tmp_path / "errors.jsonl").read_text(encoding="utf-8").splitlines()]
+    assert [bool(line["traceback"]) for line in lines] == [True, False]
+
+def test_analysis_and_recent_summary(service):
+    service.record(ValueError("a"), trace="")
+    service.record(KeyError("b"), trace="", severity="CRITICAL")
+    service.record(ValueError("a"), trace="")
+
+    analysis = service.analyze_errors("15m")
+    assert analysis["resolution"] == "minute"
+    assert analysis["total_errors"] == 3
+    assert analysis["error_types"] == {"ValueError": 2, "KeyError": 1}
+    assert analysis["most_common"] == ("ValueError", 2)
+    assert len(analysis["critical_errors"]) == 1
+
+    service.record(OSError("c"), trace="")
+    summary = service.get_recent_summary()
+    # Kuyruk üç kayıt tutar; en eski ValueError düşer
+    assert summary["common_errors"] == {"KeyError": 1, "ValueError": 1, "OSError": 1}
+
+def test_reopen_counts_only_records_after_saved_analytics(service, tmp_path):
+    service.record(ValueError("a"), trace="")
+    service.record(ValueError("a"), trace="")
+    service.save_analytics()
+    # Kaydedilmiş indeksten sonra yalnızca günlüğe yazılan kayıt
+    service.record(ValueError("a"), trace="")
+    service.journal.close()
+
+    reopened = ErrorService({"path": str(tmp_path / "errors.jsonl")})
+    assert reopened.analyze_errors("1h")["total_errors"] == 3
+    assert sum(entry["count"] for entry in reopened.fingerprints.values()) == 3
+    assert len(reopened.recent) == 3
+    reopened.journal.close()
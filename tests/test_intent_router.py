@@ -0,0 +1,50 @@
+import pytest
+
+from intent_router import IntentRouter, KeywordMatcher
+
+code_agent = pytest.importorskip("code_agent")
+
+@pytest.fixture(scope="module")
+def router():
+    return IntentRouter(code_agent.CodeEditorAgent.INTENT_KEYWORDS)
+
+def test_keyword_matcher_finds_overlapping_keywords():
+    matcher = KeywordMatcher()
+    for word in ("yaz", "yazdır", "metin gir"):
+        matcher.add(word, word)
+    assert [(start, word) for start, word, _ in matcher.iter_matches("metin yazdır")] == [(6, "yaz"), (6, "yazdır")]
+
+@pytest.mark.parametrize("command, intent", [
+    ("başlangıç raporu", "startup_report"),
+    ("profil başlat", "profile"),
+    ("google'da hava durumu ara", "web_search"),
+    # Listede önce gelen niyet kazanır
+    ("youtube'da müzik aç", "youtube"),
+    ("yeni fonksiyon yaz", "development"),
+    ("metin gir merhaba", "type_text"),
+    ("kodu geliştirir misin", "development"),
+])
+def test_routes_by_keyword_priority(router, command, intent):
+    assert router.route(command).intent == intent
+
+@pytest.mark.parametrize("command, intent", [
+    # Yol ve dosya adlarındaki anahtar kelimeler niyet sayılmaz
+    ("src/profiler.py dosyasını incele", "review"),
+    ("googleapi.py dosyasını incele", "review"),
+    ("C:\\Projeler\\youtube_indirici klasörünü incele", "review"),
+    ("user_profile ayarını geliştir", "development"),
+    # Kelime ortasındaki eşleşmeler sayılmaz
+    ("bunu kaçırma", "unknown"),
+    # Ekli kelimeler eşleşir
+    ("bilgisayarı yeniden başlat", "system"),
+])
+def test_keywords_match_at_word_start_outside_paths(router, command, intent):
+    assert router.route(command).intent == intent
+
+def test_explain_lists_matches_and_decision(router):
+    text = router.explain("profil raporunu incele")
+    lines = text.splitlines()
+    assert lines[0] == "🧭 'profil raporunu incele' → profile"
+    assert "- profile: profil" in lines
+    assert "- review: incele" in lines
+    assert any(line.strip().startswith("profile: ['profil'] eşleşti") for line in lines)
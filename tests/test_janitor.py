@@ -0,0 +1,101 @@
+import os
+import time
+
+import janitor as janitor_module
+from janitor import Janitor
+
+WEEK_AGO = time.time() - 8 * 86400
+
+def make_janitor(tmp_path, **logs):
+    return Janitor({
+        "temp": [],
+        "logs": {"directories": [str(tmp_path / "logs")], "archive_dir": str(tmp_path / "archive"), **logs},
+        "throttle": {"pause": 0, "bytes_per_second": 0}
+    }, is_busy=lambda: False)
+
+def write_log(path, text="satır\n", mtime=WEEK_AGO):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text, encoding="utf-8")
+    os.utime(path, (mtime, mtime))
+    return path
+
+def test_only_rotated_logs_are_archived(tmp_path):
+    live = write_log(tmp_path / "logs" / "voice.log")
+    rotated = write_log(tmp_path / "logs" / "voice.log.1")
+
+    result = make_janitor(tmp_path).archive_logs()
+
+    # Handler'ın açık tuttuğu canlı dosya eski olsa da yerinde kalır
+    assert result["logs_archived"] == 1
+    assert live.exists()
+    assert not rotated.exists()
+    assert [path.name for path in (tmp_path / "archive").iterdir()][0].startswith("voice.log.1.")
+
+def test_archive_is_rolled_back_when_source_cannot_be_removed(tmp_path, monkeypatch):
+    rotated = write_log(tmp_path / "logs" / "debug.log.2")
+    real_unlink = os.unlink
+
+    def locked_unlink(path, *args, **kwargs):
+        if os.fspath(path) == str(rotated):
+            raise PermissionError("dosya kullanımda")
+        return real_unlink(path, *args, **kwargs)
+
+    monkeypatch.setattr(janitor_module.os, "unlink", locked_unlink)
+    cleaner = make_janitor(tmp_path)
+    for _ in range(2):
+        assert cleaner.archive_logs()["logs_archived"] == 0
+
+    # Her turda yeni bir kopya birikmez
+    assert rotated.exists()
+    assert list((tmp_path / "archive").iterdir()) == []
+
+def age(path, seconds):
+    mtime = time.time() - seconds
+    os.utime(path, (mtime, mtime))
+    return path
+
+def test_clean_directory_removes_files_and_empty_dirs_past_age(tmp_path):
+    root = tmp_path / "temp"
+    old = write_log(root / "eski.tmp", mtime=time.time() - 3 * 3600)
+    nested = write_log(root / "a" / "b" / "eski.tmp", mtime=time.time() - 3 * 3600)
+    fresh = write_log(root / "yeni.tmp", mtime=time.time())
+    for directory in (root / "a" / "b", root / "a"):
+        age(directory, 3 * 3600)
+    (root / "yeni_dizin").mkdir()
+
+    result = make_janitor(tmp_path).clean_directory(root, max_age_hours=2)
+
+    assert not old.exists() and not nested.exists()
+    assert fresh.exists()
+    # İçi boşalan eski dizinler en derinden başlayarak kaldırılır, yeni dizin kalır
+    assert not (root / "a").exists()
+    assert (root / "yeni_dizin").exists() and root.exists()
+    assert result["files_removed"] == 2 and result["dirs_removed"] == 2
+    assert result["bytes_freed"] == 2 * len("satır\n".encode("utf-8"))
+
+def test_clean_directory_keeps_byte_budget_removing_oldest_first(tmp_path):
+    root = tmp_path / "temp"
+    files = [write_log(root / f"{index}.tmp", "x" * 100, mtime=time.time() - (10 - index) * 60) for index in range(5)]
+
+    result = make_janitor(tmp_path).clean_directory(root, max_bytes=250)
+
+    assert [path.exists() for path in files] == [False, False, False, True, True]
+    assert result["files_removed"] == 3 and result["bytes_freed"] == 300
+
+def test_clean_directory_without_age_limit_leaves_dirs(tmp_path):
+    root = tmp_path / "temp"
+    (root / "bos").mkdir(parents=True)
+    age(root / "bos", 30 * 86400)
+    result = make_janitor(tmp_path).clean_directory(root, max_bytes=0)
+    assert (root / "bos").exists() and result["dirs_removed"] == 0
+
+def test_archive_is_pruned_by_age_and_bytes(tmp_path):
+    archive = tmp_path / "archive"
+    expired = write_log(archive / "debug.log.1.20250101-000000.gz", "x" * 100, mtime=time.time() - 100 * 86400)
+    older = write_log(archive / "debug.log.1.20260101-000000.gz", "x" * 100, mtime=time.time() - 20 * 86400)
+    newer = write_log(archive / "debug.log.1.20260201-000000.gz", "x" * 100, mtime=time.time() - 10 * 86400)
+
+    result = make_janitor(tmp_path, archive_max_bytes=150).archive_logs()
+
+    assert not expired.exists() and not older.exists() and newer.exists()
+    assert result["archive"]["files_removed"] == 2
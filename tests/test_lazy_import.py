@@ -0,0 +1,47 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
+from conftest import PROJECT_ROOT, SRC_DIR
+
+# code_agent içe aktarma bütçesi (ms); yavaş makinelerde ortam değişkeniyle yükseltilebilir
+IMPORT_BUDGET_MS = float(os.environ.get("IMPORT_BUDGET_MS", 1000))
+# Yalnızca ilgili işleyici ilk kez çalıştığında yüklenmesi gereken modüller
+DEFERRED_MODULES = {
+    "cv2", "numpy", "pytesseract", "selenium", "pyautogui", "sounddevice",
+    "screen_brightness_control", "pyttsx3", "PIL", "win32com", "pygetwindow"
+}
+
+def import_times(module: str):
+    """Modülü ayrı süreçte `-X importtime` ile içe aktar; {modül: kümülatif µs} döndür"""
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join([PROJECT_ROOT, SRC_DIR]))
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=PROJECT_ROOT, env=env, capture_output=True, text=True, timeout=120
+    )
+    if result.returncode != 0:
+        missing = [line for line in result.stderr.splitlines() if "ModuleNotFoundError" in line]
+        if missing:
+            pytest.skip(f"Bağımlılık eksik: {missing[-1]}")
+        pytest.fail(result.stderr)
+
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line.split("|")
+        if cumulative.strip().isdigit():
+            times[name.strip()] = int(cumulative)
+    return times
+
+def test_code_agent_import_within_budget():
+    times = import_times("code_agent")
+    total_ms = times["code_agent"] / 1000
+    assert total_ms <= IMPORT_BUDGET_MS, f"code_agent içe aktarma {total_ms:.0f} ms > bütçe {IMPORT_BUDGET_MS:.0f} ms"
+
+def test_heavy_modules_are_deferred():
+    times = import_times("code_agent")
+    loaded = {name.split(".")[0] for name in times} & DEFERRED_MODULES
+    assert not loaded, f"Başlangıçta yüklenmemesi gereken modüller yüklendi: {sorted(loaded)}"
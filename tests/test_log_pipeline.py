@@ -0,0 +1,80 @@
+import logging
+import time
+
+import pytest
+
+from log_pipeline import BatchedFileHandler, LogPipeline
+
+@pytest.fixture
+def pipeline_factory(tmp_path):
+    root = logging.getLogger()
+    level = root.level
+    pipelines = []
+
+    def create(**overrides):
+        config = {
+            "files": [
+                {"path": str(tmp_path / "debug.log"), "level": "DEBUG"},
+                {"path": str(tmp_path / "voice.log"), "level": "DEBUG", "loggers": ["test.voice"]}
+            ],
+            "console_level": "CRITICAL",
+            "levels": {"test": "DEBUG"},
+            "flush_interval": 60,
+            **overrides
+        }
+        pipeline = LogPipeline(config)
+        pipelines.append(pipeline)
+        return pipeline
+
+    yield create
+    for pipeline in pipelines:
+        pipeline.stop()
+    root.setLevel(level)
+
+def wait_for(predicate, timeout: float = 2.0) -> bool:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.01)
+    return predicate()
+
+def test_records_are_routed_by_logger_prefix(tmp_path, pipeline_factory):
+    pipeline = pipeline_factory()
+    pipeline.start()
+    logging.getLogger("test.voice.listener").info("ses kaydı")
+    logging.getLogger("test.editor").info("düzenleme kaydı")
+    pipeline.stop()
+
+    assert "ses kaydı" in (tmp_path / "voice.log").read_text(encoding="utf-8")
+    assert "düzenleme kaydı" not in (tmp_path / "voice.log").read_text(encoding="utf-8")
+    debug = (tmp_path / "debug.log").read_text(encoding="utf-8")
+    assert "ses kaydı" in debug and "düzenleme kaydı" in debug
+
+def test_errors_are_flushed_without_waiting_for_the_interval(tmp_path, pipeline_factory):
+    pipeline = pipeline_factory()
+    pipeline.start()
+    logging.getLogger("test.editor").info("bekleyen kayıt")
+    logging.getLogger("test.editor").error("acil kayıt")
+
+    debug = tmp_path / "debug.log"
+    assert wait_for(lambda: "acil kayıt" in debug.read_text(encoding="utf-8"))
+    assert "bekleyen kayıt" in debug.read_text(encoding="utf-8")
+
+def test_full_queue_drops_instead_of_blocking(pipeline_factory):
+    pipeline = pipeline_factory(queue_size=2)
+    record = logging.LogRecord("test", logging.INFO, __file__, 1, "kayıt", None, None)
+    for _ in range(5):
+        pipeline.queue_handler.handle(record)
+    assert pipeline.get_stats()["queued"] == 2
+    assert pipeline.get_stats()["dropped"] == 3
+
+def test_file_rolls_over_by_age(tmp_path):
+    handler = BatchedFileHandler(tmp_path / "a.log", max_bytes=0, backup_count=2, rotate_seconds=0.05)
+    record = logging.LogRecord("test", logging.INFO, __file__, 1, "kayıt", None, None)
+    handler.handle(record)
+    assert not handler.shouldRollover(record)
+    time.sleep(0.06)
+    handler.handle(record)
+    handler.close()
+    assert (tmp_path / "a.log.1").exists()
@@ -0,0 +1,75 @@
+from metric_series import RECORD, MetricPoint, MetricSeriesStore, SeriesFile, merge_points
+
+DAY = 86400
+
+def point(timestamp: float, cpu: float = 10.0, responses: float = 0.0, p90: float = 0.0) -> MetricPoint:
+    return MetricPoint(timestamp, 1.0, cpu, 50.0, 20.0, 1000.0, responses, 0.5 if responses else 0.0, p90, p90)
+
+def test_merge_weights_resources_by_samples_and_responses_by_count():
+    merged = merge_points(60.0, [
+        point(60, cpu=10, responses=1, p90=0.2)._replace(response_mean=1.0),
+        point(70, cpu=30, responses=3, p90=0.8)._replace(response_mean=2.0),
+    ])
+    assert merged.timestamp == 60.0 and merged.samples == 2
+    assert merged.cpu_percent == 20.0
+    assert merged.response_count == 4
+    assert merged.response_mean == 1.75
+    assert merged.response_p90 == 0.8
+
+def test_series_file_range_and_repair(tmp_path):
+    path = tmp_path / "raw.bin"
+    series = SeriesFile(path, retention=DAY)
+    for second in range(0, 100, 10):
+        series.append(point(second))
+    assert [p.timestamp for p in series.range(25, 55)] == [30, 40, 50]
+    assert series.last().timestamp == 90
+    series.close()
+
+    # Yarım yazılmış kayıt açılışta atılır
+    with open(path, "ab") as f:
+        f.write(b"\x00" * (RECORD.size // 2))
+    series = SeriesFile(path, retention=DAY)
+    assert len(series) == 10
+    series.append(point(100))
+    assert series.last().timestamp == 100
+    series.close()
+
+def test_series_file_compacts_past_retention(tmp_path):
+    series = SeriesFile(tmp_path / "raw.bin", retention=100)
+    for second in range(0, 140, 10):
+        series.append(point(second))
+    # Saklama %25 aşılınca eski kayıtlar atılır
+    assert series.range()[0].timestamp == 30
+    assert (tmp_path / "raw.bin").stat().st_size == len(series) * RECORD.size
+    series.close()
+
+def test_store_rolls_up_closed_buckets(tmp_path):
+    store = MetricSeriesStore(str(tmp_path), (("raw", 0, 1), ("minute", 60, 30), ("hour", 3600, 365)))
+    for second in range(0, 3 * 60, 20):
+        store.append(point(second, cpu=second / 20))
+    stats = store.get_stats()
+    assert stats["raw"]["records"] == 9
+    # Üçüncü dakika henüz açık
+    assert stats["minute"]["records"] == 2
+    assert stats["hour"]["records"] == 0
+
+    name, points = store.query(3600, tier="minute", now=180)
+    assert name == "minute"
+    assert [(p.timestamp, p.samples, p.cpu_percent) for p in points] == [(0, 3, 1.0), (60, 3, 4.0)]
+    assert store.select_tier(3600)[0] == "raw"
+    assert store.select_tier(7 * DAY)[0] == "minute"
+    store.close()
+
+def test_store_restores_open_buckets_on_restart(tmp_path):
+    tiers = (("raw", 0, 1), ("minute", 60, 30))
+    store = MetricSeriesStore(str(tmp_path), tiers)
+    for second in (0, 20, 40, 60, 80):
+        store.append(point(second))
+    store.close()
+
+    store = MetricSeriesStore(str(tmp_path), tiers)
+    store.append(point(120))
+    _, points = store.query(DAY, tier="minute", now=180)
+    # Yeniden başlatmadan önceki açık dakika kovası kaybolmaz
+    assert [(p.timestamp, p.samples) for p in points] == [(0, 3), (60, 2)]
+    store.close()
@@ -0,0 +1,73 @@
+import threading
+
+import pytest
+
+from metrics_collector import MetricsCollector, MetricsSnapshot
+
+@pytest.fixture
+def collector_factory(tmp_path):
+    collectors = []
+
+    def create(**config):
+        collector = MetricsCollector({"interval": 0.1, "disk_path": str(tmp_path), **config})
+        collectors.append(collector)
+        return collector
+
+    yield create
+    for collector in collectors:
+        collector.stop()
+
+def test_latest_samples_once_and_is_reused(collector_factory):
+    collector = collector_factory()
+    snapshot = collector.latest
+    assert isinstance(snapshot, MetricsSnapshot)
+    assert 0 <= snapshot.memory_percent <= 100
+    assert snapshot.process_rss > 0
+    # Yeni ölçüm yapılmadıkça aynı görüntü döner
+    assert collector.latest is snapshot
+    assert collector.sample() is collector.latest
+
+def test_interval_has_a_floor(collector_factory):
+    assert collector_factory(interval=0).interval == 0.1
+
+def test_subscribers_receive_each_sample(collector_factory):
+    collector = collector_factory()
+    received = []
+    done = threading.Event()
+
+    def failing(snapshot):
+        raise RuntimeError("abone hatası")
+
+    def listener(snapshot):
+        received.append(snapshot)
+        if len(received) >= 2:
+            done.set()
+
+    collector.subscribe(failing)
+    collector.subscribe(listener)
+    collector.subscribe(listener)
+    collector.start()
+    # Hatalı abone diğerlerini engellemez
+    assert done.wait(2)
+    collector.stop()
+
+    assert received[0].timestamp <= received[1].timestamp
+    assert collector.latest is received[-1]
+
+def test_unsubscribed_callback_is_not_called(collector_factory):
+    collector = collector_factory()
+    received = []
+    collector.subscribe(received.append)
+    collector.unsubscribe(received.append)
+    collector.unsubscribe(received.append)
+    collector.start()
+    threading.Event().wait(0.3)
+    collector.stop()
+    assert received == []
+
+def test_disabled_collector_does_not_start(collector_factory):
+    collector = collector_factory(enabled=False)
+    collector.start()
+    assert collector._thread is None
+    # İstek üzerine ölçüm yine çalışır
+    assert collector.latest.process_rss > 0
@@ -0,0 +1,75 @@
+import asyncio
+
+import pytest
+
+httpx = pytest.importorskip("httpx")
+from conftest import drop, reply, stall, status, stream
+
+MESSAGES = [{"role": "user", "content": "selam"}]
+
+async def collect(chunks):
+    return [chunk async for chunk in chunks]
+
+def test_sequential_requests_reuse_one_connection(ollama_stub, model_client):
+    for _ in range(3):
+        assert asyncio.run(model_client.chat("test", MESSAGES)) == "tamam"
+    assert len(ollama_stub.requests) == 3
+    assert len(ollama_stub.connections) == 1
+
+def test_finished_stream_returns_its_connection_to_the_pool(ollama_stub, model_client):
+    assert asyncio.run(collect(model_client.stream_chat("test", MESSAGES))) == ["tamam"]
+    assert asyncio.run(model_client.chat("test", MESSAGES)) == "tamam"
+    assert len(ollama_stub.connections) == 1
+
+def test_retries_transient_failures(ollama_stub, model_client):
+    ollama_stub.script.extend([status(503), drop(), reply("sonunda")])
+    assert asyncio.run(model_client.chat("test", MESSAGES)) == "sonunda"
+    assert len(ollama_stub.requests) == 3
+    assert model_client.get_stats()["retries"] == 2
+
+def test_read_timeout_is_not_retried(ollama_stub, model_client):
+    ollama_stub.script.append(stall(1.0))
+    with pytest.raises(httpx.ReadTimeout):
+        asyncio.run(model_client.chat("test", MESSAGES, timeout=0.2))
+    assert len(ollama_stub.requests) == 1
+    assert model_client.get_stats()["retries"] == 0
+
+def test_stream_retries_only_before_body(ollama_stub, model_client):
+    ollama_stub.script.extend([status(502), stream(["Bir", "İki"])])
+    assert asyncio.run(collect(model_client.stream_chat("test", MESSAGES))) == ["Bir", "İki"]
+    assert len(ollama_stub.requests) == 2
+
+def test_stream_cut_after_first_chunk_is_not_retried(ollama_stub, model_client):
+    ollama_stub.script.extend([stream(["Bir", "İki", "Üç"], drop_after=1), stream(["tekrar"])])
+    received = []
+
+    async def consume():
+        async for chunk in model_client.stream_chat("test", MESSAGES):
+            received.append(chunk)
+
+    with pytest.raises(httpx.TransportError):
+        asyncio.run(consume())
+    assert received == ["Bir"]
+    assert len(ollama_stub.requests) == 1
+
+def test_identical_concurrent_requests_are_coalesced(ollama_stub, model_client):
+    ollama_stub.script.append(reply("ortak", delay=0.2))
+
+    async def ask_twice():
+        return await asyncio.gather(model_client.chat("test", MESSAGES), model_client.chat("test", MESSAGES))
+
+    assert asyncio.run(ask_twice()) == ["ortak", "ortak"]
+    assert len(ollama_stub.requests) == 1
+    assert model_client.get_stats()["coalesced"] == 1
+
+def test_identical_concurrent_streams_are_coalesced(ollama_stub, model_client):
+    ollama_stub.script.append(stream(["Bir", "İki"], delay=0.1))
+
+    async def stream_twice():
+        return await asyncio.gather(
+            collect(model_client.stream_chat("test", MESSAGES)),
+            collect(model_client.stream_chat("test", MESSAGES))
+        )
+
+    assert asyncio.run(stream_twice()) == [["Bir", "İki"], ["Bir", "İki"]]
+    assert len(ollama_stub.requests) == 1
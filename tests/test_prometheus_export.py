@@ -0,0 +1,52 @@
+import math
+
+from prometheus_export import MetricFamily, format_metrics, summary_samples, write_textfile
+
+def test_text_format_has_help_type_and_labelled_samples():
+    families = [
+        MetricFamily("assistant_cpu_percent", "Sistem CPU kullanımı", "gauge", [("", {}, 12.5)]),
+        MetricFamily("assistant_command_seconds", "Komut süreleri", "summary", [
+            ("", {"intent": "review", "quantile": "0.5"}, 0.25),
+            ("_count", {"intent": "review"}, 4),
+        ]),
+    ]
+    assert format_metrics(families) == (
+        "# HELP assistant_cpu_percent Sistem CPU kullanımı\n"
+        "# TYPE assistant_cpu_percent gauge\n"
+        "assistant_cpu_percent 12.5\n"
+        "# HELP assistant_command_seconds Komut süreleri\n"
+        "# TYPE assistant_command_seconds summary\n"
+        'assistant_command_seconds{intent="review",quantile="0.5"} 0.25\n'
+        'assistant_command_seconds_count{intent="review"} 4.0\n'
+    )
+
+def test_label_values_and_help_are_escaped():
+    family = MetricFamily("m", 'satır\\sonu\n"x"', "gauge", [("", {"path": 'C:\\a\n"b"'}, 1)])
+    lines = format_metrics([family]).splitlines()
+    assert lines[0] == '# HELP m satır\\\\sonu\\n\\"x\\"'
+    assert lines[2] == 'm{path="C:\\\\a\\n\\"b\\""} 1.0'
+
+def test_special_values():
+    family = MetricFamily("m", "", "gauge", [
+        ("", {"v": "nan"}, math.nan), ("", {"v": "inf"}, math.inf), ("", {"v": "-inf"}, -math.inf),
+    ])
+    values = [line.rsplit(" ", 1)[1] for line in format_metrics([family]).splitlines()[2:]]
+    assert values == ["NaN", "+Inf", "-Inf"]
+
+def test_summary_samples_from_percentile_stats():
+    summary = {"count": 4, "mean": 0.5, "p50": 0.4, "p90": 0.9, "p99": None, "max": 1.2}
+    samples = summary_samples(summary, {"intent": "review"})
+    assert samples == [
+        ("", {"intent": "review", "quantile": "0.5"}, 0.4),
+        ("", {"intent": "review", "quantile": "0.9"}, 0.9),
+        ("_sum", {"intent": "review"}, 2.0),
+        ("_count", {"intent": "review"}, 4),
+    ]
+    assert summary_samples({}) == [("_sum", {}, 0.0), ("_count", {}, 0)]
+
+def test_write_textfile_replaces_atomically(tmp_path):
+    path = tmp_path / "textfile" / "assistant.prom"
+    write_textfile(path, [MetricFamily("m", "", "gauge", [("", {}, 1)])])
+    write_textfile(path, [MetricFamily("m", "", "gauge", [("", {}, 2)])])
+    assert path.read_text(encoding="utf-8").endswith("m 2.0\n")
+    assert [item.name for item in path.parent.iterdir()] == ["assistant.prom"]
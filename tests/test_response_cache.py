@@ -0,0 +1,60 @@
+import asyncio
+import json
+import os
+
+import pytest
+
+from conftest import PROJECT_ROOT, reply
+
+code_agent = pytest.importorskip("code_agent")
+from conversation_context import ConversationContext
+from response_cache import ResponseCache
+
+def load_default_config():
+    with open(os.path.join(PROJECT_ROOT, "config", "default.json"), encoding="utf-8") as f:
+        return json.load(f)
+
+def make_agent(model_client, tmp_path, streaming):
+    """Varsayılan config'deki model ve önbellek ayarlarıyla istek yolunu kuran ajan"""
+    ai_config = load_default_config()["ai"]
+    model = ai_config["default_model"]
+    agent = code_agent.CodeEditorAgent.__new__(code_agent.CodeEditorAgent)
+    agent.driver = None
+    cache = ResponseCache({**ai_config["response_cache"], "cache_dir": str(tmp_path / "cache")})
+    agent._subsystems = {"model_client": model_client, "response_cache": cache}
+    agent.tracer = code_agent.get_tracer()
+    agent.logger = code_agent.logging.getLogger("test")
+    agent.context = ConversationContext("sistem", budget=4096)
+    agent.model, agent.system_prompt = model, "sistem"
+    agent.temperature = ai_config["models"][model]["temperature"]
+    agent.context_window = ai_config["models"][model]["context_window"]
+    agent.max_tokens = 256
+    agent.streaming_enabled = streaming
+    agent.speak_streamed = False
+    return agent
+
+async def resolve(result):
+    if isinstance(result, str):
+        return result
+    if hasattr(result, "__anext__"):
+        return "".join([chunk async for chunk in result])
+    return await result
+
+@pytest.mark.parametrize("streaming", [False, True])
+def test_review_is_cached_with_default_config(ollama_stub, model_client, tmp_path, streaming):
+    agent = make_agent(model_client, tmp_path, streaming)
+    if not streaming:
+        ollama_stub.script.append(reply("inceleme"))
+    first = asyncio.run(resolve(agent._ask_model("Bu dosyayı kontrol et", cache=True)))
+
+    # İkinci istek modele gitmeden diskteki önbellekten döner
+    assert agent._ask_model("Bu dosyayı kontrol et", cache=True) == first
+    assert len(ollama_stub.requests) == 1
+    assert ollama_stub.requests[0]["options"]["temperature"] == 0
+    assert agent.response_cache.get_stats()["entries"] == 1
+
+def test_chat_keeps_model_temperature(ollama_stub, model_client, tmp_path):
+    agent = make_agent(model_client, tmp_path, streaming=False)
+    asyncio.run(resolve(agent._ask_model("merhaba")))
+    assert ollama_stub.requests[0]["options"]["temperature"] == agent.temperature
+    assert agent.response_cache.get_stats()["entries"] == 0
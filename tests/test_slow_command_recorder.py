@@ -0,0 +1,81 @@
+import itertools
+from types import SimpleNamespace
+
+import pytest
+
+import slow_command_recorder as recorder_module
+from slow_command_recorder import SlowCommandRecorder, flatten_spans
+from tracer import Span
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Her raporun ayrı, artan zaman damgası alması için sahte saat"""
+    ticks = itertools.count(1_000_000)
+    monkeypatch.setattr(recorder_module, "time", SimpleNamespace(time=lambda: float(next(ticks))))
+
+def make_recorder(tmp_path, **config):
+    return SlowCommandRecorder({"budget": 1.0, "directory": str(tmp_path / "slow"), **config})
+
+def slow_trace(command: str, duration: float = 2.0, intent: str = "review") -> Span:
+    trace = Span("command", 1, attributes={"command": command})
+    trace.set_intent(intent)
+    llm = trace.add_child("llm", duration * 0.8)
+    llm.add_child("first_token", duration * 0.1)
+    trace.duration = duration
+    return trace
+
+def record_all(recorder, *commands):
+    for command in commands:
+        recorder.record(slow_trace(command), {"after_ms": 1000, "threads": []})
+
+def test_flatten_spans_builds_paths():
+    rows = flatten_spans(slow_trace("a").to_dict())
+    assert [row["span"] for row in rows] == ["llm", "llm/first_token"]
+
+def test_slot_ring_wraps_and_overwrites_oldest(tmp_path, clock):
+    recorder = make_recorder(tmp_path, capacity=3)
+    record_all(recorder, "a", "b", "c", "d", "e")
+
+    assert sorted(path.name for path in (tmp_path / "slow").iterdir()) == ["slow-000.json", "slow-001.json", "slow-002.json"]
+    assert [(report["slot"], report["command"]) for report in recorder.reports] == [(2, "c"), (0, "d"), (1, "e")]
+    assert recorder._next_slot == 2
+
+def test_load_continues_after_newest_report(tmp_path, clock):
+    record_all(make_recorder(tmp_path, capacity=3), "a", "b", "c", "d")
+
+    # Dosya adı sırası (000 = "d") zaman sırasından farklı; sıradaki yuva en yeninin ardıdır
+    reopened = make_recorder(tmp_path, capacity=3)
+    assert [report["command"] for report in reopened.reports] == ["b", "c", "d"]
+    assert reopened._next_slot == 1
+
+    record_all(reopened, "e")
+    assert [report["command"] for report in reopened.reports] == ["c", "d", "e"]
+    assert reopened.query(order="time")[0]["command"] == "e"
+
+def test_load_skips_slots_beyond_smaller_capacity(tmp_path, clock):
+    record_all(make_recorder(tmp_path, capacity=4), "a", "b", "c", "d")
+    reopened = make_recorder(tmp_path, capacity=2)
+    assert [report["command"] for report in reopened.reports] == ["a", "b"]
+    assert reopened._next_slot == 0
+
+def test_load_ignores_corrupt_slot(tmp_path, clock):
+    record_all(make_recorder(tmp_path), "a", "b")
+    (tmp_path / "slow" / "slow-000.json").write_text("{", encoding="utf-8")
+    reopened = make_recorder(tmp_path)
+    assert [report["command"] for report in reopened.reports] == ["b"]
+    assert reopened._next_slot == 2
+
+def test_query_and_summary(tmp_path, clock):
+    recorder = make_recorder(tmp_path)
+    recorder.record(slow_trace("yavaş", 4.0), {"after_ms": 1000, "threads": []})
+    recorder.record(slow_trace("orta", 2.0), {"after_ms": 1000, "threads": []})
+    recorder.record(slow_trace("ara", 3.0, intent="web_search"), {"after_ms": 1000, "threads": []})
+
+    assert [report["command"] for report in recorder.query()] == ["yavaş", "ara", "orta"]
+    assert [report["command"] for report in recorder.query(intent="review")] == ["yavaş", "orta"]
+    summary = recorder.summary_by_intent()
+    assert summary["review"] == {"count": 2, "max_ms": 4000.0, "mean_ms": 3000.0}
+    assert "en uzun: llm 3200.0 ms" in recorder.format_report().splitlines()[1]
+
+    recorder.clear()
+    assert recorder.reports == [] and not list((tmp_path / "slow").glob("slow-*.json"))
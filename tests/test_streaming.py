@@ -0,0 +1,70 @@
+import asyncio
+
+import pytest
+
+from conftest import stream
+from model_client import SentenceBuffer
+
+code_agent = pytest.importorskip("code_agent")
+from conversation_context import ConversationContext
+
+CHUNKS = ["Merhaba", " dünya. ", "Bugün nasıl", "sın? Kod", " hazır"]
+
+def make_agent(model_client):
+    """Yalnızca akışlı yanıt yolunu kuran ajan (seslendirme kuyruğa yazılır, çalınmaz)"""
+    agent = code_agent.CodeEditorAgent.__new__(code_agent.CodeEditorAgent)
+    agent.driver = None
+    agent._subsystems = {"model_client": model_client}
+    agent.tracer = code_agent.get_tracer()
+    agent.logger = code_agent.logging.getLogger("test")
+    agent.context = ConversationContext("sistem", budget=1000)
+    agent.model, agent.temperature, agent.max_tokens = "test", 0.0, 100
+    agent.context_window = 1000
+    agent.speak_streamed = True
+    agent.spoken = []
+    agent._speak_async = agent.spoken.append
+    return agent
+
+async def collect(chunks):
+    return [chunk async for chunk in chunks]
+
+def test_stream_chat_yields_chunks_in_order(ollama_stub, model_client):
+    ollama_stub.script.append(stream(CHUNKS, delay=0.01))
+    messages = [{"role": "user", "content": "selam"}]
+    assert asyncio.run(collect(model_client.stream_chat("test", messages))) == CHUNKS
+    assert ollama_stub.requests[0]["stream"] is True
+
+def test_sentence_buffer_splits_streamed_chunks():
+    buffer = SentenceBuffer()
+    sentences = [sentence for chunk in CHUNKS for sentence in buffer.feed(chunk)]
+    assert sentences == ["Merhaba dünya.", "Bugün nasılsın?"]
+    assert buffer.flush() == "Kod hazır"
+
+def test_stream_response_speaks_sentences_and_stores_content(ollama_stub, model_client):
+    ollama_stub.script.append(stream(CHUNKS, delay=0.01))
+    agent = make_agent(model_client)
+
+    assert asyncio.run(collect(agent.stream_response("selam"))) == CHUNKS
+    assert agent.spoken == ["Merhaba dünya.", "Bugün nasılsın?", "Kod hazır"]
+    # Bağlam bütçesinin hesaplandığı pencere modele de bildirilir
+    assert ollama_stub.requests[0]["options"]["num_ctx"] == 1000
+    assert agent.context.build_messages("sonraki")[-3:-1] == [
+        {"role": "user", "content": "selam"},
+        {"role": "assistant", "content": "".join(CHUNKS)}
+    ]
+
+def test_response_thread_emits_chunks_and_final_text(ollama_stub, model_client):
+    gui = pytest.importorskip("gui")
+    ollama_stub.script.append(stream(CHUNKS, delay=0.01))
+    agent = make_agent(model_client)
+    agent.process_command = lambda command: agent.stream_response(command)
+
+    thread = gui.AIResponseThread(agent, "selam")
+    received, finished = [], []
+    thread.chunk_ready.connect(received.append)
+    thread.stream_finished.connect(finished.append)
+    thread.run()
+
+    assert received == CHUNKS
+    assert finished == ["".join(CHUNKS)]
+    assert agent.context.build_messages("sonraki")[-2]["content"] == "".join(CHUNKS)